@@ -0,0 +1,11 @@
+from .tool_cache import *
+from .singleflight import *
+from .validation import *
+from .tool_runner import *
+from .tools import *
+from .llm import *
+from .fakes import *
+from .turn import *
+from .history import *
+from .http_llm import *
+from .router import *
@@ -0,0 +1,107 @@
+# casanova_core/fakes.py
+# Local stand-ins for the chat model, so Casanova turns can run offline.
+
+import json
+import re
+import time
+from typing import Callable, Iterator
+
+from .llm import AssistantMessage, ChatDelta, FunctionCall, LLMClient, ToolCall, ToolCallDelta
+from .router import IntentRouter
+
+__all__ = ["FakeStreamingClient", "tool_call_message", "scripted_reply"]
+
+
+def tool_call_message(*calls: tuple[str, dict], prefix: str = "call") -> AssistantMessage:
+    """
+    tool_call_message(("track_order_status", {"order_id": "ORD-1"}), ...) ->
+    an assistant message asking for those tool calls.
+    """
+    return AssistantMessage(
+        tool_calls=[
+            ToolCall(id=f"{prefix}_{i}", function=FunctionCall(name, json.dumps(args)))
+            for i, (name, args) in enumerate(calls)
+        ]
+    )
+
+
+_rules = IntentRouter()
+
+
+def scripted_reply(model: str, messages: list[dict]) -> AssistantMessage | str:
+    """
+    A deterministic stand-in for the model, usable as a ``FakeStreamingClient``
+    script: asks for the tool the keyword rules pick for the user's message,
+    and answers from the tool results once they are in.
+    """
+    last = messages[-1]
+    if last["role"] == "tool":
+        results = [m["content"] for m in messages if m["role"] == "tool"]
+        return "Here is what I found: " + " ".join(results)
+    route = _rules.route(last.get("content") or "")
+    if route is None:
+        return "Could you share your order id (for example ORD-12345678)?"
+    return tool_call_message((route.tool_name, route.arguments))
+
+
+class FakeStreamingClient(LLMClient):
+    """
+    Replays scripted assistant messages, one per request.
+
+    ``script`` is a list of messages (plain strings are text answers) or a
+    function ``(model, messages) -> message``. Streaming splits text into
+    word tokens and tool-call arguments into ``argument_chunk``-sized
+    fragments, sleeping ``token_delay`` seconds between deltas; ``latency``
+    is slept once per request, before the reply (time to first token).
+    Every request is kept in ``requests`` for assertions, unless
+    ``keep_requests`` is False (long load runs).
+    """
+
+    def __init__(
+        self,
+        script: list | Callable[[str, list[dict]], AssistantMessage | str],
+        token_delay: float = 0.0,
+        argument_chunk: int = 8,
+        latency: float = 0.0,
+        keep_requests: bool = True,
+    ):
+        self.script = script
+        self.token_delay = token_delay
+        self.argument_chunk = argument_chunk
+        self.latency = latency
+        self.keep_requests = keep_requests
+        self.requests: list[dict] = []
+        self._next = 0
+
+    def _respond(self, model, messages, tools, tool_choice) -> AssistantMessage:
+        if self.keep_requests:
+            self.requests.append(
+                {"model": model, "messages": list(messages), "tools": tools, "tool_choice": tool_choice}
+            )
+        if self.latency:
+            time.sleep(self.latency)
+        if callable(self.script):
+            reply = self.script(model, messages)
+        else:
+            reply = self.script[self._next]
+            self._next += 1
+        return AssistantMessage(content=reply) if isinstance(reply, str) else reply
+
+    def complete(self, model, messages, tools=None, tool_choice=None) -> AssistantMessage:
+        return self._respond(model, messages, tools, tool_choice)
+
+    def stream(self, model, messages, tools=None, tool_choice=None) -> Iterator[ChatDelta]:
+        message = self._respond(model, messages, tools, tool_choice)
+        for i, tc in enumerate(message.tool_calls):
+            yield self._pause(ChatDelta(tool_calls=[ToolCallDelta(index=i, id=tc.id, name=tc.function.name)]))
+            args = tc.function.arguments
+            for start in range(0, len(args), self.argument_chunk):
+                fragment = args[start:start + self.argument_chunk]
+                yield self._pause(ChatDelta(tool_calls=[ToolCallDelta(index=i, arguments=fragment)]))
+        for token in re.findall(r"\S+\s*|\s+", message.content or ""):
+            yield self._pause(ChatDelta(content=token))
+
+    def _pause(self, delta: ChatDelta) -> ChatDelta:
+        if self.token_delay:
+            time.sleep(self.token_delay)
+        return delta
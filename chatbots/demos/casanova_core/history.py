@@ -0,0 +1,164 @@
+# casanova_core/history.py
+# Token-budgeted conversation history: recent turns verbatim, older ones folded
+# into a compact structured memory.
+
+import re
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .router import ORDER_ID_RE
+from .tools import tool_intents
+
+__all__ = ["approx_token_count", "ConversationMemory", "HistoryManager"]
+
+# Per-message framing the chat format adds on top of the content.
+MESSAGE_OVERHEAD_TOKENS = 4
+# Most recent ids / intents / customer messages the memory keeps.
+MEMORY_ITEMS = 10
+EARLIER_REQUESTS = 3
+
+_TOKEN_RE = re.compile(r"\w{1,4}|[^\w\s]")
+_TICKET_ID_RE = re.compile(r"\bTICKET-\d+\b", re.IGNORECASE)
+
+
+def approx_token_count(text: str) -> int:
+    """Rough BPE-like count: words in chunks of up to 4 characters, plus punctuation."""
+    return len(_TOKEN_RE.findall(text))
+
+
+def _default_counter() -> Callable[[str], int]:
+    try:
+        import tiktoken
+    except ImportError:
+        return approx_token_count
+    encoding = tiktoken.get_encoding("o200k_base")
+    return lambda text: len(encoding.encode(text))
+
+
+def _remember(values: deque, value: str) -> None:
+    # Most recent last; a value seen again moves to the end.
+    if value in values:
+        values.remove(value)
+    values.append(value)
+
+
+@dataclass
+class ConversationMemory:
+    """What is worth remembering from turns that are no longer sent verbatim."""
+    order_ids: deque = field(default_factory=lambda: deque(maxlen=MEMORY_ITEMS))
+    ticket_ids: deque = field(default_factory=lambda: deque(maxlen=MEMORY_ITEMS))
+    resolved: deque = field(default_factory=lambda: deque(maxlen=MEMORY_ITEMS))
+    earlier_requests: deque = field(default_factory=lambda: deque(maxlen=EARLIER_REQUESTS))
+
+    def fold(self, message: dict) -> None:
+        content = message.get("content") or ""
+        for order_id in ORDER_ID_RE.findall(content):
+            _remember(self.order_ids, order_id.upper())
+        for ticket_id in _TICKET_ID_RE.findall(content):
+            _remember(self.ticket_ids, ticket_id.upper())
+        if message.get("role") == "user" and content:
+            self.earlier_requests.append(content if len(content) <= 80 else content[:77] + "...")
+
+    def record_tool_calls(self, tool_calls: list) -> None:
+        for tool_call in tool_calls:
+            intent = tool_intents.get(tool_call.function.name, tool_call.function.name)
+            order_id = ORDER_ID_RE.search(tool_call.function.arguments or "")
+            _remember(self.resolved, f"{intent} {order_id.group(0).upper()}" if order_id else intent)
+
+    def shrink(self) -> bool:
+        """Forgets the oldest item of the longest list; False when there is nothing left."""
+        longest = max(
+            (self.earlier_requests, self.resolved, self.order_ids, self.ticket_ids), key=len
+        )
+        if not longest:
+            return False
+        longest.popleft()
+        return True
+
+    def render(self) -> str | None:
+        parts = []
+        if self.order_ids:
+            parts.append("order ids mentioned: " + ", ".join(self.order_ids))
+        if self.ticket_ids:
+            parts.append("tickets opened: " + ", ".join(self.ticket_ids))
+        if self.resolved:
+            parts.append("intents already handled: " + "; ".join(self.resolved))
+        if self.earlier_requests:
+            parts.append("earlier customer messages: " + " | ".join(self.earlier_requests))
+        if not parts:
+            return None
+        return "Summary of the earlier conversation:\n- " + "\n- ".join(parts)
+
+
+class HistoryManager:
+    """
+    Keeps the history sent to the model within ``budget_tokens``.
+
+    Every message is counted once, when it is appended, and a running total
+    is kept. When the total goes over the budget, the oldest messages are
+    folded into ``ConversationMemory`` until it is back under
+    ``compact_to`` of the budget (so compaction does not run on every turn).
+    The memory keeps only the most recent ids and intents, and is trimmed
+    further if its summary would take more than half the budget.
+    The last ``keep_recent`` messages are always sent verbatim. The system
+    prompt is not part of this history; ``compose_messages`` adds it.
+    """
+
+    def __init__(
+        self,
+        budget_tokens: int = 1500,
+        keep_recent: int = 6,
+        compact_to: float = 0.75,
+        count_tokens: Callable[[str], int] | None = None,
+    ):
+        self.budget_tokens = budget_tokens
+        self.keep_recent = keep_recent
+        self.compact_to = compact_to
+        self.count_tokens = count_tokens or _default_counter()
+        self.memory = ConversationMemory()
+        self._recent: deque[tuple[dict, int]] = deque()
+        self._recent_tokens = 0
+        self._summary: dict | None = None
+        self._summary_tokens = 0
+        self.folded = 0
+
+    @property
+    def tokens(self) -> int:
+        return self._recent_tokens + self._summary_tokens
+
+    def _count(self, message: dict) -> int:
+        return self.count_tokens(message.get("content") or "") + MESSAGE_OVERHEAD_TOKENS
+
+    def append(self, message: dict) -> None:
+        tokens = self._count(message)
+        self._recent.append((message, tokens))
+        self._recent_tokens += tokens
+        if self.tokens > self.budget_tokens:
+            self._compact()
+
+    def record_tool_calls(self, tool_calls: list) -> None:
+        self.memory.record_tool_calls(tool_calls)
+
+    def _compact(self) -> None:
+        target = self.budget_tokens * self.compact_to
+        while len(self._recent) > self.keep_recent and self._recent_tokens + self._summary_tokens > target:
+            message, tokens = self._recent.popleft()
+            self._recent_tokens -= tokens
+            self.memory.fold(message)
+            self.folded += 1
+            self._refresh_summary()
+
+    def _refresh_summary(self) -> None:
+        while True:
+            text = self.memory.render()
+            self._summary = {"role": "system", "content": text} if text else None
+            self._summary_tokens = self._count(self._summary) if self._summary else 0
+            # The summary never takes more than half the budget.
+            if self._summary_tokens <= self.budget_tokens / 2 or not self.memory.shrink():
+                break
+
+    def messages(self) -> list[dict]:
+        """History to send with the next turn: the summary (if any), then recent messages."""
+        summary = [self._summary] if self._summary else []
+        return summary + [message for message, _ in self._recent]
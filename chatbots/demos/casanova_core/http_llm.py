@@ -0,0 +1,200 @@
+# casanova_core/http_llm.py
+# Chat-completions client over pooled keep-alive HTTP connections, with a
+# concurrency limit and retries with jittered exponential backoff.
+# Standard library only; talks to any server with the OpenAI wire format
+# (api.openai.com, a proxy, or casanova_core.stub_server).
+
+import http.client
+import json
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from typing import Callable, Iterator
+from urllib.parse import urlsplit
+
+from .llm import AssistantMessage, ChatDelta, FunctionCall, LLMClient, ToolCall, ToolCallDelta, _request
+
+__all__ = ["LLMBackendError", "HTTPChatClient"]
+
+RETRY_STATUSES = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMBackendError(Exception):
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+class HTTPChatClient(LLMClient):
+    """
+    ``LLMClient`` speaking ``POST {base_url}/chat/completions`` directly.
+
+    - at most ``max_connections`` requests are in flight at once; further
+      callers wait for a free slot
+    - idle connections are kept alive and reused, so a turn's two calls (and
+      the next turn's) skip the TCP/TLS handshake
+    - connection errors and retryable statuses (429, 5xx, ...) are retried up
+      to ``max_retries`` times, sleeping a random ("full jitter") delay of up
+      to ``backoff_base * 2**attempt`` seconds, capped at ``backoff_max`` and
+      never shorter than the server's ``Retry-After``
+    - a streamed response is only retried before its first delta is yielded
+    """
+
+    def __init__(
+        self,
+        base_url: str = "https://api.openai.com/v1",
+        api_key: str | None = None,
+        max_connections: int = 8,
+        timeout: float = 60.0,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        rng: random.Random | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        parts = urlsplit(base_url)
+        self._connection_class = (
+            http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        )
+        self._host = parts.netloc
+        self._path = parts.path.rstrip("/") + "/chat/completions"
+        self._headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        if api_key:
+            self._headers["Authorization"] = f"Bearer {api_key}"
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.rng = rng or random.Random()
+        self.sleep = sleep
+        self.stats: Counter = Counter()
+        self._slots = threading.BoundedSemaphore(max_connections)
+        self._idle: queue.LifoQueue = queue.LifoQueue()
+        self._lock = threading.Lock()
+
+    # -------------------------------------------------------------------
+    # Connection pool
+    # -------------------------------------------------------------------
+
+    def _count(self, name: str) -> None:
+        with self._lock:
+            self.stats[name] += 1
+
+    def _checkout(self) -> http.client.HTTPConnection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            self._count("connections_opened")
+            return self._connection_class(self._host, timeout=self.timeout)
+
+    def _checkin(self, conn: http.client.HTTPConnection, response: http.client.HTTPResponse) -> None:
+        if response.will_close:
+            conn.close()
+        else:
+            self._idle.put(conn)
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+    # -------------------------------------------------------------------
+    # Requests with retries
+    # -------------------------------------------------------------------
+
+    def _backoff(self, attempt: int, retry_after: str | None) -> float:
+        delay = self.rng.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        try:
+            return max(delay, float(retry_after)) if retry_after else delay
+        except ValueError:
+            return delay
+
+    def _send(self, payload: dict):
+        """
+        Sends ``payload`` (holding a slot) until it gets a 200, and returns
+        ``(connection, response)``. The caller releases the slot.
+        """
+        body = json.dumps(payload).encode("utf-8")
+        attempt = 0
+        while True:
+            self._count("requests")
+            conn = self._checkout()
+            retry_after, error = None, None
+            try:
+                conn.request("POST", self._path, body=body, headers=self._headers)
+                response = conn.getresponse()
+            except (OSError, http.client.HTTPException) as ex:
+                conn.close()
+                error = LLMBackendError(f"{type(ex).__name__}: {ex}")
+            else:
+                if response.status == 200:
+                    return conn, response
+                detail = response.read().decode("utf-8", "replace")
+                self._checkin(conn, response)
+                error = LLMBackendError(f"HTTP {response.status}: {detail[:200]}", response.status)
+                if response.status not in RETRY_STATUSES:
+                    raise error
+                retry_after = response.getheader("Retry-After")
+
+            if attempt >= self.max_retries:
+                raise error
+            self._count("retries")
+            self.sleep(self._backoff(attempt, retry_after))
+            attempt += 1
+
+    def complete(self, model, messages, tools=None, tool_choice=None) -> AssistantMessage:
+        with self._slots:
+            conn, response = self._send(_request(model, messages, tools, tool_choice))
+            try:
+                data = json.loads(response.read())
+            finally:
+                self._checkin(conn, response)
+        message = data["choices"][0]["message"]
+        return AssistantMessage(
+            content=message.get("content"),
+            tool_calls=[
+                ToolCall(id=tc["id"], function=FunctionCall(tc["function"]["name"], tc["function"]["arguments"]))
+                for tc in message.get("tool_calls") or []
+            ],
+        )
+
+    def stream(self, model, messages, tools=None, tool_choice=None) -> Iterator[ChatDelta]:
+        payload = dict(_request(model, messages, tools, tool_choice), stream=True)
+        with self._slots:
+            conn, response = self._send(payload)
+            finished = False
+            try:
+                for line in response:
+                    line = line.strip()
+                    if not line.startswith(b"data:"):
+                        continue
+                    data = line[len(b"data:"):].strip()
+                    if data == b"[DONE]":
+                        break
+                    chunk = json.loads(data)
+                    if not chunk.get("choices"):
+                        continue
+                    delta = chunk["choices"][0].get("delta") or {}
+                    yield ChatDelta(
+                        content=delta.get("content"),
+                        tool_calls=[
+                            ToolCallDelta(
+                                index=tc["index"],
+                                id=tc.get("id"),
+                                name=(tc.get("function") or {}).get("name"),
+                                arguments=(tc.get("function") or {}).get("arguments"),
+                            )
+                            for tc in delta.get("tool_calls") or []
+                        ],
+                    )
+                response.read()  # drain the rest so the connection can be reused
+                finished = True
+            finally:
+                if finished:
+                    self._checkin(conn, response)
+                else:
+                    conn.close()  # abandoned mid-stream: the connection is in an unknown state
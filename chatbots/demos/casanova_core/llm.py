@@ -0,0 +1,204 @@
+# casanova_core/llm.py
+# Pluggable LLM client interface for Casanova, plus the OpenAI-backed implementation.
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Iterator
+
+__all__ = [
+    "FunctionCall",
+    "ToolCall",
+    "AssistantMessage",
+    "ToolCallDelta",
+    "ChatDelta",
+    "StreamAssembler",
+    "LLMClient",
+    "OpenAIChatClient",
+]
+
+
+# -------------------------------------------------------------------
+# Messages (same attribute names as the OpenAI SDK objects)
+# -------------------------------------------------------------------
+
+@dataclass
+class FunctionCall:
+    name: str
+    arguments: str
+
+
+@dataclass
+class ToolCall:
+    id: str
+    function: FunctionCall
+    type: str = "function"
+
+
+@dataclass
+class AssistantMessage:
+    content: str | None = None
+    tool_calls: list[ToolCall] = field(default_factory=list)
+
+    def to_message(self) -> dict:
+        """The message to append to the conversation before the tool results."""
+        message: dict = {"role": "assistant", "content": self.content}
+        if self.tool_calls:
+            message["tool_calls"] = [
+                {
+                    "id": tc.id,
+                    "type": tc.type,
+                    "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+                }
+                for tc in self.tool_calls
+            ]
+        return message
+
+
+@dataclass
+class ToolCallDelta:
+    """A fragment of one tool call; ``index`` says which one it belongs to."""
+    index: int
+    id: str | None = None
+    name: str | None = None
+    arguments: str | None = None
+
+
+@dataclass
+class ChatDelta:
+    content: str | None = None
+    tool_calls: list[ToolCallDelta] = field(default_factory=list)
+
+
+class StreamAssembler:
+    """
+    Builds the complete assistant message from streamed deltas as they arrive.
+    Text fragments are handed back from ``feed`` so they can be shown right away;
+    tool-call ids, names and argument fragments are accumulated per index.
+    """
+
+    def __init__(self):
+        self._content: list[str] = []
+        self._calls: dict[int, dict] = {}
+
+    def feed(self, delta: ChatDelta) -> str:
+        for part in delta.tool_calls:
+            call = self._calls.setdefault(part.index, {"id": "", "name": "", "arguments": []})
+            if part.id:
+                call["id"] = part.id
+            if part.name:
+                call["name"] += part.name
+            if part.arguments:
+                call["arguments"].append(part.arguments)
+        if delta.content:
+            self._content.append(delta.content)
+            return delta.content
+        return ""
+
+    def message(self) -> AssistantMessage:
+        return AssistantMessage(
+            content="".join(self._content) or None,
+            tool_calls=[
+                ToolCall(id=call["id"], function=FunctionCall(call["name"], "".join(call["arguments"])))
+                for _, call in sorted(self._calls.items())
+            ],
+        )
+
+
+# -------------------------------------------------------------------
+# Client interface
+# -------------------------------------------------------------------
+
+class LLMClient:
+    """
+    What Casanova needs from a chat model. ``complete`` returns the whole
+    assistant message; ``stream`` yields it as deltas; ``acomplete`` is the
+    awaitable ``complete`` used by ``arun_turn``.
+    """
+
+    def complete(
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        tool_choice: str | None = None,
+    ) -> AssistantMessage:
+        raise NotImplementedError
+
+    async def acomplete(
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        tool_choice: str | None = None,
+    ) -> AssistantMessage:
+        # Default for blocking clients: ``complete`` on a worker thread.
+        return await asyncio.to_thread(self.complete, model, messages, tools, tool_choice)
+
+    def stream(
+        self,
+        model: str,
+        messages: list[dict],
+        tools: list[dict] | None = None,
+        tool_choice: str | None = None,
+    ) -> Iterator[ChatDelta]:
+        # Default for clients that cannot stream: one delta with everything.
+        message = self.complete(model, messages, tools, tool_choice)
+        yield ChatDelta(
+            content=message.content,
+            tool_calls=[
+                ToolCallDelta(index=i, id=tc.id, name=tc.function.name, arguments=tc.function.arguments)
+                for i, tc in enumerate(message.tool_calls)
+            ],
+        )
+
+
+def _request(model, messages, tools, tool_choice) -> dict:
+    kwargs: dict = {"model": model, "messages": messages}
+    if tools:
+        kwargs["tools"] = tools
+        kwargs["tool_choice"] = tool_choice or "auto"
+    return kwargs
+
+
+class OpenAIChatClient(LLMClient):
+    """``LLMClient`` on top of ``openai.OpenAI().chat.completions``."""
+
+    def __init__(self, client=None, **client_kwargs):
+        if client is None:
+            # Imported lazily: openai is a heavy import and only needed here.
+            from openai import OpenAI
+
+            client = OpenAI(**client_kwargs)
+        self.client = client
+
+    def complete(self, model, messages, tools=None, tool_choice=None) -> AssistantMessage:
+        response = self.client.chat.completions.create(**_request(model, messages, tools, tool_choice))
+        message = response.choices[0].message
+        return AssistantMessage(
+            content=message.content,
+            tool_calls=[
+                ToolCall(id=tc.id, function=FunctionCall(tc.function.name, tc.function.arguments))
+                for tc in message.tool_calls or []
+            ],
+        )
+
+    def stream(self, model, messages, tools=None, tool_choice=None) -> Iterator[ChatDelta]:
+        chunks = self.client.chat.completions.create(
+            stream=True, **_request(model, messages, tools, tool_choice)
+        )
+        for chunk in chunks:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            yield ChatDelta(
+                content=delta.content,
+                tool_calls=[
+                    ToolCallDelta(
+                        index=tc.index,
+                        id=tc.id,
+                        name=tc.function.name if tc.function else None,
+                        arguments=tc.function.arguments if tc.function else None,
+                    )
+                    for tc in delta.tool_calls or []
+                ],
+            )
@@ -0,0 +1,286 @@
+# casanova_core/loadtest.py
+# Load generator: how many concurrent Casanova conversations one process sustains.
+#
+#   python -m casanova_core.loadtest --levels 1,4,16,64 --latency 0.2 --pattern parallel
+#
+# Each virtual user replays scripted multi-turn conversations (track, ETA,
+# report issue) through ``run_turn``, with its own HistoryManager, against a
+# local fake model that sleeps ``latency`` seconds per request and asks for
+# tools according to a tool-call pattern. Concurrency is ramped up level by
+# level; every level reports throughput, turn latency percentiles and how
+# large the session histories grew.
+
+import argparse
+import itertools
+import json
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .fakes import FakeStreamingClient, scripted_reply, tool_call_message
+from .history import HistoryManager
+from .llm import AssistantMessage
+from .router import IntentRouter, LocalIntentClassifier
+from .tool_cache import ToolResultCache
+from .tool_runner import ToolRunner
+from .tools import tool_cache_ttls, tool_name_to_python_fn, tool_timeouts, tool_validators
+from .turn import run_turn
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+__all__ = ["CONVERSATIONS", "TOOL_CALL_PATTERNS", "pattern_script", "LevelResult", "LoadReport", "run_load"]
+
+
+# -------------------------------------------------------------------
+# Workload
+# -------------------------------------------------------------------
+
+# User messages per conversation; {order_id} is unique per conversation so
+# the tool cache does not turn the whole run into cache hits.
+CONVERSATIONS = {
+    "track": [
+        "Hi, I ordered something last week",
+        "Where is my order {order_id}?",
+        "Is {order_id} with the courier yet?",
+    ],
+    "eta": [
+        "When will {order_id} arrive?",
+        "What is the expected delivery date of {order_id}?",
+        "Thanks!",
+    ],
+    "report_issue": [
+        "My parcel {order_id} is late",
+        "The tracking of {order_id} is not updating",
+        "Can you tell me where {order_id} is now?",
+    ],
+}
+
+TOOL_CALL_PATTERNS = {
+    "single": "one tool call per turn, the one the keyword rules pick",
+    "parallel": "the picked tool plus get_order_eta (or track_order_status) for the same order",
+    "none": "never asks for tools; every turn is a single model call",
+}
+
+
+def pattern_script(pattern: str) -> Callable[[str, list[dict]], AssistantMessage | str]:
+    """A ``FakeStreamingClient`` script that asks for tools according to ``pattern``."""
+    if pattern not in TOOL_CALL_PATTERNS:
+        raise ValueError(f"unknown tool-call pattern {pattern!r}; expected one of {sorted(TOOL_CALL_PATTERNS)}")
+
+    def script(model: str, messages: list[dict]) -> AssistantMessage | str:
+        reply = scripted_reply(model, messages)
+        if isinstance(reply, str):
+            return reply
+        if pattern == "none":
+            return "I can't look that up right now, but it is usually delivered within a few days."
+        if pattern == "parallel":
+            first = reply.tool_calls[0].function
+            order_id = json.loads(first.arguments)["order_id"]
+            extra = "get_order_eta" if first.name != "get_order_eta" else "track_order_status"
+            return tool_call_message((first.name, json.loads(first.arguments)), (extra, {"order_id": order_id}))
+        return reply
+
+    return script
+
+
+# -------------------------------------------------------------------
+# Results
+# -------------------------------------------------------------------
+
+def _peak_rss_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+
+@dataclass
+class LevelResult:
+    concurrency: int
+    elapsed: float
+    latencies: list[float] = field(default_factory=list)
+    errors: int = 0
+    # history tokens after each turn, one list per conversation
+    history_tokens: list[list[int]] = field(default_factory=list)
+    history_bytes: list[int] = field(default_factory=list)
+    peak_rss_mb: float | None = None
+
+    @property
+    def turns(self) -> int:
+        return len(self.latencies) + self.errors
+
+    @property
+    def throughput(self) -> float:
+        return len(self.latencies) / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: int) -> float:
+        if not self.latencies:
+            return 0.0
+        if len(self.latencies) == 1:
+            return self.latencies[0]
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[q - 1]
+
+    def history_growth(self) -> list[float]:
+        """Mean history tokens after turn 1, 2, ... across conversations."""
+        return [statistics.mean(column) for column in itertools.zip_longest(*self.history_tokens, fillvalue=0)]
+
+    def row(self) -> str:
+        growth = self.history_growth()
+        history = f"{growth[0]:.0f}->{growth[-1]:.0f} tok" if growth else "n/a"
+        kb = statistics.mean(self.history_bytes) / 1024 if self.history_bytes else 0.0
+        rss = f"{self.peak_rss_mb:.0f}MB" if self.peak_rss_mb is not None else "n/a"
+        return (
+            f"{self.concurrency:>5} {self.turns:>7} {self.throughput:>9.1f} "
+            f"{self.percentile(50) * 1000:>8.1f} {self.percentile(95) * 1000:>8.1f} {self.percentile(99) * 1000:>8.1f} "
+            f"{self.errors:>6}  {history:<16} {kb:>7.1f} {rss:>8}"
+        )
+
+
+@dataclass
+class LoadReport:
+    pattern: str
+    latency: float
+    levels: list[LevelResult] = field(default_factory=list)
+
+    def saturation(self, min_gain: float = 0.1) -> int | None:
+        """
+        The first concurrency level that gained less than ``min_gain`` (10%)
+        throughput over the previous one, or None if throughput kept rising.
+        """
+        for previous, level in zip(self.levels, self.levels[1:]):
+            if level.throughput < previous.throughput * (1 + min_gain):
+                return level.concurrency
+        return None
+
+    def summary(self) -> str:
+        lines = [
+            f"pattern {self.pattern}, fake model latency {self.latency * 1000:.0f}ms per request",
+            f"{'conc':>5} {'turns':>7} {'turns/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'errors':>6}  {'history/session':<16} {'KB/sess':>7} {'peak RSS':>8}",
+        ]
+        lines += [level.row() for level in self.levels]
+        knee = self.saturation()
+        lines.append(
+            f"throughput stops scaling at concurrency {knee}" if knee else "throughput still scaling at the last level"
+        )
+        return "\n".join(lines)
+
+
+# -------------------------------------------------------------------
+# Runner
+# -------------------------------------------------------------------
+
+def run_load(
+    levels: list[int],
+    conversations_per_worker: int = 3,
+    latency: float = 0.05,
+    pattern: str = "single",
+    use_router: bool = False,
+    repeat: int = 1,
+    think_time: float = 0.0,
+    history_budget: int = 1500,
+) -> LoadReport:
+    """
+    For each concurrency level, runs ``level`` workers that each play
+    ``conversations_per_worker`` conversations (cycling through
+    CONVERSATIONS, every script played ``repeat`` times in a row, so long
+    sessions exercise history compaction). Turns that raise are counted as
+    errors. The tool cache is private to the run.
+    """
+    llm = FakeStreamingClient(pattern_script(pattern), latency=latency, keep_requests=False)
+    cache = ToolResultCache()
+    runner = ToolRunner(
+        tool_name_to_python_fn, timeouts=tool_timeouts, cache=cache, cache_ttls=tool_cache_ttls,
+        validators=tool_validators, max_workers=max(levels) * 2,
+    )
+    router = IntentRouter(classifier=LocalIntentClassifier()) if use_router else None
+    scripts = list(CONVERSATIONS.values())
+    order_numbers = itertools.count(10_000_000)
+    report = LoadReport(pattern=pattern, latency=latency)
+
+    def converse(level: LevelResult, lock: threading.Lock, index: int) -> None:
+        order_id = f"ORD-{next(order_numbers)}"
+        prompts = scripts[index % len(scripts)] * repeat
+        history = HistoryManager(budget_tokens=history_budget)
+        tokens: list[int] = []
+        latencies: list[float] = []
+        errors = 0
+        for i, prompt in enumerate(prompts):
+            if think_time and i:
+                time.sleep(think_time)
+            user_input = prompt.format(order_id=order_id)
+            started = time.perf_counter()
+            try:
+                reply = run_turn(
+                    user_input, history.messages(), llm,
+                    runner=runner, on_tool_calls=history.record_tool_calls, router=router,
+                )
+            except Exception:
+                errors += 1
+                continue
+            latencies.append(time.perf_counter() - started)
+            history.append({"role": "user", "content": user_input})
+            history.append({"role": "assistant", "content": reply})
+            tokens.append(history.tokens)
+        size = len(json.dumps(history.messages()))
+        with lock:
+            level.latencies.extend(latencies)
+            level.errors += errors
+            level.history_tokens.append(tokens)
+            level.history_bytes.append(size)
+
+    def worker(level: LevelResult, lock: threading.Lock, worker_index: int) -> None:
+        for n in range(conversations_per_worker):
+            converse(level, lock, worker_index * conversations_per_worker + n)
+
+    try:
+        for concurrency in levels:
+            level = LevelResult(concurrency=concurrency, elapsed=0.0)
+            lock = threading.Lock()
+            started = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                list(pool.map(lambda w: worker(level, lock, w), range(concurrency)))
+            level.elapsed = time.perf_counter() - started
+            level.peak_rss_mb = _peak_rss_mb()
+            report.levels.append(level)
+    finally:
+        runner.close()
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Load-test Casanova turns against a local fake model.")
+    parser.add_argument("--levels", default="1,2,4,8,16,32", help="comma-separated concurrency levels")
+    parser.add_argument("--conversations", type=int, default=3, help="conversations per worker and level")
+    parser.add_argument("--latency", type=float, default=0.05, help="fake model seconds per request")
+    parser.add_argument("--pattern", choices=sorted(TOOL_CALL_PATTERNS), default="single")
+    parser.add_argument("--router", action="store_true", help="use the intent pre-router")
+    parser.add_argument("--repeat", type=int, default=1, help="play each conversation script this many times")
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds between a user's turns")
+    parser.add_argument("--history-budget", type=int, default=1500, help="HistoryManager token budget")
+    args = parser.parse_args(argv)
+
+    report = run_load(
+        [int(level) for level in args.levels.split(",")],
+        conversations_per_worker=args.conversations,
+        latency=args.latency,
+        pattern=args.pattern,
+        use_router=args.router,
+        repeat=args.repeat,
+        think_time=args.think_time,
+        history_budget=args.history_budget,
+    )
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,256 @@
+# casanova_core/rerun_bench.py
+# Measures what one Streamlit rerun of a Casanova script costs.
+#
+#   python -m casanova_core.rerun_bench casanova.py --runs 30 --prompt "where is ORD-12345678"
+#
+# Streamlit re-executes the whole script on every interaction. This harness
+# does the same with a minimal in-process stand-in for the ``streamlit``
+# module (session state and ``cache_resource`` persist across reruns, widgets
+# return fixed values), and with CASANOVA_FAKE_LLM=1 so turns use the local
+# fake model. It times the script itself, not Streamlit's rendering.
+#
+# Older revisions of casanova.py build ``openai.OpenAI()`` at the top of the
+# script and ignore CASANOVA_FAKE_LLM, so the harness also stands in for the
+# ``openai`` module: its chat completions answer with the same scripted fake
+# model, and no request is ever sent. When the real ``openai`` package is
+# installed, each ``OpenAI(...)`` call still builds a real client (HTTP client
+# and connection pool setup, no request), so what caching the client saves is
+# part of the timings; without it the stand-in client costs nothing to build,
+# and the summary says that construction was not timed. That makes
+# before/after comparisons possible:
+#
+#   git show <rev>:chatbots/demos/casanova.py > /tmp/casanova_before.py
+#   python -m casanova_core.rerun_bench /tmp/casanova_before.py --prompt "where is ORD-12345678"
+
+import argparse
+import contextlib
+import importlib
+import os
+import runpy
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+from .fakes import FakeStreamingClient, scripted_reply
+
+__all__ = ["FakeStreamlit", "FakeOpenAI", "RerunReport", "measure_reruns"]
+
+
+class _SessionState(dict):
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self[name] = value
+
+
+class FakeStreamlit(ModuleType):
+    """The parts of the ``streamlit`` API casanova.py uses, without any rendering."""
+
+    def __init__(self):
+        super().__init__("streamlit")
+        self.session_state = _SessionState()
+        self.pending_input: str | None = None
+        self.resources: dict = {}
+        self.output: list[str] = []
+        self.sidebar = self
+
+    # Caching: one result per function and arguments, for the process lifetime.
+    def cache_resource(self, fn=None, **_options):
+        def decorate(fn):
+            def cached(*args, **kwargs):
+                key = (fn.__module__, fn.__qualname__, args, tuple(sorted(kwargs.items())))
+                if key not in self.resources:
+                    self.resources[key] = fn(*args, **kwargs)
+                return self.resources[key]
+            return cached
+        return decorate(fn) if fn is not None else decorate
+
+    # Layout and output
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def chat_message(self, role):
+        return self
+
+    def spinner(self, text=""):
+        return contextlib.nullcontext()
+
+    def set_page_config(self, **_options):
+        pass
+
+    def markdown(self, body, **_options):
+        self.output.append(str(body))
+
+    title = caption = warning = markdown
+
+    def write_stream(self, stream):
+        text = "".join(stream)
+        self.output.append(text)
+        return text
+
+    # Widgets
+    def text_input(self, label, value="", **_options):
+        return value
+
+    def toggle(self, label, value=False, **_options):
+        return value
+
+    def chat_input(self, placeholder="", **_options):
+        value, self.pending_input = self.pending_input, None
+        return value
+
+
+class FakeOpenAI(ModuleType):
+    """
+    The ``openai`` module as older casanova.py revisions use it:
+    ``OpenAI().chat.completions.create(...)`` answered by the scripted fake model.
+    With ``real`` (the installed ``openai`` module) every ``OpenAI(...)`` also
+    builds a real client, so its construction cost is measured.
+    """
+
+    def __init__(self, real: ModuleType | None = None):
+        super().__init__("openai")
+        self.real = real
+        self.llm = FakeStreamingClient(scripted_reply, keep_requests=False)
+        self.clients_built = 0
+
+    def OpenAI(self, **options):
+        if self.real is not None:
+            self.real.OpenAI(**options)
+        self.clients_built += 1
+
+        def create(model, messages, tools=None, tool_choice=None, stream=False, **_ignored):
+            if stream:
+                raise NotImplementedError("the rerun bench only fakes non-streaming completions")
+            message = self.llm.complete(model, messages, tools, tool_choice)
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+        return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def _installed_openai() -> ModuleType | None:
+    module = sys.modules.get("openai")
+    if module is not None and not isinstance(module, FakeOpenAI):
+        return module
+    saved = sys.modules.pop("openai", None)
+    try:
+        return importlib.import_module("openai")
+    except ImportError:
+        return None
+    finally:
+        if saved is not None:
+            sys.modules["openai"] = saved
+
+
+@dataclass
+class RerunReport:
+    script: str
+    cold_seconds: float
+    rerun_seconds: list[float] = field(default_factory=list)
+    turn_seconds: list[float] = field(default_factory=list)
+    openai_clients: int = 0  # OpenAI(...) calls the script made
+    openai_client_timed: bool = False  # whether those built a real client
+
+    def summary(self) -> str:
+        def ms(values: list[float]) -> str:
+            if not values:
+                return "n/a"
+            ordered = sorted(values)
+            p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+            return (
+                f"mean {statistics.mean(values) * 1000:.2f}ms, p50 {statistics.median(values) * 1000:.2f}ms, "
+                f"p95 {p95 * 1000:.2f}ms"
+            )
+
+        lines = [
+            f"script: {self.script}",
+            f"first run (cold caches): {self.cold_seconds * 1000:.2f}ms",
+            f"rerun without input ({len(self.rerun_seconds)}x): {ms(self.rerun_seconds)}",
+            f"rerun with a chat turn ({len(self.turn_seconds)}x): {ms(self.turn_seconds)}",
+        ]
+        if self.openai_clients:
+            lines.append(f"openai.OpenAI() calls: {self.openai_clients}, " + (
+                "real client construction timed (no requests sent)" if self.openai_client_timed
+                else "client construction NOT timed (openai is not installed; the stand-in is free to build)"
+            ))
+        return "\n".join(lines)
+
+
+BENCH_ENV = {"CASANOVA_FAKE_LLM": "1", "OPENAI_API_KEY": "sk-rerun-bench-placeholder"}
+
+
+def measure_reruns(
+    script: Path,
+    runs: int = 20,
+    prompts: list[str] | None = None,
+    fake: FakeStreamlit | None = None,
+    openai: FakeOpenAI | None = None,
+) -> RerunReport:
+    """
+    Runs ``script`` once cold, then ``runs`` plain reruns, then one rerun per
+    prompt (submitted through ``st.chat_input``), and times each execution.
+    """
+    script = Path(script).resolve()
+    fake = fake or FakeStreamlit()
+    if openai is None:
+        openai = FakeOpenAI(real=_installed_openai())
+    stand_ins = {"streamlit": fake, "openai": openai}
+    saved_modules = {name: sys.modules.get(name) for name in stand_ins}
+    saved_env = {name: os.environ.get(name) for name in BENCH_ENV}
+    sys.modules.update(stand_ins)
+    for name, value in BENCH_ENV.items():
+        os.environ.setdefault(name, value)
+    sys.path.insert(0, str(script.parent))
+
+    def execute() -> float:
+        started = time.perf_counter()
+        runpy.run_path(str(script), run_name="__main__")
+        return time.perf_counter() - started
+
+    try:
+        report = RerunReport(script=str(script), cold_seconds=execute())
+        report.rerun_seconds = [execute() for _ in range(runs)]
+        for prompt in prompts or []:
+            fake.pending_input = prompt
+            report.turn_seconds.append(execute())
+        report.openai_clients = openai.clients_built
+        report.openai_client_timed = openai.real is not None
+        return report
+    finally:
+        sys.path.remove(str(script.parent))
+        for name, module in saved_modules.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+        for name, value in saved_env.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Time Streamlit reruns of a Casanova script.")
+    parser.add_argument("script", nargs="?", default=str(Path(__file__).resolve().parents[1] / "casanova.py"))
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--prompt", action="append", default=[], help="chat input to submit (repeatable)")
+    args = parser.parse_args(argv)
+
+    report = measure_reruns(Path(args.script), runs=args.runs, prompts=args.prompt)
+    print(report.summary())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
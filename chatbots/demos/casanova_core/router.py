@@ -0,0 +1,215 @@
+# casanova_core/router.py
+# Deterministic intent/entity pre-router: turns clear-cut messages straight into
+# tool calls so the tool-choosing model call can be skipped.
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Callable
+
+from .llm import AssistantMessage, FunctionCall, ToolCall
+
+__all__ = ["Route", "RouterStats", "LocalIntentClassifier", "IntentRouter", "intent_router"]
+
+ORDER_ID_RE = re.compile(r"\b(?:ORD|ORDER)-[A-Z0-9]+(?:-[A-Z0-9]+)*\b", re.IGNORECASE)
+
+# -------------------------------------------------------------------
+# Keyword / regex rules (INTENTS → TOOLS, as in the system prompt)
+# -------------------------------------------------------------------
+
+INTENT_PATTERNS = {
+    "TRACK_STATUS": re.compile(
+        r"\bwhere(?:'s| is| are)\b|\b(?:current |tracking )?status\b|\blast scan\b"
+        r"|\bwith (?:the )?courier\b|\bleft (?:the )?warehouse\b|\btrack\b",
+        re.IGNORECASE,
+    ),
+    "ASK_ETA": re.compile(
+        r"\bwhen (?:will|does|is)\b|\beta\b|\bexpected (?:delivery|arrival)\b"
+        r"|\bdelivery (?:date|time)\b|\bstill scheduled\b|\barriv",
+        re.IGNORECASE,
+    ),
+    "REPORT_ISSUE": re.compile(
+        r"\bdelay|\blate\b|\bmissing\b|\bhaven'?t (?:received|got)\b|\bnot received\b|\bnever (?:came|arrived)\b"
+        r"|\bnot updating\b|\bhasn'?t (?:updated|moved)\b|\blost\b|\bcomplain",
+        re.IGNORECASE,
+    ),
+}
+
+ISSUE_TYPE_PATTERNS = [
+    ("POSSIBLY_LOST", re.compile(r"\blost\b|\bmissing\b", re.IGNORECASE)),
+    ("TRACKING_NOT_UPDATING", re.compile(r"\bnot updating\b|\bhasn'?t (?:updated|moved)\b", re.IGNORECASE)),
+    ("NOT_RECEIVED", re.compile(r"\bhaven'?t (?:received|got)\b|\bnot received\b|\bnever (?:came|arrived)\b",
+                                re.IGNORECASE)),
+    ("DELAYED", re.compile(r"\bdelay|\blate\b", re.IGNORECASE)),
+]
+
+INTENT_TOOLS = {
+    "TRACK_STATUS": "track_order_status",
+    "ASK_ETA": "get_order_eta",
+    "REPORT_ISSUE": "report_delivery_issue",
+}
+
+
+@dataclass
+class Route:
+    intent: str
+    tool_name: str
+    arguments: dict
+    source: str  # "rules" or "classifier"
+
+    def to_message(self, call_id: str) -> AssistantMessage:
+        """The assistant message the tool-choosing model call would have produced."""
+        return AssistantMessage(
+            tool_calls=[ToolCall(id=call_id, function=FunctionCall(self.tool_name, json.dumps(self.arguments)))]
+        )
+
+
+@dataclass
+class RouterStats:
+    """
+    Hit rate of the pre-router, and the latency it saved: every hit skips one
+    tool-choosing call, estimated at the mean duration of those calls on
+    fallback turns.
+    """
+    hits: int = 0
+    fallbacks: int = 0
+    fallback_call_seconds: float = 0.0
+    by_source: Counter = field(default_factory=Counter)
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.fallbacks
+        return self.hits / total if total else 0.0
+
+    @property
+    def mean_call_seconds(self) -> float:
+        return self.fallback_call_seconds / self.fallbacks if self.fallbacks else 0.0
+
+    @property
+    def seconds_saved(self) -> float:
+        return self.hits * self.mean_call_seconds
+
+    def summary(self) -> str:
+        return (
+            f"pre-router: {self.hits} hits, {self.fallbacks} fallbacks "
+            f"({self.hit_rate:.0%} hit rate), ~{self.seconds_saved:.1f}s of model calls saved"
+        )
+
+
+# -------------------------------------------------------------------
+# Optional local classifier
+# -------------------------------------------------------------------
+
+_WORD_RE = re.compile(r"[a-z']+")
+
+DEFAULT_EXAMPLES = {
+    "TRACK_STATUS": [
+        "where is my order", "where is my parcel", "where is my package", "where is my shipment",
+        "current status of my order", "what was the last scan", "is it with the courier",
+        "has it left the warehouse", "track my order",
+    ],
+    "ASK_ETA": [
+        "when will it arrive", "when will my order be delivered", "expected delivery date",
+        "what time will it be delivered", "is it still scheduled for today", "is it close to being delivered",
+        "eta for my order",
+    ],
+    "REPORT_ISSUE": [
+        "my order is delayed", "i haven't received it yet", "my package is missing", "tracking is not updating",
+        "is my parcel lost", "it should have arrived days ago", "the delivery is late",
+    ],
+}
+
+
+class LocalIntentClassifier:
+    """
+    Tiny multinomial naive Bayes over lowercase words, trained on example
+    utterances per intent. Returns (intent, probability) for a message.
+    """
+
+    def __init__(self, examples: dict[str, list[str]] | None = None):
+        examples = examples or DEFAULT_EXAMPLES
+        self.word_counts = {intent: Counter() for intent in examples}
+        self.vocabulary: set[str] = set()
+        for intent, utterances in examples.items():
+            for utterance in utterances:
+                words = _WORD_RE.findall(utterance.lower())
+                self.word_counts[intent].update(words)
+                self.vocabulary.update(words)
+        self.totals = {intent: sum(c.values()) for intent, c in self.word_counts.items()}
+
+    def __call__(self, text: str) -> tuple[str, float]:
+        words = [w for w in _WORD_RE.findall(text.lower()) if w in self.vocabulary]
+        size = len(self.vocabulary)
+        scores = {
+            intent: sum(math.log((counts[w] + 1) / (self.totals[intent] + size)) for w in words)
+            for intent, counts in self.word_counts.items()
+        }
+        best = max(scores, key=scores.get)
+        norm = sum(math.exp(s - scores[best]) for s in scores.values())
+        return best, 1.0 / norm
+
+
+# -------------------------------------------------------------------
+# Router
+# -------------------------------------------------------------------
+
+class IntentRouter:
+    """
+    Routes a message straight to a tool when that is unambiguous:
+
+      - exactly one intent's keywords match (or, if none match, the optional
+        ``classifier`` is at least ``min_confidence`` sure), and
+      - exactly one order id can be extracted from the message.
+
+    Anything else (no order id, several intents, small talk) returns ``None``
+    and the turn falls back to the tool-choosing model call.
+    """
+
+    def __init__(
+        self,
+        classifier: Callable[[str], tuple[str, float]] | None = None,
+        min_confidence: float = 0.8,
+    ):
+        self.classifier = classifier
+        self.min_confidence = min_confidence
+        self.stats = RouterStats()
+        self._lock = threading.Lock()
+
+    def route(self, user_input: str) -> Route | None:
+        order_ids = {m.upper() for m in ORDER_ID_RE.findall(user_input)}
+        if len(order_ids) != 1:
+            return None
+        order_id = order_ids.pop()
+
+        intents = [intent for intent, pattern in INTENT_PATTERNS.items() if pattern.search(user_input)]
+        source = "rules"
+        if not intents and self.classifier is not None:
+            intent, confidence = self.classifier(user_input)
+            if confidence >= self.min_confidence:
+                intents, source = [intent], "classifier"
+        if len(intents) != 1:
+            return None
+
+        intent = intents[0]
+        arguments = {"order_id": order_id}
+        if intent == "REPORT_ISSUE":
+            issue_type = next((t for t, p in ISSUE_TYPE_PATTERNS if p.search(user_input)), "OTHER")
+            arguments.update(issue_type=issue_type, customer_description=user_input)
+        return Route(intent, INTENT_TOOLS[intent], arguments, source)
+
+    def record_hit(self, route: Route) -> None:
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.by_source[route.source] += 1
+
+    def record_fallback(self, call_seconds: float) -> None:
+        with self._lock:
+            self.stats.fallbacks += 1
+            self.stats.fallback_call_seconds += call_seconds
+
+
+# Shared by every session in the process so the stats cover all of them.
+intent_router = IntentRouter(classifier=LocalIntentClassifier())
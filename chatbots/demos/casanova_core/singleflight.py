@@ -0,0 +1,90 @@
+# casanova_core/singleflight.py
+# Single-flight coalescing of identical in-flight async calls, and the
+# background event loop that lets every Streamlit session share them.
+
+import asyncio
+import threading
+from collections import Counter
+from typing import Any, Awaitable, Callable, Hashable
+
+__all__ = ["SingleFlight", "EventLoopThread"]
+
+
+class SingleFlight:
+    """
+    Runs at most one call per key at a time; callers that arrive while it is
+    in flight await the same result instead of starting their own.
+
+    The call runs as its own task, so a caller that is cancelled (or gives up
+    waiting) does not cancel it for the others. Whatever the call raises,
+    including a timeout, is raised to every waiter. Once it finishes, the key
+    is free again: coalescing only covers calls that overlap, it is not a
+    cache.
+
+    Not thread-safe; use it from a single event loop.
+    """
+
+    def __init__(self):
+        self._in_flight: dict[Hashable, asyncio.Task] = {}
+        self.stats: Counter = Counter()
+
+    def __len__(self) -> int:
+        return len(self._in_flight)
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        task = self._in_flight.get(key)
+        if task is None:
+            self.stats["calls"] += 1
+            task = asyncio.ensure_future(fn())
+            self._in_flight[key] = task
+            task.add_done_callback(lambda done: self._finished(key, done))
+        else:
+            self.stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _finished(self, key: Hashable, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Every waiter may have been cancelled; mark the exception as
+        # retrieved so it is not reported as "never retrieved".
+        if not task.cancelled():
+            task.exception()
+
+
+def _serve(loop: asyncio.AbstractEventLoop) -> None:
+    try:
+        loop.run_forever()
+    finally:
+        loop.close()
+
+
+class EventLoopThread:
+    """An asyncio loop running on a daemon thread, started on first use."""
+
+    def __init__(self, name: str = "casanova-loop"):
+        self.name = name
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=_serve, args=(loop,), name=self.name, daemon=True).start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Awaitable[Any]):
+        """Schedules ``coro`` on the loop; returns a ``concurrent.futures.Future``."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Awaitable[Any]) -> Any:
+        """Runs ``coro`` on the loop and blocks the calling thread for its result."""
+        return self.submit(coro).result()
+
+    def stop(self) -> None:
+        with self._lock:
+            loop, self._loop = self._loop, None
+        if loop is not None:
+            loop.call_soon_threadsafe(loop.stop)
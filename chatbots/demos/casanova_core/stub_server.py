@@ -0,0 +1,252 @@
+# casanova_core/stub_server.py
+# Deterministic local stand-in for the chat-completions API.
+#
+#   python -m casanova_core.stub_server --port 8089 --latency 0.2
+#
+# Speaks the OpenAI wire format (POST /v1/chat/completions, JSON or SSE with
+# ``"stream": true``) over keep-alive HTTP/1.1, answering with
+# ``fakes.scripted_reply`` or any other script. Point HTTPChatClient (or the
+# official SDK, via base_url) at http://127.0.0.1:<port>/v1 to run Casanova
+# end to end without network access.
+
+import argparse
+import json
+import re
+import statistics
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable
+
+from .fakes import scripted_reply
+from .llm import AssistantMessage
+
+__all__ = ["StubChatServer"]
+
+
+def _message_json(message: AssistantMessage) -> dict:
+    out: dict = {"role": "assistant", "content": message.content}
+    if message.tool_calls:
+        out["tool_calls"] = [
+            {
+                "id": tc.id,
+                "type": "function",
+                "function": {"name": tc.function.name, "arguments": tc.function.arguments},
+            }
+            for tc in message.tool_calls
+        ]
+    return out
+
+
+def _chunks(message: AssistantMessage) -> list[dict]:
+    """The deltas of ``message`` the way the API streams them."""
+    deltas: list[dict] = [{"role": "assistant"}]
+    for i, tc in enumerate(message.tool_calls):
+        deltas.append({"tool_calls": [{
+            "index": i, "id": tc.id, "type": "function",
+            "function": {"name": tc.function.name, "arguments": ""},
+        }]})
+        args = tc.function.arguments
+        for start in range(0, len(args), 16):
+            deltas.append({"tool_calls": [{"index": i, "function": {"arguments": args[start:start + 16]}}]})
+    for token in re.findall(r"\S+\s*|\s+", message.content or ""):
+        deltas.append({"content": token})
+    return deltas
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+    # Headers and body go out in separate writes; without TCP_NODELAY each
+    # response waits on the client's delayed ACK (~40ms).
+    disable_nagle_algorithm = True
+    server: "_Server"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _write_chunk(self, data: bytes) -> None:
+        self.wfile.write(f"{len(data):x}\r\n".encode("ascii") + data + b"\r\n")
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        stub: StubChatServer = self.server.stub
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"no route {self.path}"}})
+            return
+
+        number = stub._begin()
+        try:
+            if stub.fail_every and number % stub.fail_every == 0:
+                self._send_json(503, {"error": {"message": "stub overloaded"}}, {"Retry-After": "0"})
+                return
+            request = json.loads(body)
+            reply = stub.script(request["model"], request["messages"])
+            message = AssistantMessage(content=reply) if isinstance(reply, str) else reply
+            time.sleep(stub.latency)
+            envelope = {"id": f"chatcmpl-stub-{number}", "created": 0, "model": request["model"]}
+            finish = "tool_calls" if message.tool_calls else "stop"
+
+            if not request.get("stream"):
+                self._send_json(200, dict(envelope, object="chat.completion", choices=[
+                    {"index": 0, "message": _message_json(message), "finish_reason": finish}
+                ]))
+                return
+
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            deltas = _chunks(message)
+            for i, delta in enumerate(deltas):
+                chunk = dict(envelope, object="chat.completion.chunk", choices=[
+                    {"index": 0, "delta": delta, "finish_reason": finish if i == len(deltas) - 1 else None}
+                ])
+                self._write_chunk(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                if stub.token_delay:
+                    time.sleep(stub.token_delay)
+            self._write_chunk(b"data: [DONE]\n\n")
+            self._write_chunk(b"")
+        finally:
+            stub._end()
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubChatServer"
+
+
+class StubChatServer:
+    """
+    In-process chat-completions server on ``127.0.0.1``.
+
+    ``latency`` is slept before each response (time to first token),
+    ``token_delay`` between streamed chunks. With ``fail_every=n`` every n-th
+    request gets a 503, to exercise client retries. ``requests`` and
+    ``max_in_flight`` record what the server saw.
+    """
+
+    def __init__(
+        self,
+        script: Callable[[str, list[dict]], AssistantMessage | str] = scripted_reply,
+        latency: float = 0.0,
+        token_delay: float = 0.0,
+        fail_every: int = 0,
+        port: int = 0,
+    ):
+        self.script = script
+        self.latency = latency
+        self.token_delay = token_delay
+        self.fail_every = fail_every
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = _Server(("127.0.0.1", port), _Handler)
+        self._server.stub = self
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def _begin(self) -> int:
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            return self.requests
+
+    def _end(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def start(self) -> "StubChatServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self) -> "StubChatServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+
+def _self_test(args) -> int:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .http_llm import HTTPChatClient
+    from .turn import run_turn
+
+    prompts = ["where is my order ORD-12345678", "when will ORD-12345678 arrive?", "I think ORD-1 is lost"]
+    with StubChatServer(latency=args.latency, fail_every=args.fail_every, port=0) as server:
+        llm = HTTPChatClient(server.base_url, max_connections=args.concurrency, backoff_base=0.01)
+
+        def turn(i: int) -> float:
+            started = time.perf_counter()
+            run_turn(prompts[i % len(prompts)], [], llm)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = list(pool.map(turn, range(args.self_test)))
+        elapsed = time.perf_counter() - started
+        llm.close()
+
+    cuts = statistics.quantiles(latencies, n=100, method="inclusive")
+    print(
+        f"{len(latencies)} turns, concurrency {args.concurrency}: "
+        f"p50 {cuts[49] * 1000:.1f}ms, p99 {cuts[98] * 1000:.1f}ms, "
+        f"{len(latencies) / elapsed:.1f} turns/s; "
+        f"{llm.stats['connections_opened']} connections, {llm.stats['retries']} retries"
+    )
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Local chat-completions stub for Casanova.")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds before each response")
+    parser.add_argument("--token-delay", type=float, default=0.0, help="seconds between streamed chunks")
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every n-th request with a 503")
+    parser.add_argument(
+        "--self-test", type=int, default=0, metavar="TURNS",
+        help="run TURNS Casanova turns against the stub through HTTPChatClient, print latencies and exit",
+    )
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel turns for --self-test")
+    args = parser.parse_args(argv)
+
+    if args.self_test:
+        return _self_test(args)
+
+    server = StubChatServer(
+        latency=args.latency, token_delay=args.token_delay, fail_every=args.fail_every, port=args.port
+    )
+    print(f"serving chat completions on {server.base_url}")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
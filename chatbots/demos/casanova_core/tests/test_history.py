@@ -0,0 +1,86 @@
+import unittest
+
+from casanova_core.fakes import FakeStreamingClient, tool_call_message
+from casanova_core.history import MESSAGE_OVERHEAD_TOKENS, HistoryManager, approx_token_count
+from casanova_core.turn import run_turn
+
+
+def exchange(i):
+    return [
+        {"role": "user", "content": f"Where is my order ORD-{1000 + i}? It was supposed to arrive last week."},
+        {"role": "assistant", "content": f"Order ORD-{1000 + i} is in transit at the regional hub."},
+    ]
+
+
+class CountingTokenizer:
+    def __init__(self):
+        self.texts = []
+
+    def __call__(self, text):
+        self.texts.append(text)
+        return approx_token_count(text)
+
+
+class HistoryManagerTests(unittest.TestCase):
+
+    def test_history_stays_within_budget_over_a_long_conversation(self):
+        history = HistoryManager(budget_tokens=200, keep_recent=4)
+        for i in range(50):
+            for message in exchange(i):
+                history.append(message)
+
+        self.assertLessEqual(history.tokens, 200)
+        self.assertEqual(exchange(49), history.messages()[-2:])
+        self.assertGreater(history.folded, 90)
+
+    def test_folded_turns_are_kept_as_structured_memory(self):
+        history = HistoryManager(budget_tokens=150, keep_recent=2)
+        history.record_tool_calls(tool_call_message(("track_order_status", {"order_id": "ORD-1000"})).tool_calls)
+        for i in range(5):
+            for message in exchange(i):
+                history.append(message)
+
+        summary = history.messages()[0]
+
+        self.assertEqual("system", summary["role"])
+        self.assertIn("ORD-1000", summary["content"])
+        self.assertIn("TRACK_STATUS ORD-1000", summary["content"])
+        self.assertNotIn("ORD-1004", summary["content"])
+
+    def test_short_conversation_is_sent_verbatim(self):
+        history = HistoryManager(budget_tokens=1000)
+        for message in exchange(0):
+            history.append(message)
+
+        self.assertEqual(exchange(0), history.messages())
+
+    def test_each_message_is_tokenized_once(self):
+        tokenizer = CountingTokenizer()
+        history = HistoryManager(budget_tokens=10_000, count_tokens=tokenizer)
+        for i in range(20):
+            for message in exchange(i):
+                history.append(message)
+
+        self.assertEqual(40, len(tokenizer.texts))
+        expected = sum(approx_token_count(m["content"]) + MESSAGE_OVERHEAD_TOKENS
+                       for i in range(20) for m in exchange(i))
+        self.assertEqual(expected, history.tokens)
+
+    def test_turn_records_tool_calls_into_the_history(self):
+        history = HistoryManager(budget_tokens=120, keep_recent=0)
+        llm = FakeStreamingClient([
+            tool_call_message(("get_order_eta", {"order_id": "ORD-77"})),
+            "It arrives tomorrow.",
+        ])
+
+        reply = run_turn("When does ORD-77 arrive?", history.messages(), llm,
+                         on_tool_calls=history.record_tool_calls)
+        history.append({"role": "user", "content": "When does ORD-77 arrive?"})
+        history.append({"role": "assistant", "content": reply})
+        history.append({"role": "user", "content": "x " * 100})
+
+        self.assertIn("ASK_ETA ORD-77", history.messages()[0]["content"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,99 @@
+import json
+import random
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from casanova_core.fakes import tool_call_message
+from casanova_core.http_llm import HTTPChatClient, LLMBackendError
+from casanova_core.stub_server import StubChatServer
+from casanova_core.turn import run_turn, stream_turn
+
+ORDER_ID = "ORD-12345678"
+
+
+class HTTPChatClientTests(unittest.TestCase):
+
+    def setUp(self):
+        self.server = StubChatServer().start()
+        self.addCleanup(self.server.stop)
+        self.sleeps = []
+        self.llm = HTTPChatClient(
+            self.server.base_url, max_connections=4, rng=random.Random(0), sleep=self.sleeps.append
+        )
+        self.addCleanup(self.llm.close)
+
+    def test_complete_and_stream_agree_on_tool_calls_and_text(self):
+        messages = [{"role": "user", "content": f"where is {ORDER_ID}"}]
+
+        completed = self.llm.complete("gpt-4o", messages, tools=[{"type": "function"}])
+        streamed = "".join(stream_turn(f"where is {ORDER_ID}", [], self.llm))
+
+        self.assertEqual("track_order_status", completed.tool_calls[0].function.name)
+        self.assertEqual({"order_id": ORDER_ID}, json.loads(completed.tool_calls[0].function.arguments))
+        self.assertTrue(streamed.startswith("Here is what I found:"))
+        self.assertEqual(streamed, run_turn(f"where is {ORDER_ID}", [], self.llm))
+
+    def test_sequential_requests_reuse_one_keep_alive_connection(self):
+        for _ in range(20):
+            self.llm.complete("gpt-4o-mini", [{"role": "user", "content": "hello"}])
+            "".join(d.content or "" for d in self.llm.stream("gpt-4o-mini", [{"role": "user", "content": "hi"}]))
+
+        self.assertEqual(1, self.llm.stats["connections_opened"])
+        self.assertEqual(40, self.server.requests)
+
+    def test_concurrency_is_limited_to_the_pool_size(self):
+        self.server.latency = 0.02
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            list(pool.map(lambda i: run_turn(f"where is ORD-{i}", [], self.llm), range(32)))
+
+        self.assertLessEqual(self.server.max_in_flight, 4)
+        self.assertLessEqual(self.llm.stats["connections_opened"], 4)
+
+    def test_retryable_failures_are_retried_with_jittered_backoff(self):
+        self.server.fail_every = 2
+
+        replies = [self.llm.complete("gpt-4o-mini", [{"role": "user", "content": "hi"}]) for _ in range(5)]
+
+        self.assertTrue(all(r.content for r in replies))
+        self.assertGreater(self.llm.stats["retries"], 0)
+        self.assertEqual(self.llm.stats["retries"], len(self.sleeps))
+        self.assertTrue(all(0 <= s <= self.llm.backoff_base for s in self.sleeps))
+
+    def test_gives_up_after_max_retries(self):
+        self.server.fail_every = 1
+        llm = HTTPChatClient(self.server.base_url, max_retries=2, sleep=lambda s: None)
+        self.addCleanup(llm.close)
+
+        with self.assertRaises(LLMBackendError) as raised:
+            llm.complete("gpt-4o-mini", [{"role": "user", "content": "hi"}])
+
+        self.assertEqual(503, raised.exception.status)
+        self.assertEqual(3, self.server.requests)
+
+    def test_backoff_grows_and_is_capped(self):
+        llm = HTTPChatClient("http://127.0.0.1:1/v1", backoff_base=1.0, backoff_max=4.0, rng=random.Random(1))
+
+        delays = [max(llm._backoff(attempt, None) for _ in range(200)) for attempt in range(5)]
+
+        self.assertLess(delays[0], 1.0)
+        self.assertGreater(delays[2], 2.0)
+        self.assertLessEqual(max(delays), 4.0)
+        self.assertEqual(5.0, llm._backoff(0, "5"))
+
+
+class StubChatServerTests(unittest.TestCase):
+
+    def test_replies_deterministically_from_its_script(self):
+        script = [tool_call_message(("get_order_eta", {"order_id": ORDER_ID})), "Tomorrow."]
+        with StubChatServer(script=lambda model, messages: script[len(messages) > 2]) as server:
+            llm = HTTPChatClient(server.base_url)
+            replies = [run_turn("when?", [], llm) for _ in range(3)]
+            llm.close()
+
+        self.assertEqual(["Tomorrow."] * 3, replies)
+        self.assertEqual(6, server.requests)
+
+
+if __name__ == "__main__":
+    unittest.main()
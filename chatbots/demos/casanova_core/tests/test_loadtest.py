@@ -0,0 +1,80 @@
+import json
+import unittest
+
+from casanova_core.loadtest import CONVERSATIONS, LevelResult, LoadReport, pattern_script, run_load
+
+ORDER_ID = "ORD-12345678"
+TURNS_PER_CONVERSATION = len(next(iter(CONVERSATIONS.values())))
+
+
+class PatternScriptTests(unittest.TestCase):
+
+    def ask(self, pattern, text):
+        return pattern_script(pattern)("gpt-4o", [{"role": "user", "content": text}])
+
+    def test_single_asks_for_the_routed_tool(self):
+        reply = self.ask("single", f"where is {ORDER_ID}")
+
+        self.assertEqual(["track_order_status"], [tc.function.name for tc in reply.tool_calls])
+
+    def test_parallel_adds_a_second_call_for_the_same_order(self):
+        reply = self.ask("parallel", f"when will {ORDER_ID} arrive?")
+
+        self.assertEqual(["get_order_eta", "track_order_status"], [tc.function.name for tc in reply.tool_calls])
+        self.assertEqual({ORDER_ID}, {json.loads(tc.function.arguments)["order_id"] for tc in reply.tool_calls})
+
+    def test_none_never_asks_for_tools(self):
+        self.assertIsInstance(self.ask("none", f"where is {ORDER_ID}"), str)
+
+    def test_unknown_pattern_is_rejected(self):
+        with self.assertRaises(ValueError):
+            pattern_script("bursty")
+
+
+class RunLoadTests(unittest.TestCase):
+
+    def test_every_level_plays_every_turn(self):
+        report = run_load([1, 4], conversations_per_worker=2, latency=0.005)
+
+        self.assertEqual([1, 4], [level.concurrency for level in report.levels])
+        for level in report.levels:
+            self.assertEqual(0, level.errors)
+            self.assertEqual(level.concurrency * 2 * TURNS_PER_CONVERSATION, level.turns)
+            self.assertEqual(level.concurrency * 2, len(level.history_tokens))
+        self.assertGreater(report.levels[1].throughput, report.levels[0].throughput)
+
+    def test_history_growth_stays_within_the_budget(self):
+        report = run_load([2], conversations_per_worker=1, latency=0, repeat=8, history_budget=800)
+
+        growth = report.levels[0].history_growth()
+        self.assertEqual(8 * TURNS_PER_CONVERSATION, len(growth))
+        self.assertGreater(growth[-1], growth[0])
+        self.assertLessEqual(max(max(tokens) for tokens in report.levels[0].history_tokens), 800)
+
+    def test_router_skips_the_tool_choosing_call(self):
+        routed = run_load([2], conversations_per_worker=1, latency=0.02, use_router=True)
+        plain = run_load([2], conversations_per_worker=1, latency=0.02)
+
+        self.assertLess(routed.levels[0].percentile(50), plain.levels[0].percentile(50))
+
+
+class LoadReportTests(unittest.TestCase):
+
+    def level(self, concurrency, turns_per_second):
+        return LevelResult(concurrency=concurrency, elapsed=1.0, latencies=[0.01] * turns_per_second)
+
+    def test_saturation_is_the_first_level_without_real_gain(self):
+        report = LoadReport("single", 0.05, [self.level(1, 20), self.level(4, 80), self.level(16, 84)])
+
+        self.assertEqual(16, report.saturation())
+        self.assertIn("stops scaling at concurrency 16", report.summary())
+
+    def test_summary_has_a_row_per_level(self):
+        report = LoadReport("single", 0.05, [self.level(1, 20), self.level(2, 40)])
+
+        self.assertEqual(5, len(report.summary().splitlines()))
+        self.assertIsNone(report.saturation())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+from types import ModuleType
+
+from casanova_core.fakes import FakeStreamingClient
+from casanova_core.rerun_bench import FakeOpenAI, FakeStreamlit, measure_reruns
+
+CASANOVA = Path(__file__).resolve().parents[2] / "casanova.py"
+
+# The shape of casanova.py before the LLM client was cached: OpenAI() at the
+# top of every run, CASANOVA_FAKE_LLM ignored.
+PRE_CACHE_SCRIPT = textwrap.dedent("""
+    import json
+    import streamlit as st
+    from openai import OpenAI
+
+    client = OpenAI()
+    prompt = st.chat_input("Ask about your order")
+    if prompt:
+        messages = [{"role": "user", "content": prompt}]
+        first = client.chat.completions.create(model="gpt-4o", messages=messages, tools=[], tool_choice="auto")
+        call = first.choices[0].message.tool_calls[0]
+        messages.append({"role": "tool", "tool_call_id": call.id, "name": call.function.name,
+                         "content": json.dumps({"tool": call.function.name})})
+        final = client.chat.completions.create(model="gpt-4o-mini", messages=messages)
+        st.markdown(final.choices[0].message.content)
+""")
+
+
+class RerunBenchTests(unittest.TestCase):
+
+    def test_casanova_reruns_reuse_the_cached_client(self):
+        fake = FakeStreamlit()
+
+        report = measure_reruns(CASANOVA, runs=5, prompts=["where is my order ORD-12345678"], fake=fake)
+
+        self.assertEqual(5, len(report.rerun_seconds))
+        self.assertEqual(1, len(report.turn_seconds))
+        llms = list(fake.resources.values())
+        self.assertEqual(1, len(llms))
+        self.assertIsInstance(llms[0], FakeStreamingClient)
+
+    def test_chat_turn_runs_against_the_fake_model(self):
+        fake = FakeStreamlit()
+
+        measure_reruns(CASANOVA, runs=0, prompts=["when will ORD-7 arrive?"], fake=fake)
+
+        history = fake.session_state.chat_history
+        self.assertEqual("when will ORD-7 arrive?", history[-2]["content"])
+        self.assertIn("ORD-7", history[-1]["content"])
+
+    def test_scripts_that_build_the_openai_client_run_offline(self):
+        fake = FakeStreamlit()
+        saved = sys.modules.get("openai")
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp, "casanova_before.py")
+            script.write_text(PRE_CACHE_SCRIPT)
+
+            report = measure_reruns(script, runs=2, prompts=["where is ORD-12345678"], fake=fake)
+
+        self.assertEqual(1, len(report.turn_seconds))
+        self.assertIn("track_order_status", fake.output[-1])
+        self.assertIs(saved, sys.modules.get("openai"))
+
+    def test_client_construction_is_timed_only_with_the_real_package(self):
+        real = ModuleType("openai")
+        real.built = []
+        real.OpenAI = lambda **options: real.built.append(options)
+        with tempfile.TemporaryDirectory() as tmp:
+            script = Path(tmp, "casanova_before.py")
+            script.write_text(PRE_CACHE_SCRIPT)
+
+            timed = measure_reruns(script, runs=2, openai=FakeOpenAI(real=real))
+            untimed = measure_reruns(script, runs=2, openai=FakeOpenAI())
+
+        self.assertEqual(3, len(real.built))
+        self.assertEqual(3, timed.openai_clients)
+        self.assertIn("real client construction timed", timed.summary())
+        self.assertIn("client construction NOT timed", untimed.summary())
+        self.assertEqual(0, measure_reruns(CASANOVA, runs=1).openai_clients)
+
+    def test_summary_reports_each_kind_of_run(self):
+        report = measure_reruns(CASANOVA, runs=3)
+
+        summary = report.summary()
+
+        self.assertIn("first run", summary)
+        self.assertIn("rerun without input (3x)", summary)
+        self.assertIn("rerun with a chat turn (0x): n/a", summary)
+
+
+if __name__ == "__main__":
+    unittest.main()
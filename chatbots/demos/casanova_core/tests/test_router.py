@@ -0,0 +1,84 @@
+import json
+import time
+import unittest
+
+from casanova_core.fakes import FakeStreamingClient, tool_call_message
+from casanova_core.router import IntentRouter, LocalIntentClassifier
+from casanova_core.turn import ANSWER_MODEL, TOOL_CHOICE_MODEL, run_turn, stream_turn
+
+
+class IntentRouterTests(unittest.TestCase):
+
+    def setUp(self):
+        self.router = IntentRouter()
+
+    def test_clear_messages_map_to_a_tool_call(self):
+        cases = {
+            "where is my order ORD-12345678": ("track_order_status", {"order_id": "ORD-12345678"}),
+            "When will ord-42 arrive?": ("get_order_eta", {"order_id": "ORD-42"}),
+            "I think ORDER-4014 is lost": (
+                "report_delivery_issue",
+                {"order_id": "ORDER-4014", "issue_type": "POSSIBLY_LOST",
+                 "customer_description": "I think ORDER-4014 is lost"},
+            ),
+        }
+        for message, (tool_name, arguments) in cases.items():
+            with self.subTest(message=message):
+                route = self.router.route(message)
+                self.assertEqual(tool_name, route.tool_name)
+                self.assertEqual(arguments, route.arguments)
+
+    def test_unsure_messages_fall_back_to_the_model(self):
+        for message in [
+            "where is my order?",                              # no order id
+            "where is ORD-1 and when will it arrive?",         # two intents
+            "is ORD-1 or ORD-2 the one with the courier?",     # two order ids
+            "thanks, that was helpful ORD-1",                  # no intent
+        ]:
+            with self.subTest(message=message):
+                self.assertIsNone(self.router.route(message))
+
+    def test_classifier_covers_phrasings_the_rules_miss(self):
+        router = IntentRouter(classifier=LocalIntentClassifier(), min_confidence=0.6)
+
+        route = router.route("any news on the shipment ORD-9 from the warehouse")
+
+        self.assertEqual("classifier", route.source)
+        self.assertEqual("TRACK_STATUS", route.intent)
+
+
+class RoutedTurnTests(unittest.TestCase):
+
+    def test_routed_turn_skips_the_tool_choosing_call(self):
+        router = IntentRouter()
+        llm = FakeStreamingClient(["It is out for delivery."])
+
+        reply = run_turn("where is my order ORD-12345678", [], llm, router=router)
+
+        self.assertEqual("It is out for delivery.", reply)
+        self.assertEqual([ANSWER_MODEL], [r["model"] for r in llm.requests])
+        tool_message = llm.requests[0]["messages"][-1]
+        self.assertEqual("ORD-12345678", json.loads(tool_message["content"])["order_id"])
+
+    def test_stats_report_hit_rate_and_latency_saved(self):
+        router = IntentRouter()
+
+        def slow_model(model, messages):
+            if model == TOOL_CHOICE_MODEL:
+                time.sleep(0.05)
+                return tool_call_message(("track_order_status", {"order_id": "ORD-1"}))
+            return "ok"
+
+        llm = FakeStreamingClient(slow_model)
+        run_turn("hmm, can you look into ORD-1 for me", [], llm, router=router)
+        "".join(stream_turn("where is ORD-2", [], llm, router=router))
+        run_turn("track ORD-3", [], llm, router=router)
+
+        self.assertEqual((2, 1), (router.stats.hits, router.stats.fallbacks))
+        self.assertAlmostEqual(2 / 3, router.stats.hit_rate)
+        self.assertGreaterEqual(router.stats.seconds_saved, 2 * 0.05)
+        self.assertIn("67% hit rate", router.stats.summary())
+
+
+if __name__ == "__main__":
+    unittest.main()
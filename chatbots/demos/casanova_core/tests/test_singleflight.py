@@ -0,0 +1,170 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from casanova_core.fakes import FakeStreamingClient, scripted_reply, tool_call_message
+from casanova_core.singleflight import SingleFlight
+from casanova_core.tool_runner import AsyncToolRunner, ToolRunner
+from casanova_core.turn import arun_turn
+
+
+class SingleFlightTests(unittest.TestCase):
+
+    def test_concurrent_callers_share_one_call(self):
+        flight, calls = SingleFlight(), []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return {"status": "IN_TRANSIT"}
+
+        async def main():
+            return await asyncio.gather(*(flight.do("ORD-1", fetch) for _ in range(20)))
+
+        results = asyncio.run(main())
+
+        self.assertEqual(1, len(calls))
+        self.assertEqual([{"status": "IN_TRANSIT"}] * 20, results)
+        self.assertEqual({"calls": 1, "coalesced": 19}, dict(flight.stats))
+        self.assertEqual(0, len(flight))
+
+    def test_errors_reach_every_waiter(self):
+        flight = SingleFlight()
+
+        async def fail():
+            await asyncio.sleep(0.01)
+            raise ConnectionError("backend down")
+
+        async def main():
+            return await asyncio.gather(*(flight.do("k", fail) for _ in range(5)), return_exceptions=True)
+
+        errors = asyncio.run(main())
+
+        self.assertEqual(5, len(errors))
+        self.assertTrue(all(isinstance(e, ConnectionError) for e in errors))
+
+    def test_a_cancelled_waiter_does_not_cancel_the_others(self):
+        flight = SingleFlight()
+
+        async def fetch():
+            await asyncio.sleep(0.02)
+            return 42
+
+        async def main():
+            first = asyncio.ensure_future(flight.do("k", fetch))
+            second = asyncio.ensure_future(flight.do("k", fetch))
+            await asyncio.sleep(0.005)
+            first.cancel()
+            return await second, first.cancelled()
+
+        self.assertEqual((42, True), asyncio.run(main()))
+
+    def test_calls_that_do_not_overlap_run_again(self):
+        flight, calls = SingleFlight(), []
+
+        async def fetch():
+            calls.append(1)
+            return len(calls)
+
+        async def main():
+            return [await flight.do("k", fetch), await flight.do("k", fetch)]
+
+        self.assertEqual([1, 2], asyncio.run(main()))
+
+
+class AsyncToolRunnerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+        self.delay = 0.05
+
+        def track_order_status(order_id):
+            with self.lock:
+                self.calls.append(order_id)
+            time.sleep(self.delay)
+            if order_id == "ORD-BROKEN":
+                raise RuntimeError("carrier API returned 500")
+            return {"order_id": order_id, "status": "IN_TRANSIT"}
+
+        def report_delivery_issue(**kwargs):
+            with self.lock:
+                self.calls.append("ticket")
+            return {"ticket_id": "TICKET-1"}
+
+        runner = ToolRunner(
+            {"track_order_status": track_order_status, "report_delivery_issue": report_delivery_issue},
+            timeouts={"track_order_status": 0.5},
+            max_workers=16,
+            cache_ttls={"track_order_status": 60.0, "report_delivery_issue": None},
+        )
+        self.runner = AsyncToolRunner(runner)
+        self.addCleanup(self.runner.loop.stop)
+        self.addCleanup(runner.close)
+
+    def run_from_threads(self, calls, sessions=10):
+        message = tool_call_message(*calls)
+        with ThreadPoolExecutor(max_workers=sessions) as pool:
+            return list(pool.map(lambda _: self.runner.run(message.tool_calls), range(sessions)))
+
+    def test_sessions_in_different_threads_share_one_backend_call(self):
+        results = self.run_from_threads([("track_order_status", {"order_id": "ORD-7"})])
+
+        self.assertEqual(["ORD-7"], self.calls)
+        self.assertEqual(1, len({r[0]["content"] for r in results}))
+        self.assertEqual(9, self.runner.flight.stats["coalesced"])
+
+    def test_ids_are_coalesced_after_normalization(self):
+        message_a = tool_call_message(("track_order_status", {"order_id": "ORD-8"}))
+        message_b = tool_call_message(("track_order_status", {"order_id": " ord-8"}))
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            list(pool.map(lambda m: self.runner.run(m.tool_calls), [message_a, message_b]))
+
+        self.assertEqual(1, len(self.calls))
+
+    def test_failure_reaches_every_waiter(self):
+        results = self.run_from_threads([("track_order_status", {"order_id": "ORD-BROKEN"})])
+
+        self.assertEqual(1, len(self.calls))
+        for result in results:
+            self.assertEqual(
+                {"error": "track_order_status failed: RuntimeError: carrier API returned 500"},
+                json.loads(result[0]["content"]),
+            )
+
+    def test_timeout_reaches_every_waiter(self):
+        self.delay = 1.0
+
+        results = self.run_from_threads([("track_order_status", {"order_id": "ORD-SLOW"})])
+
+        self.assertEqual(1, len(self.calls))
+        for result in results:
+            self.assertEqual({"error": "track_order_status timed out after 0.5s"}, json.loads(result[0]["content"]))
+
+    def test_tools_without_a_ttl_are_not_coalesced(self):
+        args = {"order_id": "ORD-7", "issue_type": "DELAYED", "customer_description": "late"}
+
+        self.run_from_threads([("report_delivery_issue", args)], sessions=4)
+
+        self.assertEqual(["ticket"] * 4, self.calls)
+
+    def test_arun_turn_from_many_coroutines(self):
+        llm = FakeStreamingClient(scripted_reply)
+
+        async def main():
+            return await asyncio.gather(*(
+                arun_turn("where is ORD-42?", [], llm, runner=self.runner) for _ in range(8)
+            ))
+
+        replies = asyncio.run(main())
+
+        self.assertEqual(["ORD-42"], self.calls)
+        self.assertEqual(1, len(set(replies)))
+        self.assertIn("IN_TRANSIT", replies[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import time
+import unittest
+
+from casanova_core.fakes import FakeStreamingClient, tool_call_message
+from casanova_core.llm import ChatDelta, StreamAssembler, ToolCallDelta
+from casanova_core.turn import ANSWER_MODEL, TOOL_CHOICE_MODEL, run_turn, stream_turn
+
+ORDER_ID = "ORD-12345678"
+
+
+class StreamAssemblerTests(unittest.TestCase):
+
+    def test_tool_call_fragments_are_assembled_per_index(self):
+        assembler = StreamAssembler()
+        for delta in [
+            ChatDelta(tool_calls=[ToolCallDelta(index=0, id="call_0", name="track_order_status")]),
+            ChatDelta(tool_calls=[ToolCallDelta(index=1, id="call_1", name="get_order_eta")]),
+            ChatDelta(tool_calls=[ToolCallDelta(index=0, arguments='{"order_')]),
+            ChatDelta(tool_calls=[ToolCallDelta(index=1, arguments='{"order_id": "B"}')]),
+            ChatDelta(tool_calls=[ToolCallDelta(index=0, arguments='id": "A"}')]),
+        ]:
+            self.assertEqual("", assembler.feed(delta))
+
+        message = assembler.message()
+
+        self.assertIsNone(message.content)
+        self.assertEqual(["call_0", "call_1"], [tc.id for tc in message.tool_calls])
+        self.assertEqual({"order_id": "A"}, json.loads(message.tool_calls[0].function.arguments))
+        self.assertEqual({"order_id": "B"}, json.loads(message.tool_calls[1].function.arguments))
+
+
+class StreamTurnTests(unittest.TestCase):
+
+    def test_answer_after_tool_calls_is_streamed_token_by_token(self):
+        llm = FakeStreamingClient([
+            tool_call_message(("track_order_status", {"order_id": ORDER_ID})),
+            "Your order is on its way.",
+        ], argument_chunk=4)
+
+        tokens = list(stream_turn(f"Where is {ORDER_ID}?", [], llm))
+
+        self.assertEqual(["Your ", "order ", "is ", "on ", "its ", "way."], tokens)
+        self.assertEqual([TOOL_CHOICE_MODEL, ANSWER_MODEL], [r["model"] for r in llm.requests])
+        tool_message = llm.requests[1]["messages"][-1]
+        self.assertEqual("call_0", tool_message["tool_call_id"])
+        self.assertEqual(ORDER_ID, json.loads(tool_message["content"])["order_id"])
+
+    def test_first_token_arrives_before_the_answer_is_complete(self):
+        llm = FakeStreamingClient(["one two three four five"], token_delay=0.05)
+
+        start = time.monotonic()
+        stream = stream_turn("hi", [], llm)
+        first = next(stream)
+        first_at = time.monotonic() - start
+        rest = "".join(stream)
+
+        self.assertEqual("one two three four five", first + rest)
+        self.assertLess(first_at, 0.05 * 3)
+
+    def test_streaming_and_blocking_turns_give_the_same_reply(self):
+        script = [tool_call_message(("get_order_eta", {"order_id": ORDER_ID})), "Arrives tomorrow."]
+
+        streamed = "".join(stream_turn("When?", [], FakeStreamingClient(list(script))))
+        blocking = run_turn("When?", [], FakeStreamingClient(list(script)))
+
+        self.assertEqual(blocking, streamed)
+
+
+if __name__ == "__main__":
+    unittest.main()
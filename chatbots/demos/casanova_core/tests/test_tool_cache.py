@@ -0,0 +1,119 @@
+import json
+import threading
+import unittest
+from types import SimpleNamespace
+
+from casanova_core.tool_cache import ToolResultCache, normalize_arguments
+from casanova_core.tool_runner import ToolRunner
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def tool_call(call_id, name, **arguments):
+    return SimpleNamespace(id=call_id, function=SimpleNamespace(name=name, arguments=json.dumps(arguments)))
+
+
+class ToolResultCacheTests(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.cache = ToolResultCache(max_entries=2, clock=self.clock)
+
+    def test_arguments_are_normalized(self):
+        self.assertEqual(
+            normalize_arguments({"order_id": " ord-42 "}),
+            normalize_arguments({"order_id": "ORD-42"}),
+        )
+        self.cache.put("get_order_eta", {"order_id": "ORD-42"}, {"eta": "x"}, ttl_seconds=10)
+
+        self.assertEqual((True, {"eta": "x"}), self.cache.get("get_order_eta", {"order_id": "ord-42"}))
+        self.assertEqual((False, None), self.cache.get("track_order_status", {"order_id": "ORD-42"}))
+
+    def test_entries_expire_after_their_ttl(self):
+        self.cache.put("track_order_status", {"order_id": "A"}, "status", ttl_seconds=60)
+
+        self.clock.now = 59.9
+        self.assertTrue(self.cache.get("track_order_status", {"order_id": "A"})[0])
+        self.clock.now = 60.0
+        self.assertFalse(self.cache.get("track_order_status", {"order_id": "A"})[0])
+        self.assertEqual(1, self.cache.stats.expired["track_order_status"])
+
+    def test_least_recently_used_entry_is_evicted(self):
+        self.cache.put("t", {"order_id": "A"}, 1, ttl_seconds=60)
+        self.cache.put("t", {"order_id": "B"}, 2, ttl_seconds=60)
+        self.cache.get("t", {"order_id": "A"})
+        self.cache.put("t", {"order_id": "C"}, 3, ttl_seconds=60)
+
+        self.assertEqual(2, len(self.cache))
+        self.assertTrue(self.cache.get("t", {"order_id": "A"})[0])
+        self.assertFalse(self.cache.get("t", {"order_id": "B"})[0])
+        self.assertEqual(1, self.cache.stats.evictions)
+
+    def test_metrics_snapshot(self):
+        self.cache.put("t", {"order_id": "A"}, 1, ttl_seconds=60)
+        self.cache.get("t", {"order_id": "A"})
+        self.cache.get("t", {"order_id": "B"})
+
+        snapshot = self.cache.stats.snapshot()
+
+        self.assertEqual((1, 1, 0.5), (snapshot["hits"], snapshot["misses"], snapshot["hit_rate"]))
+        self.assertEqual({"hits": 1, "misses": 1, "expired": 0, "hit_rate": 0.5}, snapshot["by_tool"]["t"])
+
+
+class CachedToolRunnerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+        def backend(name):
+            def tool(order_id=None, **kwargs):
+                with self.lock:
+                    self.calls.append((name, order_id))
+                return {"order_id": order_id, "call": len(self.calls)}
+            return tool
+
+        self.cache = ToolResultCache()
+        self.runner = ToolRunner(
+            {"track_order_status": backend("track"), "report_delivery_issue": backend("report")},
+            cache=self.cache,
+            cache_ttls={"track_order_status": 60.0, "report_delivery_issue": None},
+        )
+        self.addCleanup(self.runner.close)
+
+    def test_follow_up_about_the_same_order_is_served_from_cache(self):
+        first = self.runner.run([tool_call("c1", "track_order_status", order_id="ORD-1")])
+        second = self.runner.run([tool_call("c2", "track_order_status", order_id="ord-1")])
+
+        self.assertEqual([("track", "ORD-1")], self.calls)
+        self.assertEqual(first[0]["content"], second[0]["content"])
+        self.assertEqual("c2", second[0]["tool_call_id"])
+
+    def test_side_effecting_tool_opts_out(self):
+        for call_id in ("c1", "c2"):
+            self.runner.run([tool_call(call_id, "report_delivery_issue", order_id="ORD-1", issue_type="OTHER")])
+
+        self.assertEqual(2, len(self.calls))
+        self.assertEqual(0, self.cache.stats.snapshot()["misses"])
+
+    def test_errors_are_not_cached(self):
+        runner = ToolRunner(
+            {"track_order_status": lambda order_id: 1 / 0},
+            cache=self.cache,
+            cache_ttls={"track_order_status": 60.0},
+        )
+        self.addCleanup(runner.close)
+
+        runner.run([tool_call("c1", "track_order_status", order_id="ORD-9")])
+
+        self.assertEqual(0, len(self.cache))
+
+
+if __name__ == "__main__":
+    unittest.main()
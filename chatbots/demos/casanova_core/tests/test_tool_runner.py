@@ -0,0 +1,116 @@
+import asyncio
+import json
+import time
+import unittest
+from types import SimpleNamespace
+
+from casanova_core.tool_runner import ToolRunner
+from casanova_core.tools import tool_name_to_python_fn
+
+
+def tool_call(call_id, name, **arguments):
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(arguments)),
+    )
+
+
+def sleeping_tool(seconds):
+    def tool(order_id):
+        time.sleep(seconds)
+        return {"order_id": order_id, "slept": seconds}
+    return tool
+
+
+async def async_eta(order_id):
+    await asyncio.sleep(0.05)
+    return {"order_id": order_id, "eta_date": "2025-01-02"}
+
+
+def broken_tool(order_id):
+    raise ConnectionError("backend down")
+
+
+class ToolRunnerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.runner = ToolRunner(
+            {
+                "slow_status": sleeping_tool(0.3),
+                "fast_status": sleeping_tool(0.01),
+                "stuck": sleeping_tool(2.0),
+                "async_eta": async_eta,
+                "broken": broken_tool,
+            },
+            timeouts={"stuck": 0.2},
+            default_timeout=1.0,
+        )
+
+    def tearDown(self):
+        self.runner.close()
+
+    def test_tool_calls_run_concurrently(self):
+        calls = [tool_call(f"call_{i}", "slow_status", order_id=f"ORD-{i}") for i in range(4)]
+
+        start = time.monotonic()
+        results = self.runner.run(calls)
+        elapsed = time.monotonic() - start
+
+        self.assertEqual(4, len(results))
+        self.assertLess(elapsed, 0.3 * 2)
+
+    def test_results_come_back_in_tool_call_order(self):
+        calls = [
+            tool_call("call_a", "slow_status", order_id="ORD-1"),
+            tool_call("call_b", "fast_status", order_id="ORD-2"),
+            tool_call("call_c", "async_eta", order_id="ORD-3"),
+        ]
+
+        results = self.runner.run(calls)
+
+        self.assertEqual(["call_a", "call_b", "call_c"], [r["tool_call_id"] for r in results])
+        self.assertEqual(["slow_status", "fast_status", "async_eta"], [r["name"] for r in results])
+        self.assertEqual("ORD-3", json.loads(results[2]["content"])["order_id"])
+
+    def test_slow_tool_times_out_without_holding_back_the_others(self):
+        calls = [
+            tool_call("call_a", "stuck", order_id="ORD-1"),
+            tool_call("call_b", "fast_status", order_id="ORD-2"),
+        ]
+
+        start = time.monotonic()
+        results = self.runner.run(calls)
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.0)
+        self.assertIn("timed out", json.loads(results[0]["content"])["error"])
+        self.assertEqual("ORD-2", json.loads(results[1]["content"])["order_id"])
+
+    def test_failures_become_error_results(self):
+        calls = [
+            tool_call("call_a", "broken", order_id="ORD-1"),
+            tool_call("call_b", "no_such_tool"),
+            SimpleNamespace(id="call_c", function=SimpleNamespace(name="fast_status", arguments="{not json")),
+        ]
+
+        errors = [json.loads(r["content"])["error"] for r in self.runner.run(calls)]
+
+        self.assertIn("ConnectionError", errors[0])
+        self.assertEqual("Unknown tool: no_such_tool", errors[1])
+        self.assertIn("Invalid arguments", errors[2])
+
+    def test_casanova_stub_tools_run_through_the_runner(self):
+        runner = ToolRunner(tool_name_to_python_fn)
+        self.addCleanup(runner.close)
+
+        results = runner.run([
+            tool_call("call_1", "track_order_status", order_id="ORD-12345678"),
+            tool_call("call_2", "get_order_eta", order_id="ORD-12345678"),
+        ])
+
+        self.assertEqual("ORD-12345678", json.loads(results[0]["content"])["order_id"])
+        self.assertIn("eta_date", json.loads(results[1]["content"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
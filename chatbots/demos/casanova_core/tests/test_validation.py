@@ -0,0 +1,94 @@
+import json
+import unittest
+
+from casanova_core.fakes import tool_call_message
+from casanova_core.tool_runner import ToolRunner
+from casanova_core.tools import tools
+from casanova_core.validation import compile_schema, compile_tool_validators
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+VALIDATORS = compile_tool_validators(tools)
+
+
+class CompiledValidatorTests(unittest.TestCase):
+
+    def test_valid_arguments_have_no_problems(self):
+        self.assertEqual([], VALIDATORS["track_order_status"]({"order_id": "ORD-1"}))
+        self.assertEqual([], VALIDATORS["report_delivery_issue"](
+            {"issue_type": "POSSIBLY_LOST", "customer_description": "never came"}
+        ))
+
+    def test_enum_violation_lists_the_allowed_values(self):
+        problems = VALIDATORS["report_delivery_issue"]({"issue_type": "BROKEN", "customer_description": "x"})
+
+        self.assertEqual(["issue_type"], [p["path"] for p in problems])
+        self.assertIn("POSSIBLY_LOST", problems[0]["allowed"])
+
+    def test_missing_unexpected_and_mistyped_arguments_are_all_reported(self):
+        problems = VALIDATORS["report_delivery_issue"]({"order_id": 42, "issue": "late", "issue_type": "OTHER"})
+
+        self.assertEqual(
+            {("customer_description", "is required"), ("order_id", "expected string, got number"),
+             ("issue", "is not an allowed argument")},
+            {(p["path"], p["message"]) for p in problems},
+        )
+
+    def test_non_object_arguments_are_rejected(self):
+        self.assertEqual("expected object, got array", VALIDATORS["get_order_eta"](["ORD-1"])[0]["message"])
+
+    def test_nested_paths(self):
+        validate = compile_schema({
+            "type": "object",
+            "properties": {"items": {"type": "array", "items": {"type": "integer", "minimum": 1}, "maxItems": 2}},
+        })
+
+        self.assertEqual(["items[1]", "items[2]", "items"], [p["path"] for p in validate({"items": [1, 0, True]})])
+
+    def test_unsupported_keywords_fail_at_compile_time(self):
+        with self.assertRaises(ValueError):
+            compile_schema({"type": "object", "oneOf": [{"type": "string"}]})
+
+    @unittest.skipIf(jsonschema is None, "jsonschema not installed")
+    def test_agrees_with_jsonschema(self):
+        samples = [
+            {}, {"order_id": "ORD-1"}, {"order_id": None}, {"order_id": "ORD-1", "extra": 1},
+            {"issue_type": "DELAYED", "customer_description": "late"},
+            {"issue_type": "delayed", "customer_description": "late"},
+            {"issue_type": "DELAYED", "customer_description": 3, "order_id": "ORD-2"},
+        ]
+        for spec in tools:
+            schema = spec["function"]["parameters"]
+            for sample in samples:
+                with self.subTest(tool=spec["function"]["name"], sample=sample):
+                    expected = jsonschema.Draft202012Validator(schema).is_valid(sample)
+                    self.assertEqual(expected, not VALIDATORS[spec["function"]["name"]](sample))
+
+
+class RunnerValidationTests(unittest.TestCase):
+
+    def test_invalid_call_is_answered_with_problems_without_running_the_tool(self):
+        calls = []
+        runner = ToolRunner(
+            {"report_delivery_issue": lambda **kwargs: calls.append(kwargs) or {"ticket_id": "T-1"}},
+            validators=VALIDATORS,
+        )
+        self.addCleanup(runner.close)
+        message = tool_call_message(
+            ("report_delivery_issue", {"issue_type": "BROKEN", "customer_description": "crushed"}),
+            ("report_delivery_issue", {"issue_type": "OTHER", "customer_description": "crushed"}),
+        )
+
+        bad, good = [json.loads(m["content"]) for m in runner.run(message.tool_calls)]
+
+        self.assertEqual("issue_type", bad["problems"][0]["path"])
+        self.assertTrue(bad["error"].startswith("Invalid arguments for report_delivery_issue: issue_type:"))
+        self.assertEqual({"ticket_id": "T-1"}, good)
+        self.assertEqual(1, len(calls))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+# casanova_core/tool_cache.py
+# Process-wide cache of tool results, keyed on tool name + normalized arguments.
+
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+__all__ = ["CacheStats", "ToolResultCache", "normalize_arguments"]
+
+
+def _normalize(key: str, value: Any) -> Any:
+    if isinstance(value, str):
+        value = value.strip()
+        # Ids are case-insensitive for the backends ("ord-42" == "ORD-42").
+        return value.upper() if key.endswith("_id") else value
+    return value
+
+
+def normalize_arguments(tool_args: dict) -> str:
+    """Canonical form of a tool's arguments: normalized values, sorted keys, no whitespace."""
+    normalized = {k: _normalize(k, v) for k, v in tool_args.items() if v is not None}
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"))
+
+
+@dataclass
+class CacheStats:
+    hits: Counter = field(default_factory=Counter)
+    misses: Counter = field(default_factory=Counter)
+    expired: Counter = field(default_factory=Counter)
+    evictions: int = 0
+
+    def hit_rate(self, tool_name: str | None = None) -> float:
+        if tool_name is None:
+            hits, misses = sum(self.hits.values()), sum(self.misses.values())
+        else:
+            hits, misses = self.hits[tool_name], self.misses[tool_name]
+        return hits / (hits + misses) if hits + misses else 0.0
+
+    def snapshot(self) -> dict:
+        """Plain-dict metrics, e.g. for logging or a metrics endpoint."""
+        tools = sorted(set(self.hits) | set(self.misses))
+        return {
+            "hits": sum(self.hits.values()),
+            "misses": sum(self.misses.values()),
+            "hit_rate": self.hit_rate(),
+            "evictions": self.evictions,
+            "by_tool": {
+                name: {
+                    "hits": self.hits[name],
+                    "misses": self.misses[name],
+                    "expired": self.expired[name],
+                    "hit_rate": self.hit_rate(name),
+                }
+                for name in tools
+            },
+        }
+
+
+class ToolResultCache:
+    """
+    Bounded LRU cache of tool results with a per-entry expiry time.
+
+    Thread-safe, so a single instance can be shared by every Streamlit session
+    (and every tool-runner thread) in the process. ``clock`` is injectable so
+    expiry can be tested without sleeping.
+    """
+
+    def __init__(self, max_entries: int = 1024, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.clock = clock
+        self.stats = CacheStats()
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, tool_name: str, tool_args: dict) -> tuple[bool, Any]:
+        """(True, result) on a fresh hit, (False, None) otherwise."""
+        key = (tool_name, normalize_arguments(tool_args))
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, result = entry
+                if self.clock() < expires_at:
+                    self._entries.move_to_end(key)
+                    self.stats.hits[tool_name] += 1
+                    return True, result
+                del self._entries[key]
+                self.stats.expired[tool_name] += 1
+            self.stats.misses[tool_name] += 1
+            return False, None
+
+    def put(self, tool_name: str, tool_args: dict, result: Any, ttl_seconds: float) -> None:
+        key = (tool_name, normalize_arguments(tool_args))
+        with self._lock:
+            self._entries[key] = (self.clock() + ttl_seconds, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
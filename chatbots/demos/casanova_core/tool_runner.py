@@ -0,0 +1,246 @@
+# casanova_core/tool_runner.py
+# Runs the tool calls of one model turn concurrently.
+
+import asyncio
+import inspect
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Any, Callable
+
+from .singleflight import EventLoopThread, SingleFlight
+from .tool_cache import ToolResultCache, normalize_arguments
+from .validation import Problem, format_problems
+
+__all__ = ["ToolRunner", "AsyncToolRunner", "tool_message"]
+
+DEFAULT_TIMEOUT_SECONDS = 10.0
+
+
+class ToolRunner:
+    """
+    Executes a turn's ``tool_calls`` on a shared thread pool.
+
+    - every call starts immediately, so the turn waits for the slowest tool
+      instead of the sum of all of them
+    - ``async def`` tools are run to completion on their own event loop
+      inside the worker thread
+    - each tool has its own timeout; a tool that misses it (or raises) gets an
+      ``{"error": ...}`` result so the model can still answer
+    - results come back as ``role: tool`` messages in the order of the
+      model's ``tool_calls``, each tagged with its ``tool_call_id``
+
+    A timed-out call cannot be interrupted; its thread finishes in the
+    background and the late result is dropped.
+
+    With a ``cache``, tools listed in ``cache_ttls`` with a TTL are answered
+    from it while the entry is fresh; tools without a TTL (side effects,
+    e.g. opening a ticket) always run.
+
+    With ``validators`` (see ``validation.compile_tool_validators``), the
+    arguments are checked against the tool's schema before dispatch; a call
+    that fails gets ``{"error": ..., "problems": [...]}`` back without the
+    tool running, so the model can correct the call.
+    """
+
+    def __init__(
+        self,
+        functions: dict[str, Callable[..., Any]],
+        timeouts: dict[str, float] | None = None,
+        default_timeout: float = DEFAULT_TIMEOUT_SECONDS,
+        max_workers: int = 8,
+        cache: ToolResultCache | None = None,
+        cache_ttls: dict[str, float | None] | None = None,
+        validators: dict[str, Callable[[Any], list[Problem]]] | None = None,
+    ):
+        self.functions = functions
+        self.timeouts = timeouts or {}
+        self.cache = cache
+        self.cache_ttls = cache_ttls or {}
+        self.validators = validators or {}
+        self.default_timeout = default_timeout
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="casanova-tool"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def timeout_for(self, tool_name: str) -> float:
+        return self.timeouts.get(tool_name, self.default_timeout)
+
+    def call(self, tool_name: str, tool_args: dict) -> Any:
+        """Runs one tool synchronously, awaiting it if it is a coroutine function."""
+        python_fn = self.functions[tool_name]
+        result = python_fn(**tool_args)
+        if inspect.isawaitable(result):
+            result = asyncio.run(_awaited(result))
+        return result
+
+    def _call_and_cache(self, tool_name: str, tool_args: dict, ttl: float) -> Any:
+        result = self.call(tool_name, tool_args)
+        # Stored from the worker thread, so even a result that arrives after
+        # the turn's timeout serves the next request.
+        self.cache.put(tool_name, tool_args, result, ttl)
+        return result
+
+    def prepare(self, tool_call) -> tuple[dict | None, dict | None]:
+        """
+        Decodes and checks one tool call before dispatch. Returns
+        ``(tool_args, None)`` for a call that can run, or ``(None, error)``
+        with the ``{"error": ...}`` result to send back instead.
+        """
+        tool_name = tool_call.function.name
+        try:
+            tool_args = json.loads(tool_call.function.arguments or "{}")
+        except json.JSONDecodeError as ex:
+            return None, {"error": f"Invalid arguments for {tool_name}: {ex}"}
+        if tool_name not in self.functions:
+            return None, {"error": f"Unknown tool: {tool_name}"}
+        validate = self.validators.get(tool_name)
+        problems = validate(tool_args) if validate is not None else None
+        if problems:
+            error = f"Invalid arguments for {tool_name}: {format_problems(problems)}"
+            return None, {"error": error, "problems": problems}
+        return tool_args, None
+
+    def cache_ttl(self, tool_name: str) -> float | None:
+        return self.cache_ttls.get(tool_name) if self.cache is not None else None
+
+    def run(self, tool_calls: list) -> list[dict]:
+        """
+        tool_calls: the ``tool_calls`` of an assistant message (objects with
+        ``.id`` and ``.function.name`` / ``.function.arguments``).
+        Returns the matching ``role: tool`` messages, in the same order.
+        """
+        started = time.monotonic()
+        pending = []
+        for tool_call in tool_calls:
+            tool_name = tool_call.function.name
+            tool_args, error = self.prepare(tool_call)
+            if error is not None:
+                pending.append((tool_call, None, error))
+                continue
+            ttl = self.cache_ttl(tool_name)
+            if ttl:
+                hit, cached = self.cache.get(tool_name, tool_args)
+                if hit:
+                    pending.append((tool_call, None, cached))
+                    continue
+                future = self._pool().submit(self._call_and_cache, tool_name, tool_args, ttl)
+            else:
+                future = self._pool().submit(self.call, tool_name, tool_args)
+            pending.append((tool_call, future, None))
+
+        tool_results_messages = []
+        for tool_call, future, tool_output in pending:
+            tool_name = tool_call.function.name
+            if future is not None:
+                timeout = self.timeout_for(tool_name)
+                remaining = max(0.0, started + timeout - time.monotonic())
+                try:
+                    tool_output = future.result(timeout=remaining)
+                except FutureTimeout:
+                    future.cancel()
+                    tool_output = {"error": f"{tool_name} timed out after {timeout:g}s"}
+                except Exception as ex:
+                    tool_output = {"error": f"{tool_name} failed: {type(ex).__name__}: {ex}"}
+            tool_results_messages.append(tool_message(tool_call, tool_output))
+        return tool_results_messages
+
+
+def tool_message(tool_call, tool_output: Any) -> dict:
+    return {
+        "role": "tool",
+        "tool_call_id": tool_call.id,
+        "name": tool_call.function.name,
+        "content": json.dumps(tool_output),
+    }
+
+
+class AsyncToolRunner:
+    """
+    Runs tool calls on one shared event loop, coalescing identical calls
+    that are in flight at the same time (same tool, same normalized
+    arguments) into a single backend request.
+
+    Everything else comes from the wrapped ``ToolRunner``: functions,
+    validation, per-tool timeouts, the result cache and its thread pool for
+    plain (blocking) tools; ``async def`` tools are awaited on the loop.
+    Only tools with a cache TTL are coalesced, since those are the
+    idempotent reads; a tool without one (opening a ticket) runs per call.
+
+    A coalesced call that fails or times out fails for every waiter, each of
+    which gets the same ``{"error": ...}`` result. ``arun`` can be awaited
+    from any event loop and ``run`` called from any thread (so it can stand
+    in for ``ToolRunner`` in ``run_turn``/``stream_turn``); the work always
+    happens on the runner's own loop, which is what lets sessions running in
+    different threads share in-flight calls.
+    """
+
+    def __init__(self, runner: ToolRunner, loop: EventLoopThread | None = None):
+        self.runner = runner
+        self.loop = loop or EventLoopThread()
+        self.flight = SingleFlight()
+
+    def coalesces(self, tool_name: str) -> bool:
+        return bool(self.runner.cache_ttls.get(tool_name))
+
+    async def _invoke(self, tool_name: str, tool_args: dict) -> Any:
+        python_fn = self.runner.functions[tool_name]
+        timeout = self.runner.timeout_for(tool_name)
+        ttl = self.runner.cache_ttl(tool_name)
+        if inspect.iscoroutinefunction(python_fn):
+            result = await asyncio.wait_for(python_fn(**tool_args), timeout)
+            if ttl:
+                self.runner.cache.put(tool_name, tool_args, result, ttl)
+            return result
+        loop = asyncio.get_running_loop()
+        if ttl:
+            work = loop.run_in_executor(self.runner._pool(), self.runner._call_and_cache, tool_name, tool_args, ttl)
+        else:
+            work = loop.run_in_executor(self.runner._pool(), self.runner.call, tool_name, tool_args)
+        return await asyncio.wait_for(work, timeout)
+
+    async def _one(self, tool_call) -> dict:
+        tool_name = tool_call.function.name
+        tool_args, error = self.runner.prepare(tool_call)
+        if error is not None:
+            return tool_message(tool_call, error)
+        if self.runner.cache_ttl(tool_name):
+            hit, cached = self.runner.cache.get(tool_name, tool_args)
+            if hit:
+                return tool_message(tool_call, cached)
+        try:
+            if self.coalesces(tool_name):
+                key = (tool_name, normalize_arguments(tool_args))
+                tool_output = await self.flight.do(key, lambda: self._invoke(tool_name, tool_args))
+            else:
+                tool_output = await self._invoke(tool_name, tool_args)
+        except asyncio.TimeoutError:
+            tool_output = {"error": f"{tool_name} timed out after {self.runner.timeout_for(tool_name):g}s"}
+        except Exception as ex:
+            tool_output = {"error": f"{tool_name} failed: {type(ex).__name__}: {ex}"}
+        return tool_message(tool_call, tool_output)
+
+    async def _run_here(self, tool_calls: list) -> list[dict]:
+        return list(await asyncio.gather(*(self._one(tool_call) for tool_call in tool_calls)))
+
+    async def arun(self, tool_calls: list) -> list[dict]:
+        """Async ``ToolRunner.run``: the ``role: tool`` messages, in tool_call order."""
+        return await asyncio.wrap_future(self.loop.submit(self._run_here(tool_calls)))
+
+    def run(self, tool_calls: list) -> list[dict]:
+        return self.loop.run(self._run_here(tool_calls))
+
+
+async def _awaited(awaitable):
+    return await awaitable
@@ -0,0 +1,207 @@
+# casanova_core/tools.py
+# Tool schemas, backend stubs and the dispatch table used by Casanova.
+# Kept free of Streamlit/OpenAI imports so it can be used (and tested) offline.
+
+import random
+from datetime import datetime, timedelta
+
+from .tool_cache import ToolResultCache
+from .tool_runner import AsyncToolRunner, ToolRunner
+from .validation import compile_tool_validators
+
+__all__ = [
+    "tools",
+    "track_order_status",
+    "get_order_eta",
+    "report_delivery_issue",
+    "tool_name_to_python_fn",
+    "tool_intents",
+    "tool_timeouts",
+    "tool_cache_ttls",
+    "tool_validators",
+    "tool_result_cache",
+    "tool_runner",
+    "async_tool_runner",
+]
+
+# -------------------------------------------------------------------
+# Tool definitions (intents → 3 tools)
+# -------------------------------------------------------------------
+
+tools = [
+    {
+        "type": "function",
+        "function": {
+            "name": "track_order_status",
+            "description": (
+                "TRACK_STATUS intent. "
+                "Get detailed tracking status and current location of a customer's order."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "order_id": {
+                        "type": "string",
+                        "description": "The customer's order ID as provided in the conversation.",
+                    }
+                },
+                "required": ["order_id"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "get_order_eta",
+            "description": (
+                "ASK_ETA intent. "
+                "Get the estimated delivery date/time of the customer's order."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "order_id": {
+                        "type": "string",
+                        "description": "The customer's order ID as provided in the conversation.",
+                    }
+                },
+                "required": ["order_id"],
+                "additionalProperties": False,
+            },
+        },
+    },
+    {
+        "type": "function",
+        "function": {
+            "name": "report_delivery_issue",
+            "description": (
+                "REPORT_ISSUE intent. "
+                "Create or update an issue ticket when the customer reports a delay, "
+                "non-receipt, tracking problems, or a possibly lost parcel."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "order_id": {
+                        "type": "string",
+                        "description": "The customer's order ID if known.",
+                    },
+                    "issue_type": {
+                        "type": "string",
+                        "description": "High-level category of the issue.",
+                        "enum": [
+                            "DELAYED",
+                            "NOT_RECEIVED",
+                            "TRACKING_NOT_UPDATING",
+                            "POSSIBLY_LOST",
+                            "OTHER",
+                        ],
+                    },
+                    "customer_description": {
+                        "type": "string",
+                        "description": "Free-text description of the problem in customer's own words.",
+                    },
+                },
+                "required": ["issue_type", "customer_description"],
+                "additionalProperties": False,
+            },
+        },
+    },
+]
+
+# -------------------------------------------------------------------
+# Backend stub implementations (replace with real Casanova/backends)
+# -------------------------------------------------------------------
+
+def track_order_status(order_id: str) -> dict:
+    sample_statuses = [
+        ("In transit", "Regional hub", -2),
+        ("With courier", "Local delivery depot", -1),
+        ("Out for delivery", "On delivery vehicle", 0),
+        ("Delivered", "Customer's address", -1),
+    ]
+    status, location, days_offset = random.choice(sample_statuses)
+    last_scan = (datetime.utcnow() + timedelta(days=days_offset)).isoformat() + "Z"
+    return {
+        "order_id": order_id,
+        "status": status,
+        "current_location": location,
+        "last_scan_timestamp_utc": last_scan,
+        "carrier": "DemoCarrier Express",
+    }
+
+
+def get_order_eta(order_id: str) -> dict:
+    today = datetime.utcnow().date()
+    eta_date = today + timedelta(days=random.randint(0, 4))
+    return {
+        "order_id": order_id,
+        "eta_date": eta_date.isoformat(),
+        "eta_window_local": "09:00–12:00",
+        "still_on_schedule": random.choice([True, True, False]),
+    }
+
+
+def report_delivery_issue(
+    order_id: str | None = None,
+    issue_type: str = "OTHER",
+    customer_description: str = "",
+) -> dict:
+    ticket_id = f"TICKET-{random.randint(100000, 999999)}"
+    return {
+        "ticket_id": ticket_id,
+        "order_id": order_id,
+        "issue_type": issue_type,
+        "customer_description": customer_description,
+        "status": "OPEN",
+        "created_at_utc": datetime.utcnow().isoformat() + "Z",
+        "next_step": "Our support team will review this case and contact the customer if needed.",
+    }
+
+
+tool_name_to_python_fn = {
+    "track_order_status": track_order_status,
+    "get_order_eta": get_order_eta,
+    "report_delivery_issue": report_delivery_issue,
+}
+
+tool_intents = {
+    "track_order_status": "TRACK_STATUS",
+    "get_order_eta": "ASK_ETA",
+    "report_delivery_issue": "REPORT_ISSUE",
+}
+
+# Seconds each tool may take before the turn continues without its result.
+tool_timeouts = {
+    "track_order_status": 5.0,
+    "get_order_eta": 5.0,
+    "report_delivery_issue": 10.0,
+}
+
+# How long (seconds) a tool's result may be reused for the same arguments.
+# None opts a tool out: report_delivery_issue opens a ticket on every call.
+tool_cache_ttls = {
+    "track_order_status": 60.0,
+    "get_order_eta": 300.0,
+    "report_delivery_issue": None,
+}
+
+# Compiled once at import; arguments are checked before a tool runs.
+tool_validators = compile_tool_validators(tools)
+
+# Shared by every session in the process.
+tool_result_cache = ToolResultCache(max_entries=1024)
+
+# Shared by every session in the process; runs one turn's tool calls concurrently.
+tool_runner = ToolRunner(
+    tool_name_to_python_fn,
+    timeouts=tool_timeouts,
+    cache=tool_result_cache,
+    cache_ttls=tool_cache_ttls,
+    validators=tool_validators,
+)
+
+# Shared by every session in the process; identical lookups that overlap in
+# time (many sessions asking about one order) share a single backend call.
+async_tool_runner = AsyncToolRunner(tool_runner)
@@ -0,0 +1,203 @@
+# casanova_core/turn.py
+# One Casanova conversation turn: tool-choosing call, tools, answering call.
+
+import os
+import time
+from typing import Callable, Iterator
+
+from .llm import LLMClient, StreamAssembler
+from .router import IntentRouter
+from .tools import async_tool_runner, tool_runner, tools
+
+__all__ = [
+    "Casanova_CONTEXT",
+    "system_message",
+    "TOOL_CHOICE_MODEL",
+    "ANSWER_MODEL",
+    "compose_messages",
+    "run_turn",
+    "arun_turn",
+    "stream_turn",
+]
+
+# -------------------------------------------------------------------
+# System / Casanova context
+# -------------------------------------------------------------------
+
+Casanova_CONTEXT = """
+You are an AI customer service agent built on Casanova for a regulated
+insurance/finance e-commerce company operating across multiple countries
+(e.g., Germany, EU, US).
+
+The company uses Casanova to build agents for:
+- Order tracking (“Where is my package?”)
+- Returns & refunds
+- FAQs (opening hours, policies, coverage, prices)
+
+Agents run over phone (voice) and web chat. The environment is regulated,
+so security, privacy, and auditability really matter.
+
+You are currently focused on ORDER TRACKING-style requests only.
+
+You MUST use the appropriate tools:
+
+INTENTS → TOOLS
+- TRACK_STATUS:
+  - User asks “where is my order/parcel/package/shipment”,
+    “current status”, “last scan”, “with courier?”, “left warehouse?” etc.
+  - Use tool: track_order_status
+
+- ASK_ETA:
+  - User asks “when will it arrive”, “expected delivery date/time”,
+    “still scheduled for today?”, “close to being delivered?” etc.
+  - Use tool: get_order_eta
+
+- REPORT_ISSUE:
+  - User reports delays, missing package, “I haven’t received it yet”,
+    “tracking not updating”, “is it lost?” etc.
+  - Use tool: report_delivery_issue (in addition to other tools if needed).
+
+If the user mentions order, package, shipment, parcel, or delivery,
+try to collect an order_id (if missing) in a short clarification question
+before calling tools.
+
+You must never invent actual customer data. Tool outputs simulate a backend.
+"""
+
+system_message = {"role": "system", "content": Casanova_CONTEXT}
+
+# Overridable per deployment, e.g. to point at a proxy's model aliases.
+TOOL_CHOICE_MODEL = os.environ.get("CASANOVA_TOOL_CHOICE_MODEL", "gpt-4o")
+ANSWER_MODEL = os.environ.get("CASANOVA_ANSWER_MODEL", "gpt-4o-mini")
+
+# -------------------------------------------------------------------
+# Chat + tool-calling orchestration (one turn)
+# -------------------------------------------------------------------
+
+def compose_messages(user_input: str, chat_history: list[dict]) -> list[dict]:
+    return [system_message] + chat_history + [{"role": "user", "content": user_input}]
+
+
+def run_turn(
+    user_input: str,
+    chat_history: list[dict],
+    llm: LLMClient,
+    runner=None,
+    on_tool_calls: Callable[[list], None] | None = None,
+    router: IntentRouter | None = None,
+) -> str:
+    """
+    chat_history: list of {"role": "user"|"assistant", "content": "..."}
+    Returns assistant's final text reply after any tool calls.
+    on_tool_calls: called with the tool calls the model asked for, if any.
+    router: pre-router that can pick the tool call without the first model call.
+    """
+    runner = runner or tool_runner
+    messages = compose_messages(user_input, chat_history)
+
+    route = router.route(user_input) if router is not None else None
+    if route is not None:
+        router.record_hit(route)
+        assistant_message = route.to_message("routed_0")
+    else:
+        # First call – model decides whether to call tools
+        started = time.monotonic()
+        assistant_message = llm.complete(TOOL_CHOICE_MODEL, messages, tools=tools, tool_choice="auto")
+        if router is not None:
+            router.record_fallback(time.monotonic() - started)
+
+    # No tools needed
+    if not assistant_message.tool_calls:
+        return assistant_message.content
+
+    if on_tool_calls is not None:
+        on_tool_calls(assistant_message.tool_calls)
+
+    # All tool calls of the turn run concurrently, each with its own
+    # timeout; results come back in tool_call order.
+    messages.append(assistant_message.to_message())
+    messages.extend(runner.run(assistant_message.tool_calls))
+
+    # Second call – model uses tool outputs to answer user
+    return llm.complete(ANSWER_MODEL, messages).content
+
+
+async def arun_turn(
+    user_input: str,
+    chat_history: list[dict],
+    llm: LLMClient,
+    runner=None,
+    on_tool_calls: Callable[[list], None] | None = None,
+    router: IntentRouter | None = None,
+) -> str:
+    """
+    ``run_turn`` for asyncio callers. Model calls go through
+    ``llm.acomplete`` and tool calls through ``AsyncToolRunner.arun``
+    (``async_tool_runner`` by default), so concurrent turns asking for the
+    same order share one backend call.
+    """
+    runner = runner or async_tool_runner
+    messages = compose_messages(user_input, chat_history)
+
+    route = router.route(user_input) if router is not None else None
+    if route is not None:
+        router.record_hit(route)
+        assistant_message = route.to_message("routed_0")
+    else:
+        started = time.monotonic()
+        assistant_message = await llm.acomplete(TOOL_CHOICE_MODEL, messages, tools=tools, tool_choice="auto")
+        if router is not None:
+            router.record_fallback(time.monotonic() - started)
+
+    if not assistant_message.tool_calls:
+        return assistant_message.content
+
+    if on_tool_calls is not None:
+        on_tool_calls(assistant_message.tool_calls)
+    messages.append(assistant_message.to_message())
+    messages.extend(await runner.arun(assistant_message.tool_calls))
+
+    return (await llm.acomplete(ANSWER_MODEL, messages)).content
+
+
+def stream_turn(
+    user_input: str,
+    chat_history: list[dict],
+    llm: LLMClient,
+    runner=None,
+    on_tool_calls: Callable[[list], None] | None = None,
+    router: IntentRouter | None = None,
+) -> Iterator[str]:
+    """
+    Same turn as ``run_turn``, yielding the reply text as it is generated.
+    Tool-call deltas of the first call are assembled while they stream in.
+    """
+    runner = runner or tool_runner
+    messages = compose_messages(user_input, chat_history)
+
+    route = router.route(user_input) if router is not None else None
+    if route is not None:
+        router.record_hit(route)
+        assistant_message = route.to_message("routed_0")
+    else:
+        started = time.monotonic()
+        assembler = StreamAssembler()
+        for delta in llm.stream(TOOL_CHOICE_MODEL, messages, tools=tools, tool_choice="auto"):
+            text = assembler.feed(delta)
+            if text:
+                yield text
+        assistant_message = assembler.message()
+        if router is not None:
+            router.record_fallback(time.monotonic() - started)
+
+    if not assistant_message.tool_calls:
+        return
+
+    if on_tool_calls is not None:
+        on_tool_calls(assistant_message.tool_calls)
+    messages.append(assistant_message.to_message())
+    messages.extend(runner.run(assistant_message.tool_calls))
+
+    for delta in llm.stream(ANSWER_MODEL, messages):
+        if delta.content:
+            yield delta.content
@@ -0,0 +1,254 @@
+# casanova_core/validation.py
+# Tool-argument validation: each tool's JSON schema compiled once into plain
+# Python checks, run before dispatch (timed against jsonschema by
+# ``python -m casanova_core.validation_bench``).
+#
+# Covers the JSON-schema subset tool definitions use (type, properties,
+# required, additionalProperties, enum, const, string/number/array bounds,
+# pattern, items). A keyword outside that subset is rejected when the schema
+# is compiled, so a schema is never silently half-checked.
+#
+# contract_core/validation.py compiles the same keyword subset for the skill
+# contracts; the two are kept separate on purpose. casanova_core does not
+# depend on contract_core, and the output here is for the model, not for
+# operators: problems are dicts with argument names ("issue_type", not
+# "$.issue_type") and the ``allowed`` values, sent back as the tool result
+# so the model can retry the call. Tool schemas are a few fields checked once
+# per call, so closures are enough; the contract compiler generates source
+# because it also runs over whole recorded archives. Keep the two keyword
+# sets in step.
+
+import json
+import re
+from typing import Any, Callable
+
+__all__ = ["Problem", "compile_schema", "compile_tool_validators", "format_problems"]
+
+# A validation failure: {"path": "issue_type", "message": "...", ["allowed": [...]]}
+Problem = dict
+Check = Callable[[Any, str, list], None]
+
+ANNOTATIONS = {"$id", "$schema", "$comment", "title", "description", "default", "examples"}
+
+_TYPES: dict[str, Callable[[Any], bool]] = {
+    "object": lambda v: isinstance(v, dict),
+    "array": lambda v: isinstance(v, list),
+    "string": lambda v: isinstance(v, str),
+    "integer": lambda v: (isinstance(v, int) and not isinstance(v, bool)) or (isinstance(v, float) and v.is_integer()),
+    "number": lambda v: isinstance(v, (int, float)) and not isinstance(v, bool),
+    "boolean": lambda v: isinstance(v, bool),
+    "null": lambda v: v is None,
+}
+
+
+def _child(path: str, key: str | int) -> str:
+    if isinstance(key, int):
+        return f"{path}[{key}]"
+    return f"{path}.{key}" if path else key
+
+
+def _problem(problems: list, path: str, message: str, **extra) -> None:
+    problems.append(dict(path=path, message=message, **extra))
+
+
+# -------------------------------------------------------------------
+# Compilation
+# -------------------------------------------------------------------
+
+def _compile(schema: dict) -> Check:
+    unknown = set(schema) - ANNOTATIONS - _KEYWORDS
+    if unknown:
+        raise ValueError(f"unsupported schema keywords: {sorted(unknown)}")
+
+    checks: list[Check] = []
+
+    if "type" in schema:
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        tests = [_TYPES[name] for name in names]
+        expected = " or ".join(names)
+        typed = tests[0] if len(tests) == 1 else (lambda v: any(test(v) for test in tests))
+
+        # Every other check assumes the type matched, so a wrong type stops here.
+        def check_type(value, path, problems):
+            if not typed(value):
+                _problem(problems, path, f"expected {expected}, got {_type_name(value)}")
+                return False
+            return True
+    else:
+        check_type = None
+
+    if "enum" in schema:
+        allowed = list(schema["enum"])
+        allowed_set = {json.dumps(v, sort_keys=True) for v in allowed}
+        hashable = all(isinstance(v, (str, int, float, bool, type(None))) for v in allowed)
+        members = frozenset((type(v), v) for v in allowed) if hashable else None
+
+        def check_enum(value, path, problems):
+            if members is not None:
+                ok = isinstance(value, (str, int, float, bool, type(None))) and (type(value), value) in members
+            else:
+                ok = json.dumps(value, sort_keys=True) in allowed_set
+            if not ok:
+                _problem(problems, path, f"{value!r} is not one of {allowed}", allowed=allowed)
+
+        checks.append(check_enum)
+
+    if "const" in schema:
+        const = schema["const"]
+
+        def check_const(value, path, problems):
+            if value != const or type(value) is not type(const):
+                _problem(problems, path, f"expected {const!r}, got {value!r}")
+
+        checks.append(check_const)
+
+    checks += _string_checks(schema) + _number_checks(schema) + _object_checks(schema) + _array_checks(schema)
+
+    if check_type is None:
+        def check(value, path, problems):
+            for c in checks:
+                c(value, path, problems)
+    else:
+        def check(value, path, problems):
+            if check_type(value, path, problems):
+                for c in checks:
+                    c(value, path, problems)
+
+    return check
+
+
+def _type_name(value: Any) -> str:
+    for name, test in _TYPES.items():
+        if name != "integer" and test(value):
+            return name
+    return type(value).__name__
+
+
+def _string_checks(schema: dict) -> list[Check]:
+    checks: list[Check] = []
+    if "minLength" in schema or "maxLength" in schema:
+        low, high = schema.get("minLength", 0), schema.get("maxLength")
+
+        def check_length(value, path, problems):
+            if isinstance(value, str) and (len(value) < low or (high is not None and len(value) > high)):
+                _problem(problems, path, f"length {len(value)} is outside [{low}, {'' if high is None else high}]")
+
+        checks.append(check_length)
+    if "pattern" in schema:
+        pattern = re.compile(schema["pattern"])
+
+        def check_pattern(value, path, problems):
+            if isinstance(value, str) and not pattern.search(value):
+                _problem(problems, path, f"{value!r} does not match {pattern.pattern!r}")
+
+        checks.append(check_pattern)
+    return checks
+
+
+def _number_checks(schema: dict) -> list[Check]:
+    bounds = [
+        (key, op, schema[key])
+        for key, op in (
+            ("minimum", lambda v, b: v >= b),
+            ("maximum", lambda v, b: v <= b),
+            ("exclusiveMinimum", lambda v, b: v > b),
+            ("exclusiveMaximum", lambda v, b: v < b),
+        )
+        if key in schema
+    ]
+    if not bounds:
+        return []
+
+    def check_bounds(value, path, problems):
+        if not _TYPES["number"](value):
+            return
+        for key, op, bound in bounds:
+            if not op(value, bound):
+                _problem(problems, path, f"{value!r} violates {key} {bound!r}")
+
+    return [check_bounds]
+
+
+def _object_checks(schema: dict) -> list[Check]:
+    properties = {name: _compile(sub) for name, sub in schema.get("properties", {}).items()}
+    required = list(schema.get("required", []))
+    extra = schema.get("additionalProperties", True)
+    extra_check = _compile(extra) if isinstance(extra, dict) else None
+    if not (properties or required or extra is not True):
+        return []
+
+    def check_object(value, path, problems):
+        if not isinstance(value, dict):
+            return
+        for name in required:
+            if name not in value:
+                _problem(problems, _child(path, name), "is required")
+        for name, item in value.items():
+            sub = properties.get(name)
+            if sub is not None:
+                sub(item, _child(path, name), problems)
+            elif extra is False:
+                _problem(problems, _child(path, name), "is not an allowed argument", allowed=list(properties))
+            elif extra_check is not None:
+                extra_check(item, _child(path, name), problems)
+
+    return [check_object]
+
+
+def _array_checks(schema: dict) -> list[Check]:
+    checks: list[Check] = []
+    if "items" in schema:
+        items = _compile(schema["items"])
+
+        def check_items(value, path, problems):
+            if isinstance(value, list):
+                for i, item in enumerate(value):
+                    items(item, _child(path, i), problems)
+
+        checks.append(check_items)
+    if "minItems" in schema or "maxItems" in schema:
+        low, high = schema.get("minItems", 0), schema.get("maxItems")
+
+        def check_count(value, path, problems):
+            if isinstance(value, list) and (len(value) < low or (high is not None and len(value) > high)):
+                _problem(problems, path, f"{len(value)} items is outside [{low}, {'' if high is None else high}]")
+
+        checks.append(check_count)
+    return checks
+
+
+_KEYWORDS = {
+    "type", "enum", "const",
+    "minLength", "maxLength", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+    "properties", "required", "additionalProperties",
+    "items", "minItems", "maxItems",
+}
+
+
+def compile_schema(schema: dict) -> Callable[[Any], list[Problem]]:
+    """
+    Compiles ``schema`` into a function returning the list of problems with
+    a value (empty when it is valid). Raises ValueError for keywords outside
+    the supported subset.
+    """
+    check = _compile(schema)
+
+    def validate(value: Any) -> list[Problem]:
+        problems: list[Problem] = []
+        check(value, "", problems)
+        return problems
+
+    return validate
+
+
+def compile_tool_validators(tool_specs: list[dict]) -> dict[str, Callable[[Any], list[Problem]]]:
+    """One validator per tool in an OpenAI ``tools`` list, keyed by function name."""
+    return {
+        spec["function"]["name"]: compile_schema(spec["function"].get("parameters") or {"type": "object"})
+        for spec in tool_specs
+    }
+
+
+def format_problems(problems: list[Problem]) -> str:
+    return "; ".join(f"{p['path'] or 'arguments'}: {p['message']}" for p in problems)
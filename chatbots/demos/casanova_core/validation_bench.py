@@ -0,0 +1,70 @@
+# casanova_core/validation_bench.py
+# Times the compiled tool-argument validators against jsonschema.
+#
+#   python -m casanova_core.validation_bench --number 20000
+
+import argparse
+import sys
+import timeit
+
+from .tools import tools
+from .validation import compile_tool_validators
+
+__all__ = ["BENCH_CALLS", "benchmark"]
+
+
+BENCH_CALLS = [
+    ("track_order_status", {"order_id": "ORD-12345678"}),
+    ("get_order_eta", {"order_id": "ORD-12345678"}),
+    ("report_delivery_issue", {"order_id": "ORD-1", "issue_type": "DELAYED", "customer_description": "late"}),
+    ("report_delivery_issue", {"issue_type": "BROKEN", "customer_description": "box crushed"}),
+    ("track_order_status", {"order": "ORD-1"}),
+]
+
+
+def benchmark(tool_specs: list[dict], calls=BENCH_CALLS, number: int = 20000) -> dict[str, float]:
+    """Microseconds per validated call for the compiled validators and for jsonschema."""
+    validators = compile_tool_validators(tool_specs)
+    results = {
+        "compiled": timeit.timeit(lambda: [validators[n](a) for n, a in calls], number=number),
+    }
+    try:
+        import jsonschema
+    except ImportError:
+        pass
+    else:
+        schemas = {spec["function"]["name"]: spec["function"]["parameters"] for spec in tool_specs}
+
+        def naive():
+            for name, args in calls:
+                try:
+                    jsonschema.validate(args, schemas[name])
+                except jsonschema.ValidationError:
+                    pass
+
+        prepared = {name: jsonschema.validators.validator_for(s)(s) for name, s in schemas.items()}
+        # jsonschema.validate re-checks the schema and builds a validator on
+        # every call; a prepared validator is the fair jsonschema baseline.
+        results["jsonschema.validate"] = timeit.timeit(naive, number=max(1, number // 20)) * 20
+        results["jsonschema prepared"] = timeit.timeit(
+            lambda: [list(prepared[n].iter_errors(a)) for n, a in calls], number=number
+        )
+    return {name: seconds / (number * len(calls)) * 1e6 for name, seconds in results.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark tool-argument validation.")
+    parser.add_argument("--number", type=int, default=20000, help="passes over the sample calls")
+    args = parser.parse_args(argv)
+
+    results = benchmark(tools, number=args.number)
+    baseline = results["compiled"]
+    for name, micros in results.items():
+        print(f"{name:<22} {micros:8.2f} us/call  ({micros / baseline:5.1f}x)")
+    if len(results) == 1:
+        print("jsonschema is not installed; only the compiled validators were timed")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
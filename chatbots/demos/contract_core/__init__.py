@@ -0,0 +1,9 @@
+from .schemas import *
+from .validation import *
+from .consumer import *
+from .telemetry import *
+from .provider import *
+from .enforcement import *
+from .fastjson import *
+from .corpus import *
+from .registry import *
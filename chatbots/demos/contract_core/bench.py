@@ -0,0 +1,191 @@
+# contract_core/bench.py
+# Times contract validation (generated validators vs stock jsonschema), what
+# each enforcement mode adds to a skill call, request construction, and skill
+# handler throughput and telemetry overhead.
+#
+#   python -m contract_core.bench --number 20000
+
+import argparse
+import copy
+import json
+import sys
+import timeit
+
+from .consumer import build_order_tracking_request, order_tracking_template
+from .enforcement import MODES, ContractEnforcer, ContractGateway
+from .provider import ResponseSkeletons, handle_order_tracking_request
+from .schemas import SKILL_REQUEST_SCHEMA, SKILL_RESPONSE_SCHEMA
+from .telemetry import RequestTelemetry, TelemetryExporter
+from .validation import SKILL_REQUEST, SKILL_RESPONSE
+
+__all__ = ["sample_documents", "benchmark", "enforcement_overhead", "request_construction",
+           "handler_throughput", "telemetry_overhead"]
+
+
+def sample_documents() -> list[tuple[dict, dict]]:
+    """(schema, document) pairs: valid requests and responses, plus a few broken ones."""
+    request = build_order_tracking_request("ORD-123456")
+    response = handle_order_tracking_request(request)
+    missing = copy.deepcopy(request)
+    del missing["parameters"]["order_id"]
+    bad_code = copy.deepcopy(response)
+    bad_code["status"]["code"] = "OK"
+    return [
+        (SKILL_REQUEST_SCHEMA, request),
+        (SKILL_RESPONSE_SCHEMA, response),
+        (SKILL_REQUEST_SCHEMA, missing),
+        (SKILL_RESPONSE_SCHEMA, bad_code),
+    ]
+
+
+def benchmark(number: int = 20000) -> dict[str, float]:
+    """Microseconds per validated document for each approach."""
+    samples = sample_documents()
+    compiled = {id(SKILL_REQUEST_SCHEMA): SKILL_REQUEST, id(SKILL_RESPONSE_SCHEMA): SKILL_RESPONSE}
+    checks = [(compiled[id(schema)], doc) for schema, doc in samples]
+
+    def fast():
+        for contract, doc in checks:
+            contract.is_valid(doc)
+
+    def detailed():
+        for contract, doc in checks:
+            contract.errors(doc)
+
+    results = {"compiled is_valid": (fast, number), "compiled errors": (detailed, number)}
+    try:
+        import jsonschema
+    except ImportError:
+        pass
+    else:
+        prepared = {
+            id(schema): jsonschema.validators.validator_for(schema)(schema)
+            for schema in (SKILL_REQUEST_SCHEMA, SKILL_RESPONSE_SCHEMA)
+        }
+
+        def stock():
+            for schema, doc in samples:
+                try:
+                    jsonschema.validate(doc, schema)
+                except jsonschema.ValidationError:
+                    pass
+
+        def stock_prepared():
+            for schema, doc in samples:
+                prepared[id(schema)].is_valid(doc)
+
+        # jsonschema.validate re-checks the schema on every call, so it gets
+        # fewer rounds; the per-document figure is what matters.
+        results["jsonschema.validate"] = (stock, max(1, number // 50))
+        results["jsonschema prepared"] = (stock_prepared, max(1, number // 5))
+
+    return {
+        name: timeit.timeit(fn, number=rounds) / (rounds * len(samples)) * 1e6
+        for name, (fn, rounds) in results.items()
+    }
+
+
+def enforcement_overhead(number: int = 20000, sample_rate: float = 0.01) -> dict[str, float]:
+    """Microseconds per gateway call (handler + response enforcement), by mode."""
+    request = build_order_tracking_request("ORD-123456")
+    gateways = {"no enforcement": (ContractGateway(handle_order_tracking_request), None)}
+    for mode in MODES:
+        enforcer = ContractEnforcer(SKILL_RESPONSE, mode, sample_rate=sample_rate, queue_size=number)
+        gateways[mode] = (ContractGateway(handle_order_tracking_request, responses=enforcer), enforcer)
+
+    results = {}
+    for name, (gateway, enforcer) in gateways.items():
+        results[name] = timeit.timeit(lambda: gateway(request), number=number) / number * 1e6
+        if enforcer is not None:
+            enforcer.close()
+    return results
+
+
+def request_construction(number: int = 20000) -> dict[str, float]:
+    """Microseconds per request: the dict builder vs the pre-validated template."""
+    template = order_tracking_template()
+    candidates = {
+        "build_order_tracking_request": lambda: build_order_tracking_request("ORD-123456"),
+        "  + json.dumps": lambda: json.dumps(build_order_tracking_request("ORD-123456")).encode(),
+        "template.build": lambda: template.build("ORD-123456"),
+        "template.encode": lambda: template.encode("ORD-123456"),
+    }
+    return {name: timeit.timeit(fn, number=number) / number * 1e6 for name, fn in candidates.items()}
+
+
+def handler_throughput(number: int = 20000) -> dict[str, float]:
+    """
+    Requests per second through the skill handler, wire to wire: decode the
+    request bytes, answer, encode the response. Both status branches are
+    exercised.
+    """
+    request = build_order_tracking_request("ORD-123456")
+    missing = copy.deepcopy(request)
+    del missing["parameters"]["order_id"]
+    wire = [json.dumps(request).encode(), json.dumps(missing).encode()]
+    skeletons = ResponseSkeletons()
+
+    def handler():
+        for body in wire:
+            json.dumps(handle_order_tracking_request(json.loads(body))).encode()
+
+    def skeleton():
+        for body in wire:
+            skeletons.encode(json.loads(body))
+
+    candidates = {"handler + json.dumps": handler, "response skeletons": skeleton}
+    return {
+        name: number * len(wire) / timeit.timeit(fn, number=number)
+        for name, fn in candidates.items()
+    }
+
+
+def telemetry_overhead(number: int = 20000) -> dict[str, float]:
+    """Microseconds per request for collecting telemetry around one backend call."""
+    exporter = TelemetryExporter()
+
+    def collect(exporter):
+        telemetry = RequestTelemetry("order_tracking", exporter)
+        with telemetry.call("OMS", "GET_ORDER_STATUS"):
+            pass
+        telemetry.finish()
+
+    candidates = {
+        "collect only": lambda: collect(None),
+        "collect + histograms": lambda: collect(exporter),
+    }
+    return {name: timeit.timeit(fn, number=number) / number * 1e6 for name, fn in candidates.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark skill contract validation.")
+    parser.add_argument("--number", type=int, default=20000, help="passes over the sample documents")
+    args = parser.parse_args(argv)
+
+    results = benchmark(args.number)
+    baseline = results["compiled is_valid"]
+    for name, micros in results.items():
+        print(f"{name:<22} {micros:9.2f} us/doc  ({micros / baseline:6.1f}x)")
+    if "jsonschema.validate" not in results:
+        print("jsonschema is not installed; only the compiled validators were timed")
+
+    print("\nrequest path, handler + response enforcement:")
+    for name, micros in enforcement_overhead(args.number).items():
+        print(f"{name:<22} {micros:9.2f} us/call")
+
+    print("\nrequest construction:")
+    for name, micros in request_construction(args.number).items():
+        print(f"{name:<30} {micros:9.2f} us/request")
+
+    print("\nskill handler throughput (decode request, answer, encode response):")
+    for name, rate in handler_throughput(args.number).items():
+        print(f"{name:<22} {rate:11,.0f} req/s")
+
+    print("\ntelemetry per request (one backend call):")
+    for name, micros in telemetry_overhead(args.number).items():
+        print(f"{name:<22} {micros:9.2f} us/request")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,254 @@
+# contract_core/consumer.py
+# Consumer side of the contract: the conversation orchestrator building skill requests.
+
+import os
+import random
+import time
+import uuid
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+from .fastjson import EncodedTemplate, encode_value, slot
+from .validation import ANNOTATIONS, SKILL_REQUEST, CompiledContract, ContractError, ValidationError
+
+__all__ = ["build_order_tracking_request", "RequestTemplate", "order_tracking_template"]
+
+
+def build_order_tracking_request(order_id: str) -> dict:
+    """
+    Orchestrator builds a skill request for the 'order_tracking' skill.
+    This function embodies the *consumer* expectations.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "request_id": str(uuid.uuid4()),
+        "timestamp": now,
+        "skill": {
+            "name": "order_tracking",
+            "version": "v1",
+        },
+        "channel": {
+            "type": "web",
+            "locale": "en-GB",
+            "session_id": "sess-123",
+            "conversation_id": "conv-456",
+        },
+        "user_context": {
+            "user_id": "cust-42",
+            "authenticated": True,
+            "roles": ["customer"],
+            "jurisdiction": "EU",
+        },
+        "dialog_context": {
+            "turn_index": 3,
+            "intent": "TRACK_ORDER",
+            "confidence": 0.93,
+            "entities": {
+                "order_id": order_id,
+            },
+        },
+        "parameters": {
+            "order_id": order_id,
+        },
+        "security": {
+            "pii_allowed": True,
+            "max_pii_level": "LOW",
+            "auth_level": "STRONG",
+        },
+        "compliance": {
+            "region": "EU",
+            "sector": "insurance",
+            "consents": {
+                "call_recording": True,
+                "data_enrichment": False,
+            },
+        },
+        "trace": {
+            "correlation_id": "trace-abc",
+            "parent_span_id": "span-xyz",
+        },
+    }
+
+
+# -------------------------------------------------------------------
+# Template-based construction
+# -------------------------------------------------------------------
+
+_VARIABLE = ("request_id", "timestamp", "order_id", "entities")
+
+
+class _FastUUID4:
+    """
+    Random (version 4) UUID strings without building ``uuid.UUID`` objects.
+    The bits come from a Mersenne Twister seeded from os.urandom, and
+    reseeded in every forked child so worker processes do not repeat each
+    other's ids. Ids only need to be unique, not unguessable. An explicit
+    ``rng`` (e.g. a seeded one in tests) is used as is and never reseeded.
+    """
+
+    def __init__(self, rng: random.Random | None = None):
+        if rng is None:
+            rng = random.Random(os.urandom(16))
+            _reseed_after_fork.add(rng)
+        self._bits = rng.getrandbits
+
+    def __call__(self) -> str:
+        h = "%032x" % (self._bits(128) & ~(0xF000 << 64 | 0xC000 << 48) | (0x4000 << 64 | 0x8000 << 48))
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Generators owned by _FastUUID4 instances; a child process reseeds them all.
+_reseed_after_fork: "weakref.WeakSet[random.Random]" = weakref.WeakSet()
+
+
+def _reseed() -> None:
+    for rng in list(_reseed_after_fork):
+        rng.seed(os.urandom(16))
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed)
+
+
+class _UTCTimestamp:
+    """
+    ``datetime.now(timezone.utc).isoformat()``, formatting the date part once
+    per second. ``clock`` returns microseconds since the epoch.
+    """
+
+    def __init__(self, clock: Callable[[], int] = lambda: time.time_ns() // 1000):
+        self.clock = clock
+        self._second: tuple[int, str] = (-1, "")
+
+    def __call__(self) -> str:
+        second, micros = divmod(self.clock(), 1_000_000)
+        cached, prefix = self._second
+        if second != cached:
+            prefix = datetime.fromtimestamp(second, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+            self._second = (second, prefix)
+        return f"{prefix}.{micros:06d}+00:00" if micros else prefix + "+00:00"
+
+
+def _slot_paths(node: Any, path: str = "$") -> dict[str, str]:
+    if isinstance(node, dict):
+        found: dict[str, str] = {}
+        for key, value in node.items():
+            found.update(_slot_paths(value, f"{path}.{key}"))
+        return found
+    for name in _VARIABLE:
+        if node == slot(name):
+            return {name: path}
+    return {}
+
+
+def _subschema(schema: dict, path: str) -> dict:
+    for key in path.split(".")[1:]:
+        schema = schema.get("properties", {}).get(key)
+        if schema is None:
+            return {}
+    return schema
+
+
+def _literal(node: Any) -> str:
+    """Python source building ``node`` afresh, with slot markers replaced by variables."""
+    if isinstance(node, dict):
+        return "{" + ", ".join(f"{key!r}: {_literal(value)}" for key, value in node.items()) + "}"
+    if isinstance(node, list):
+        return "[" + ", ".join(_literal(value) for value in node) + "]"
+    for name in _VARIABLE:
+        if node == slot(name):
+            return name
+    return repr(node)
+
+
+class RequestTemplate:
+    """
+    A skill request whose static parts (skill, channel, user and dialog
+    context, security, compliance, trace) are fixed, validated once against
+    the request contract and pre-encoded. Per request only ``request_id``,
+    ``timestamp``, ``order_id`` and the dialog ``entities`` are filled in,
+    and only those are validated (against their own parts of the schema).
+
+    ``build`` returns a fresh dict (callers may mutate it); ``encode``
+    returns the request as compact JSON bytes without building the dict.
+    """
+
+    def __init__(
+        self,
+        document: dict,
+        contract: CompiledContract = SKILL_REQUEST,
+        new_id: Callable[[], str] | None = None,
+        now: Callable[[], str] | None = None,
+    ):
+        sample = _fill(document, {"request_id": "r", "timestamp": "t", "order_id": "o", "entities": {}})
+        contract.validate(sample)
+        self.document = document
+        self.new_id = new_id or _FastUUID4()
+        self.now = now or _UTCTimestamp()
+        self._encoded = EncodedTemplate(document)
+        namespace: dict = {}
+        exec(f"def build({', '.join(_VARIABLE)}):\n    return {_literal(document)}\n", namespace)
+        self._build = namespace["build"]
+        # Only the variable fields are checked per request, and only those
+        # the schema constrains.
+        self._checks = [
+            (_VARIABLE.index(name), path, CompiledContract(_subschema(contract.schema, path)))
+            for name, path in _slot_paths(document).items()
+            if set(_subschema(contract.schema, path)) - ANNOTATIONS
+        ]
+
+    def _values(self, order_id, request_id, timestamp, entities) -> tuple:
+        values = (
+            self.new_id() if request_id is None else request_id,
+            self.now() if timestamp is None else timestamp,
+            order_id,
+            {"order_id": order_id} if entities is None else entities,
+        )
+        for index, path, check in self._checks:
+            if not check.is_valid(values[index]):
+                raise ValidationError([
+                    ContractError(path + error.path[1:], error.message, error.keyword)
+                    for error in check.errors(values[index])
+                ])
+        return values
+
+    def build(self, order_id: str, request_id: str | None = None, timestamp: str | None = None,
+              entities: dict | None = None) -> dict:
+        return self._build(*self._values(order_id, request_id, timestamp, entities))
+
+    def encode(self, order_id: str, request_id: str | None = None, timestamp: str | None = None,
+               entities: dict | None = None) -> bytes:
+        request_id, timestamp, order_id, entities_value = self._values(order_id, request_id, timestamp, entities)
+        encoded_order_id = encode_value(order_id)
+        return self._encoded.render({
+            "request_id": encode_value(request_id),
+            "timestamp": encode_value(timestamp),
+            "order_id": encoded_order_id,
+            # The default entities are just the order id: no json.dumps needed.
+            "entities": b'{"order_id":' + encoded_order_id + b"}" if entities is None else encode_value(entities),
+        })
+
+
+def _fill(node: Any, values: dict) -> Any:
+    if isinstance(node, dict):
+        return {key: _fill(value, values) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_fill(value, values) for value in node]
+    for name in _VARIABLE:
+        if node == slot(name):
+            return values[name]
+    return node
+
+
+def order_tracking_template(**overrides) -> RequestTemplate:
+    """
+    ``build_order_tracking_request`` as a template: same static blocks, with
+    the per-request fields as slots. ``overrides`` replace top-level blocks
+    (e.g. a different ``channel`` for voice).
+    """
+    document = build_order_tracking_request(slot("order_id"))
+    document.update(request_id=slot("request_id"), timestamp=slot("timestamp"))
+    document["dialog_context"]["entities"] = slot("entities")
+    document.update(overrides)
+    return RequestTemplate(document)
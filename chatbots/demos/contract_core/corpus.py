@@ -0,0 +1,195 @@
+# contract_core/corpus.py
+# Streaming, parallel passes over recorded skill traffic (JSONL, one document
+# per line).
+#
+#   report = verify_corpus("responses.jsonl", SKILL_RESPONSE_SCHEMA, workers=8)
+#   report.ok, report.summary()
+#
+# The archive is read in chunks and the chunks are checked by a process pool;
+# at most ``2 * workers`` chunks are in flight, so memory stays flat however
+# large the archive is. Each worker compiles the contract once.
+
+import json
+import os
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator
+
+from .enforcement import _status_code
+from .validation import ContractError, compile_contract
+
+__all__ = ["CorpusReport", "iter_chunks", "map_chunks", "verify_corpus"]
+
+Chunk = tuple[int, list[bytes]]  # (line number of the first line, raw lines)
+
+
+@dataclass
+class CorpusReport:
+    total: int = 0
+    valid: int = 0
+    invalid: int = 0
+    undecodable: int = 0
+    failed: int = 0  # replays where the handler raised
+    by_path: Counter = field(default_factory=Counter)
+    by_status: Counter = field(default_factory=Counter)
+    examples: list[tuple[int, str]] = field(default_factory=list)  # (line, problem)
+    seconds: float = 0.0
+    max_examples: int = 5
+
+    @property
+    def ok(self) -> bool:
+        """Go/no-go: every line decoded and satisfied the contract."""
+        return self.invalid == 0 and self.undecodable == 0 and self.failed == 0
+
+    @property
+    def rate(self) -> float:
+        """Documents per second."""
+        return self.total / self.seconds if self.seconds else 0.0
+
+    def violation(self, line: int, document: Any, errors: list[ContractError]) -> None:
+        self.invalid += 1
+        self.by_status[_status_code(document)] += 1
+        self.by_path.update(error.path for error in errors)
+        if len(self.examples) < self.max_examples:
+            self.examples.append((line, "; ".join(map(str, errors))))
+
+    def undecoded(self, line: int, problem: str) -> None:
+        self.undecodable += 1
+        if len(self.examples) < self.max_examples:
+            self.examples.append((line, problem))
+
+    def crashed(self, line: int, exc: Exception) -> None:
+        self.failed += 1
+        if len(self.examples) < self.max_examples:
+            self.examples.append((line, f"handler raised {type(exc).__name__}: {exc}"))
+
+    def merge(self, other: "CorpusReport") -> None:
+        self.total += other.total
+        self.valid += other.valid
+        self.invalid += other.invalid
+        self.undecodable += other.undecodable
+        self.failed += other.failed
+        self.by_path.update(other.by_path)
+        self.by_status.update(other.by_status)
+        room = self.max_examples - len(self.examples)
+        self.examples.extend(other.examples[:max(room, 0)])
+
+    def summary(self, unit: str = "docs") -> str:
+        lines = [
+            f"{'GO' if self.ok else 'NO-GO'}: {self.total} {unit}, {self.valid} valid, "
+            f"{self.invalid} invalid, {self.undecodable} undecodable"
+            + (f", {self.failed} failed" if self.failed else "")
+            + f" ({self.rate:,.0f} {unit}/s)",
+        ]
+        lines += [f"  {count:>8}  {path}" for path, count in self.by_path.most_common(10)]
+        if self.by_status:
+            lines.append("  by status: " + ", ".join(f"{code}={n}" for code, n in self.by_status.most_common()))
+        lines += [f"  line {line}: {problem}" for line, problem in self.examples]
+        return "\n".join(lines)
+
+
+# -------------------------------------------------------------------
+# Streaming
+# -------------------------------------------------------------------
+
+def iter_chunks(source: str | Path | Iterable[bytes], chunk_size: int = 1000) -> Iterator[Chunk]:
+    """
+    Reads ``source`` (a JSONL path, or any iterable of lines) in chunks of
+    ``chunk_size`` non-blank lines. Line numbers start at 1.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source, "rb") as lines:
+            yield from iter_chunks(lines, chunk_size)
+        return
+    start, chunk = 0, []
+    for number, line in enumerate(source, 1):
+        if not line.strip():
+            continue
+        if not chunk:
+            start = number
+        chunk.append(line)
+        if len(chunk) >= chunk_size:
+            yield start, chunk
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def map_chunks(
+    fn: Callable[[Chunk], Any],
+    chunks: Iterable[Chunk],
+    workers: int | None = None,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[Any]:
+    """
+    ``map(fn, chunks)`` on a process pool, in order, with at most
+    ``2 * workers`` chunks in flight. ``fn`` and ``initializer`` must be
+    module-level functions. ``workers`` <= 1 runs in this process.
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        yield from map(fn, chunks)
+        return
+    with ProcessPoolExecutor(workers, initializer=initializer, initargs=initargs) as pool:
+        pending: deque = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# -------------------------------------------------------------------
+# Verification
+# -------------------------------------------------------------------
+
+# Per-process state set by the pool initializer.
+_worker: dict[str, Any] = {}
+
+
+def _init_verify(schema: dict, max_examples: int) -> None:
+    _worker["contract"] = compile_contract(schema)
+    _worker["max_examples"] = max_examples
+
+
+def _verify_chunk(chunk: Chunk) -> CorpusReport:
+    contract = _worker["contract"]
+    start, lines = chunk
+    report = CorpusReport(max_examples=_worker["max_examples"])
+    for offset, line in enumerate(lines):
+        report.total += 1
+        try:
+            document = json.loads(line)
+        except ValueError as exc:
+            report.undecoded(start + offset, f"not JSON: {exc}")
+            continue
+        if contract.is_valid(document):
+            report.valid += 1
+        else:
+            report.violation(start + offset, document, contract.errors(document))
+    return report
+
+
+def verify_corpus(
+    source: str | Path | Iterable[bytes],
+    schema: dict,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    max_examples: int = 5,
+) -> CorpusReport:
+    """Checks every recorded document in ``source`` against ``schema``."""
+    started = time.perf_counter()
+    report = CorpusReport(max_examples=max_examples)
+    chunks = iter_chunks(source, chunk_size)
+    for partial in map_chunks(_verify_chunk, chunks, workers, _init_verify, (schema, max_examples)):
+        report.merge(partial)
+    report.seconds = time.perf_counter() - started
+    return report
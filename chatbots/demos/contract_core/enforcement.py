@@ -0,0 +1,216 @@
+# contract_core/enforcement.py
+# Contract enforcement at the orchestrator <-> skill gateway, in three modes:
+#
+#   strict   validate every document inline; a violation raises ValidationError
+#   sampled  validate a fraction of documents inline; violations are reported
+#   async    hand documents to a background worker through a bounded queue;
+#            violations are reported, a full queue drops (and counts) documents,
+#            and so does a closed enforcer
+#
+# Reported violations go to the ``contract_core.enforcement`` logger and to
+# ``EnforcementStats`` (counters plus violations per JSON path and status code).
+
+import logging
+import queue
+import random
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Any, Callable
+
+from .validation import CompiledContract, ContractError, ValidationError
+
+__all__ = ["MODES", "EnforcementStats", "ContractEnforcer", "ContractGateway"]
+
+logger = logging.getLogger(__name__)
+
+MODES = ("strict", "sampled", "async")
+
+
+@dataclass
+class EnforcementStats:
+    seen: int = 0
+    checked: int = 0
+    skipped: int = 0  # not sampled
+    dropped: int = 0  # async queue full
+    violations: int = 0
+    by_path: Counter = field(default_factory=Counter)
+    by_status: Counter = field(default_factory=Counter)
+    check_seconds: float = 0.0
+
+    def snapshot(self) -> dict:
+        return {
+            "seen": self.seen,
+            "checked": self.checked,
+            "skipped": self.skipped,
+            "dropped": self.dropped,
+            "violations": self.violations,
+            "by_path": dict(self.by_path),
+            "by_status": dict(self.by_status),
+            "mean_check_us": self.check_seconds / self.checked * 1e6 if self.checked else 0.0,
+        }
+
+
+def _status_code(document: Any) -> str:
+    try:
+        return str(document["status"]["code"])
+    except (KeyError, TypeError):
+        return "-"
+
+
+class ContractEnforcer:
+    """
+    Checks documents against one compiled contract in the given ``mode``.
+
+    ``sample_rate`` is the fraction of documents validated in sampled mode.
+    In async mode at most ``queue_size`` documents wait for the worker; the
+    enforcer keeps a reference to each one, so callers must not mutate a
+    document after handing it over. ``on_violation(document, errors)`` is
+    called for every reported violation (from the worker thread in async
+    mode), e.g. to push a metric.
+    """
+
+    def __init__(
+        self,
+        contract: CompiledContract,
+        mode: str = "strict",
+        sample_rate: float = 0.01,
+        queue_size: int = 1000,
+        on_violation: Callable[[Any, list[ContractError]], None] | None = None,
+        rng: random.Random | None = None,
+    ):
+        if mode not in MODES:
+            raise ValueError(f"unknown enforcement mode {mode!r}; expected one of {MODES}")
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError("sample_rate must be between 0 and 1")
+        self.contract = contract
+        self.mode = mode
+        self.sample_rate = sample_rate
+        self.on_violation = on_violation
+        self.rng = rng or random.Random()
+        self.stats = EnforcementStats()
+        self._lock = threading.Lock()
+        self._queue: queue.Queue | None = None
+        self._worker: threading.Thread | None = None
+        self._closed = False
+        if mode == "async":
+            self._queue = queue.Queue(maxsize=queue_size)
+            self._worker = threading.Thread(target=self._drain_forever, name="contract-enforcer", daemon=True)
+            self._worker.start()
+
+    def check(self, document: Any) -> None:
+        """Enforces the contract on ``document`` according to the mode."""
+        with self._lock:
+            self.stats.seen += 1
+        if self.mode == "strict":
+            errors = self._validate(document)
+            if errors:
+                self._report(document, errors)
+                raise ValidationError(errors)
+        elif self.mode == "sampled":
+            if self.rng.random() < self.sample_rate:
+                self._check_and_report(document)
+            else:
+                with self._lock:
+                    self.stats.skipped += 1
+        else:
+            # Under the lock, so close() cannot queue its stop marker between
+            # the closed check and the put.
+            with self._lock:
+                if self._closed:
+                    self.stats.dropped += 1
+                    return
+                try:
+                    self._queue.put_nowait(document)
+                except queue.Full:
+                    self.stats.dropped += 1
+
+    def _validate(self, document: Any) -> list[ContractError]:
+        started = time.perf_counter()
+        errors = [] if self.contract.is_valid(document) else self.contract.errors(document)
+        with self._lock:
+            self.stats.checked += 1
+            self.stats.check_seconds += time.perf_counter() - started
+        return errors
+
+    def _check_and_report(self, document: Any) -> None:
+        errors = self._validate(document)
+        if errors:
+            self._report(document, errors)
+
+    def _report(self, document: Any, errors: list[ContractError]) -> None:
+        status = _status_code(document)
+        with self._lock:
+            self.stats.violations += 1
+            self.stats.by_status[status] += 1
+            self.stats.by_path.update(error.path for error in errors)
+        logger.warning(
+            "%s violation (%s mode, status %s): %s",
+            self.contract.name, self.mode, status, "; ".join(map(str, errors)),
+        )
+        if self.on_violation is not None:
+            self.on_violation(document, errors)
+
+    # -------------------------------------------------------------------
+    # Async worker
+    # -------------------------------------------------------------------
+
+    def _drain_forever(self) -> None:
+        while True:
+            document = self._queue.get()
+            try:
+                if document is _STOP:
+                    return
+                self._check_and_report(document)
+            except Exception:
+                logger.exception("contract check failed")
+            finally:
+                self._queue.task_done()
+
+    def drain(self) -> None:
+        """Blocks until every queued document has been checked (async mode)."""
+        if self._queue is not None:
+            self._queue.join()
+
+    def close(self, timeout: float | None = None) -> None:
+        """
+        Checks what is still queued, then stops the worker. Documents handed
+        to ``check`` afterwards in async mode are counted as dropped.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        if self._worker is not None:
+            self._queue.put(_STOP)
+            self._worker.join(timeout)
+            self._worker = None
+
+
+_STOP = object()
+
+
+class ContractGateway:
+    """
+    Wraps a skill handler with request and response enforcement, e.g.
+    ``ContractGateway(handle_order_tracking_request, responses=ContractEnforcer(SKILL_RESPONSE, "async"))``.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[dict], dict],
+        requests: ContractEnforcer | None = None,
+        responses: ContractEnforcer | None = None,
+    ):
+        self.handler = handler
+        self.requests = requests
+        self.responses = responses
+
+    def __call__(self, request: dict) -> dict:
+        if self.requests is not None:
+            self.requests.check(request)
+        response = self.handler(request)
+        if self.responses is not None:
+            self.responses.check(response)
+        return response
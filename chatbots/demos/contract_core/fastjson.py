@@ -0,0 +1,65 @@
+# contract_core/fastjson.py
+# JSON documents pre-encoded once, with named slots for the few values that
+# change per message.
+#
+#   template = EncodedTemplate({"request_id": slot("request_id"), "skill": {...}})
+#   template.render({"request_id": encode_value(request_id)})
+#
+# The static parts are encoded to bytes once; rendering only encodes the slot
+# values and joins byte fragments. A slot can be a whole value or part of a
+# string (f"Your order {slot('order_id')} is on its way").
+
+import json
+import re
+from json.encoder import encode_basestring_ascii
+from typing import Any
+
+__all__ = ["slot", "encode_value", "EncodedTemplate"]
+
+_MARK = "\x00slot:"
+# How json.dumps writes a slot marker (\x00 is escaped): group 1 is set for a
+# whole-value slot, group 2 for a slot inside a longer string.
+_SLOT_RE = re.compile(rb'"\\u0000slot:([A-Za-z0-9_.]+)\\u0000"|\\u0000slot:([A-Za-z0-9_.]+)\\u0000')
+
+
+def slot(name: str) -> str:
+    """Placeholder for a per-message value; put it where the value goes in the document."""
+    return f"{_MARK}{name}\x00"
+
+
+def encode_value(value: Any) -> bytes:
+    """JSON bytes for one slot value (strings take the C fast path)."""
+    if type(value) is str:
+        return encode_basestring_ascii(value).encode("ascii")
+    return json.dumps(value, separators=(",", ":")).encode("utf-8")
+
+
+class EncodedTemplate:
+    """
+    A document encoded as compact JSON, split around its slots. A slot may
+    appear more than once; every occurrence gets the same value. Slots
+    inside a string must be given string values.
+    """
+
+    def __init__(self, document: Any):
+        encoded = json.dumps(document, separators=(",", ":")).encode("utf-8")
+        pieces = _SLOT_RE.split(encoded)
+        self.fragments: tuple[bytes, ...] = tuple(pieces[0::3])
+        # (name, inline): inline slots take the encoded string without its quotes
+        self.slots: tuple[tuple[str, bool], ...] = tuple(
+            (whole.decode("ascii"), False) if whole else (inline.decode("ascii"), True)
+            for whole, inline in zip(pieces[1::3], pieces[2::3])
+        )
+
+    @property
+    def names(self) -> set[str]:
+        return {name for name, _ in self.slots}
+
+    def render(self, values: dict[str, bytes]) -> bytes:
+        """``values`` maps every slot name to its encoded value (see ``encode_value``)."""
+        fragments = self.fragments
+        parts = [fragments[0]]
+        for i, (name, inline) in enumerate(self.slots, 1):
+            parts.append(values[name][1:-1] if inline else values[name])
+            parts.append(fragments[i])
+        return b"".join(parts)
@@ -0,0 +1,56 @@
+# contract_core/gate.py
+# Go/no-go for a provider deploy: diff a candidate schema against the
+# registered version and replay recorded documents through it.
+#
+#   python -m contract_core.gate skill_response candidate.json \
+#       --against v1 --corpus recorded-responses.jsonl --workers 8
+#
+# Exits 1 when the diff has breaking changes (in the chosen compatibility
+# mode) or any recorded document fails the candidate schema. The candidate is
+# not added to the registry; ``--version`` only labels it in the report and
+# must not name a version that is already registered.
+
+import argparse
+import json
+import sys
+
+from .corpus import verify_corpus
+from .registry import COMPATIBILITY, REGISTRY, ContractDiff, diff_schemas
+
+__all__ = ["main"]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Check a candidate contract schema before deploying.")
+    parser.add_argument("name", help="contract name, e.g. skill_response")
+    parser.add_argument("schema", help="candidate schema (JSON file)")
+    parser.add_argument("--version", default="candidate", help="version label for the candidate")
+    parser.add_argument("--against", help="registered version to diff against (default: latest)")
+    parser.add_argument("--mode", choices=COMPATIBILITY, default="full", help="compatibility mode")
+    parser.add_argument("--corpus", help="recorded documents (JSONL) to verify against the candidate")
+    parser.add_argument("--workers", type=int, default=None, help="verification processes (default: CPUs)")
+    args = parser.parse_args(argv)
+
+    if args.version in REGISTRY.versions(args.name):
+        parser.error(f"{args.name} {args.version} is already registered; label the candidate with a new --version")
+    try:
+        against = args.against or REGISTRY.latest(args.name)
+        baseline = REGISTRY.schema(args.name, against)
+    except KeyError as exc:
+        parser.error(exc.args[0])
+    with open(args.schema) as f:
+        candidate = json.load(f)
+
+    diff = ContractDiff(args.name, against, args.version, args.mode, diff_schemas(baseline, candidate))
+    print(diff)
+    ok = diff.compatible
+
+    if args.corpus:
+        report = verify_corpus(args.corpus, candidate, workers=args.workers)
+        print(report.summary())
+        ok = ok and report.ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+# contract_core/provider.py
+# Provider side of the contract: the order_tracking skill implementation.
+
+import json
+from typing import Callable
+
+from .fastjson import EncodedTemplate, encode_value, slot
+from .telemetry import EXPORTER, RequestTelemetry, TelemetryExporter
+
+__all__ = ["lookup_order", "handle_order_tracking_request", "ResponseSkeletons", "encode_order_tracking_response"]
+
+
+def lookup_order(order_id: str) -> dict:
+    """Stand-in for the order management system (OMS GET_ORDER_STATUS)."""
+    return {"status": "IN_TRANSIT", "carrier": "DHL", "eta": "2025-12-01"}
+
+
+def handle_order_tracking_request(
+    request: dict,
+    lookup: Callable[[str], dict] = lookup_order,
+    exporter: TelemetryExporter | None = EXPORTER,
+) -> dict:
+    """
+    Provider implementation for the 'order_tracking' skill.
+    This simulates reading a request dict and returning a response dict.
+    In a real system this would be an HTTP handler.
+
+    The response telemetry is measured: handler latency and every backend
+    call, also observed into ``exporter``'s histograms.
+    """
+    telemetry = RequestTelemetry("order_tracking", exporter)
+
+    # In a real implementation you'd validate request against SKILL_REQUEST_SCHEMA
+    # at the boundary too, and return a TECH_ERROR on failure.
+
+    order_id = request.get("parameters", {}).get("order_id")
+
+    # Dumb fake logic just for demo:
+    if not order_id:
+        status = {
+            "code": "NEEDS_MORE_INFO",
+            "subcode": "MISSING_ORDER_ID",
+            "message": "Order ID is required.",
+        }
+        prompts = [
+            {
+                "role": "assistant",
+                "channel_hint": request["channel"]["type"],
+                "text": "Could you please provide your order number?",
+                "tone": "neutral",
+                "sensitive": False,
+            }
+        ]
+        questions = [
+            {
+                "id": "need_order_id",
+                "text": "Please ask the user for their order number.",
+                "required_parameters": ["order_id"],
+            }
+        ]
+        data = {}
+    else:
+        with telemetry.call("OMS", "GET_ORDER_STATUS"):
+            order = lookup(order_id)
+        status = {
+            "code": "SUCCESS",
+            "subcode": None,
+            "message": None,
+        }
+        prompts = [
+            {
+                "role": "assistant",
+                "channel_hint": request["channel"]["type"],
+                "text": f"Your order {order_id} is on its way and should arrive tomorrow.",
+                "tone": "neutral",
+                "sensitive": False,
+            }
+        ]
+        questions = []
+        data = {
+            "order_id": order_id,
+            "status": order["status"],
+            "carrier": order["carrier"],
+            "eta": order["eta"],
+            "tracking_url": f"https://tracking.example.com/{order_id}",
+        }
+
+    response = {
+        "request_id": request["request_id"],
+        "skill": {
+            "name": "order_tracking",
+            "version": "v1",
+        },
+        "status": status,
+        "prompts": prompts,
+        "data": data,
+        "next_actions": [],
+        "questions": questions,
+        "errors": [],
+        "telemetry": telemetry.finish(),
+        "audit": {
+            "pii_touched": ["name", "address"],
+            "decisions": [
+                {
+                    "rule_id": "GDPR_MASK_ADDRESS",
+                    "outcome": "MASKED",
+                }
+            ],
+        },
+    }
+    return response
+
+
+# -------------------------------------------------------------------
+# Pre-encoded responses
+# -------------------------------------------------------------------
+
+_ORDER_SLOTS = {"status": slot("order_status"), "carrier": slot("carrier"), "eta": slot("eta")}
+
+
+def _encode_telemetry(block: dict) -> bytes:
+    """The telemetry block as compact JSON, without going through json.dumps."""
+    calls = ",".join(
+        '{"system":%s,"operation":%s,"latency_ms":%r,"success":%s}' % (
+            encode_value(call["system"]).decode(), encode_value(call["operation"]).decode(),
+            call["latency_ms"], "true" if call["success"] else "false",
+        )
+        for call in block["backend_calls"]
+    )
+    return ('{"latency_ms":%r,"backend_calls":[%s]}' % (block["latency_ms"], calls)).encode()
+
+
+class ResponseSkeletons:
+    """
+    The order_tracking response for each status branch, encoded once with
+    slots for the per-request fields (request_id, the prompt's channel_hint,
+    the order id in the prompt text and data, the looked-up order fields and
+    the measured telemetry). ``encode(request)`` returns the same document
+    as ``handle_order_tracking_request`` as compact JSON bytes, without
+    building or serialising the dict.
+
+    The skeletons are made by running ``handler`` on requests whose fields
+    are slot markers, so they cannot drift from the handler. The order id
+    is also spliced into strings (prompt text, tracking URL), which only
+    works for a str; any other order id goes through ``handler`` and
+    json.dumps instead.
+    """
+
+    def __init__(
+        self,
+        handler=handle_order_tracking_request,
+        lookup: Callable[[str], dict] = lookup_order,
+        exporter: TelemetryExporter | None = EXPORTER,
+    ):
+        self.handler = handler
+        self.lookup = lookup
+        self.exporter = exporter
+        request = {
+            "request_id": slot("request_id"),
+            "channel": {"type": slot("channel_hint")},
+            "parameters": {"order_id": slot("order_id")},
+        }
+        self.success = EncodedTemplate(self._skeleton(handler, request))
+        request["parameters"] = {}
+        self.needs_order_id = EncodedTemplate(self._skeleton(handler, request))
+
+    @staticmethod
+    def _skeleton(handler, request: dict) -> dict:
+        response = handler(request, lookup=lambda order_id: _ORDER_SLOTS, exporter=None)
+        response["telemetry"] = slot("telemetry")
+        return response
+
+    def encode(self, request: dict) -> bytes:
+        order_id = request.get("parameters", {}).get("order_id")
+        if order_id and type(order_id) is not str:
+            response = self.handler(request, lookup=self.lookup, exporter=self.exporter)
+            return json.dumps(response, separators=(",", ":")).encode("utf-8")
+        telemetry = RequestTelemetry("order_tracking", self.exporter)
+        values = {
+            "request_id": encode_value(request["request_id"]),
+            "channel_hint": encode_value(request["channel"]["type"]),
+        }
+        if not order_id:
+            values["telemetry"] = _encode_telemetry(telemetry.finish())
+            return self.needs_order_id.render(values)
+        with telemetry.call("OMS", "GET_ORDER_STATUS"):
+            order = self.lookup(order_id)
+        values["order_id"] = encode_value(order_id)
+        values["order_status"] = encode_value(order["status"])
+        values["carrier"] = encode_value(order["carrier"])
+        values["eta"] = encode_value(order["eta"])
+        values["telemetry"] = _encode_telemetry(telemetry.finish())
+        return self.success.render(values)
+
+
+_SKELETONS = ResponseSkeletons()
+
+
+def encode_order_tracking_response(request: dict) -> bytes:
+    """``handle_order_tracking_request`` straight to JSON bytes, from the pre-encoded skeletons."""
+    return _SKELETONS.encode(request)
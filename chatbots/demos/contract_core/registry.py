@@ -0,0 +1,250 @@
+# contract_core/registry.py
+# Versioned contract schemas and the compatibility diff between two versions.
+#
+#   REGISTRY.register("skill_response", "v2", new_schema)
+#   diff = REGISTRY.diff("skill_response", "v1", "v2")
+#   diff.breaking                                   # [SchemaChange(...), ...]
+#   REGISTRY.verify("skill_response", "v2", "recorded.jsonl").ok
+#
+# Each change is classified by what it does to the set of valid documents:
+#
+#   narrowed  some documents valid under the old version are rejected by the
+#             new one (new required field, enum value removed, ...)
+#   widened   the new version accepts documents the old one rejected, so
+#             readers lose a guarantee (field no longer required, new enum
+#             value, ...)
+#   changed   both at once (e.g. a type change, a different pattern)
+#   added     a new optional property; not breaking in any mode
+#
+# and which effects break depends on the compatibility mode:
+#
+#   backward  new readers must accept old documents: narrowed/changed break
+#   forward   old readers must accept new documents: widened/changed break
+#   full      both (the default)
+
+import json
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from .corpus import CorpusReport, verify_corpus
+from .schemas import SKILL_REQUEST_SCHEMA, SKILL_RESPONSE_SCHEMA
+from .validation import CompiledContract, compile_contract
+
+__all__ = ["COMPATIBILITY", "SchemaChange", "ContractDiff", "diff_schemas", "ContractRegistry", "REGISTRY"]
+
+COMPATIBILITY = ("backward", "forward", "full")
+
+_BREAKS = {
+    "backward": {"narrowed", "changed"},
+    "forward": {"widened", "changed"},
+    "full": {"narrowed", "widened", "changed"},
+}
+
+
+@dataclass(frozen=True)
+class SchemaChange:
+    path: str  # "$.status.code", "$.prompts[*]"
+    effect: str  # narrowed | widened | changed | added
+    message: str
+
+    def breaks(self, mode: str = "full") -> bool:
+        return self.effect in _BREAKS[mode]
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message} ({self.effect})"
+
+
+@dataclass
+class ContractDiff:
+    name: str
+    old: str
+    new: str
+    mode: str = "full"
+    changes: list[SchemaChange] = field(default_factory=list)
+
+    @property
+    def breaking(self) -> list[SchemaChange]:
+        return [change for change in self.changes if change.breaks(self.mode)]
+
+    @property
+    def compatible(self) -> bool:
+        return not self.breaking
+
+    def __str__(self) -> str:
+        verdict = "compatible" if self.compatible else f"{len(self.breaking)} breaking"
+        lines = [f"{self.name} {self.old} -> {self.new} ({self.mode}): {verdict}"]
+        lines += [f"  {'!' if change.breaks(self.mode) else ' '} {change}" for change in self.changes]
+        return "\n".join(lines)
+
+
+# -------------------------------------------------------------------
+# Schema diff
+# -------------------------------------------------------------------
+
+# Lower bounds: raising one narrows. Upper bounds: lowering one narrows.
+_LOWER = ("minimum", "exclusiveMinimum", "minLength", "minItems")
+_UPPER = ("maximum", "exclusiveMaximum", "maxLength", "maxItems")
+
+
+def _types(schema: dict) -> set[str] | None:
+    declared = schema.get("type")
+    if declared is None:
+        return None
+    return {declared} if isinstance(declared, str) else set(declared)
+
+
+def _covers(types: set[str], name: str) -> bool:
+    return name in types or name == "integer" and "number" in types
+
+
+def _allowed(schema: dict) -> dict[str, Any] | None:
+    """enum/const values keyed by canonical JSON, or None when unrestricted."""
+    if "const" in schema:
+        values = [schema["const"]]
+    elif "enum" in schema:
+        values = schema["enum"]
+    else:
+        return None
+    return {json.dumps(value, sort_keys=True): value for value in values}
+
+
+def _set_changes(path: str, what: str, old: Any, new: Any, narrowed: bool, widened: bool) -> list[SchemaChange]:
+    if narrowed and widened:
+        return [SchemaChange(path, "changed", f"{what} changed from {old} to {new}")]
+    if narrowed:
+        return [SchemaChange(path, "narrowed", f"{what} narrowed from {old} to {new}")]
+    if widened:
+        return [SchemaChange(path, "widened", f"{what} widened from {old} to {new}")]
+    return []
+
+
+def _diff(old: dict, new: dict, path: str, changes: list[SchemaChange]) -> None:
+    old_types, new_types = _types(old), _types(new)
+    if old_types != new_types:
+        changes += _set_changes(
+            path, "type", sorted(old_types or ["any"]), sorted(new_types or ["any"]),
+            narrowed=new_types is not None and (old_types is None or not all(_covers(new_types, t) for t in old_types)),
+            widened=old_types is not None and (new_types is None or not all(_covers(old_types, t) for t in new_types)),
+        )
+
+    old_values, new_values = _allowed(old), _allowed(new)
+    if old_values is None and new_values is not None:
+        changes.append(SchemaChange(path, "narrowed", f"restricted to {list(new_values.values())}"))
+    elif old_values is not None and new_values is None:
+        changes.append(SchemaChange(path, "widened", "no longer restricted to fixed values"))
+    elif old_values is not None:
+        for key in old_values.keys() - new_values.keys():
+            changes.append(SchemaChange(path, "narrowed", f"value {old_values[key]!r} no longer allowed"))
+        for key in new_values.keys() - old_values.keys():
+            changes.append(SchemaChange(path, "widened", f"value {new_values[key]!r} now allowed"))
+
+    for keyword in _LOWER + _UPPER:
+        before, after = old.get(keyword), new.get(keyword)
+        if before == after:
+            continue
+        if before is None or after is None:
+            narrowed = before is None
+        else:
+            narrowed = after > before if keyword in _LOWER else after < before
+        effect = "narrowed" if narrowed else "widened"
+        changes.append(SchemaChange(path, effect, f"{keyword} {before} -> {after}"))
+
+    if old.get("pattern") != new.get("pattern"):
+        effect = "narrowed" if "pattern" not in old else "widened" if "pattern" not in new else "changed"
+        changes.append(SchemaChange(path, effect, f"pattern {old.get('pattern')!r} -> {new.get('pattern')!r}"))
+
+    old_required, new_required = set(old.get("required", ())), set(new.get("required", ()))
+    for name in sorted(new_required - old_required):
+        changes.append(SchemaChange(f"{path}.{name}", "narrowed", "now required"))
+    for name in sorted(old_required - new_required):
+        changes.append(SchemaChange(f"{path}.{name}", "widened", "no longer required"))
+
+    old_extra, new_extra = old.get("additionalProperties", True), new.get("additionalProperties", True)
+    if old_extra is not False and new_extra is False:
+        changes.append(SchemaChange(path, "narrowed", "additional properties no longer allowed"))
+    elif old_extra is False and new_extra is not False:
+        changes.append(SchemaChange(path, "widened", "additional properties now allowed"))
+    elif isinstance(old_extra, dict) and isinstance(new_extra, dict):
+        _diff(old_extra, new_extra, f"{path}.*", changes)
+
+    old_properties, new_properties = old.get("properties", {}), new.get("properties", {})
+    for name, subschema in old_properties.items():
+        if name in new_properties:
+            _diff(subschema, new_properties[name], f"{path}.{name}", changes)
+        elif set(subschema) - {"description", "title"}:
+            changes.append(SchemaChange(f"{path}.{name}", "widened", "no longer declared"))
+    for name in new_properties.keys() - old_properties.keys():
+        effect = "widened" if old_extra is False else "added"
+        changes.append(SchemaChange(f"{path}.{name}", effect, "newly declared"))
+
+    if "items" in old and "items" in new:
+        _diff(old["items"], new["items"], f"{path}[*]", changes)
+    elif "items" in old or "items" in new:
+        effect = "widened" if "items" in old else "narrowed"
+        changes.append(SchemaChange(f"{path}[*]", effect, "item schema " + ("removed" if "items" in old else "added")))
+
+
+def diff_schemas(old: dict, new: dict) -> list[SchemaChange]:
+    """Every difference between two contract schemas, outermost first."""
+    changes: list[SchemaChange] = []
+    _diff(old, new, "$", changes)
+    return changes
+
+
+# -------------------------------------------------------------------
+# Registry
+# -------------------------------------------------------------------
+
+def _version_key(version: str) -> tuple:
+    """"v2" < "v10": numeric runs compare as numbers."""
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r"(\d+)", version))
+
+
+class ContractRegistry:
+    """Contract schemas by name and version ("skill_response", "v1")."""
+
+    def __init__(self):
+        self._schemas: dict[str, dict[str, dict]] = {}
+
+    def register(self, name: str, version: str, schema: dict) -> CompiledContract:
+        """Adds a version; re-registering a version with a different schema is an error."""
+        versions = self._schemas.setdefault(name, {})
+        if version in versions and versions[version] != schema:
+            raise ValueError(f"{name} {version} is already registered with a different schema")
+        versions.setdefault(version, schema)
+        return self.contract(name, version)
+
+    def schema(self, name: str, version: str) -> dict:
+        try:
+            return self._schemas[name][version]
+        except KeyError:
+            raise KeyError(f"no contract {name} {version}") from None
+
+    def contract(self, name: str, version: str) -> CompiledContract:
+        return compile_contract(self.schema(name, version))
+
+    def versions(self, name: str) -> list[str]:
+        return sorted(self._schemas.get(name, {}), key=_version_key)
+
+    def latest(self, name: str) -> str:
+        versions = self.versions(name)
+        if not versions:
+            raise KeyError(f"no contract {name}")
+        return versions[-1]
+
+    def diff(self, name: str, old: str, new: str, mode: str = "full") -> ContractDiff:
+        if mode not in COMPATIBILITY:
+            raise ValueError(f"unknown compatibility mode {mode!r}; expected one of {COMPATIBILITY}")
+        changes = diff_schemas(self.schema(name, old), self.schema(name, new))
+        return ContractDiff(name, old, new, mode, changes)
+
+    def verify(self, name: str, version: str, source: str | Path | Iterable[bytes], **options) -> CorpusReport:
+        """Streams recorded documents through ``version`` (see ``verify_corpus`` for options)."""
+        return verify_corpus(source, self.schema(name, version), **options)
+
+
+REGISTRY = ContractRegistry()
+REGISTRY.register("skill_request", "v1", SKILL_REQUEST_SCHEMA)
+REGISTRY.register("skill_response", "v1", SKILL_RESPONSE_SCHEMA)
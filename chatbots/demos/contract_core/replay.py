@@ -0,0 +1,92 @@
+# contract_core/replay.py
+# Replays recorded skill requests (JSONL, one request per line) through the
+# provider and checks every response against the response contract.
+#
+#   python -m contract_core.replay recorded-requests.jsonl --workers 8
+#
+# Requests are streamed in chunks to a process pool (see corpus.map_chunks),
+# so memory stays flat for archives of any size. Violations are counted by
+# JSON path and by response status code; handler exceptions are counted as
+# failures. Exits 1 unless every request produced a valid response.
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Iterable
+
+from .corpus import Chunk, CorpusReport, iter_chunks, map_chunks
+from .provider import handle_order_tracking_request
+from .schemas import SKILL_RESPONSE_SCHEMA
+from .validation import compile_contract
+
+__all__ = ["replay", "main"]
+
+# Per-process state set by the pool initializer.
+_worker: dict = {}
+
+
+def _init_replay(handler: Callable[[dict], dict], schema: dict, max_examples: int) -> None:
+    _worker.update(handler=handler, contract=compile_contract(schema), max_examples=max_examples)
+
+
+def _replay_chunk(chunk: Chunk) -> CorpusReport:
+    handler, contract = _worker["handler"], _worker["contract"]
+    start, lines = chunk
+    report = CorpusReport(max_examples=_worker["max_examples"])
+    for offset, line in enumerate(lines):
+        report.total += 1
+        try:
+            request = json.loads(line)
+        except ValueError as exc:
+            report.undecoded(start + offset, f"not JSON: {exc}")
+            continue
+        try:
+            response = handler(request)
+        except Exception as exc:
+            report.crashed(start + offset, exc)
+            continue
+        if contract.is_valid(response):
+            report.valid += 1
+        else:
+            report.violation(start + offset, response, contract.errors(response))
+    return report
+
+
+def replay(
+    source: str | Path | Iterable[bytes],
+    handler: Callable[[dict], dict] = handle_order_tracking_request,
+    schema: dict = SKILL_RESPONSE_SCHEMA,
+    workers: int | None = None,
+    chunk_size: int = 1000,
+    max_examples: int = 5,
+) -> CorpusReport:
+    """
+    Runs every recorded request in ``source`` through ``handler`` and checks
+    the responses. ``handler`` must be a module-level function so the pool
+    can send it to the workers. ``report.rate`` is requests per second.
+    """
+    started = time.perf_counter()
+    report = CorpusReport(max_examples=max_examples)
+    chunks = iter_chunks(source, chunk_size)
+    for partial in map_chunks(_replay_chunk, chunks, workers, _init_replay, (handler, schema, max_examples)):
+        report.merge(partial)
+    report.seconds = time.perf_counter() - started
+    return report
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Replay recorded skill requests through the provider.")
+    parser.add_argument("archive", help="recorded requests (JSONL)")
+    parser.add_argument("--workers", type=int, default=None, help="replay processes (default: CPUs)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="requests per work unit")
+    args = parser.parse_args(argv)
+
+    report = replay(args.archive, workers=args.workers, chunk_size=args.chunk_size)
+    print(report.summary("requests"))
+    return 0 if report.ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
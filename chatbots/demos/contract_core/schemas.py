@@ -0,0 +1,85 @@
+# contract_core/schemas.py
+# The shared orchestrator <-> skill contract: request and response JSON schemas.
+# Same schemas as the self-contained test_contract_testing.py demo.
+
+__all__ = ["SKILL_REQUEST_SCHEMA", "SKILL_RESPONSE_SCHEMA"]
+
+SKILL_REQUEST_SCHEMA = {
+    "$id": "https://example.com/schemas/skill-request.json",
+    "type": "object",
+    "required": ["request_id", "timestamp", "skill", "channel", "parameters"],
+    "properties": {
+        "request_id": {"type": "string"},  # keep simple for demo
+        "timestamp": {"type": "string"},
+        "skill": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "name": {"type": "string"},
+                "version": {"type": "string"},
+            },
+        },
+        "channel": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {"type": "string"},
+                "locale": {"type": "string"},
+                "session_id": {"type": "string"},
+                "conversation_id": {"type": "string"},
+            },
+            "additionalProperties": True,
+        },
+        "user_context": {"type": "object"},
+        "dialog_context": {"type": "object"},
+        "parameters": {
+            "type": "object",
+            "required": ["order_id"],
+            "properties": {
+                "order_id": {"type": "string"},
+            },
+            "additionalProperties": True,
+        },
+        "security": {"type": "object"},
+        "compliance": {"type": "object"},
+        "trace": {"type": "object"},
+    },
+    "additionalProperties": True,
+}
+
+SKILL_RESPONSE_SCHEMA = {
+    "$id": "https://example.com/schemas/skill-response.json",
+    "type": "object",
+    "required": ["request_id", "skill", "status"],
+    "properties": {
+        "request_id": {"type": "string"},
+        "skill": {
+            "type": "object",
+            "required": ["name"],
+            "properties": {
+                "name": {"type": "string"},
+                "version": {"type": "string"},
+            },
+        },
+        "status": {
+            "type": "object",
+            "required": ["code"],
+            "properties": {
+                "code": {
+                    "type": "string",
+                    "enum": ["SUCCESS", "NEEDS_MORE_INFO", "BUSINESS_ERROR", "TECH_ERROR"],
+                },
+                "subcode": {"type": ["string", "null"]},
+                "message": {"type": ["string", "null"]},
+            },
+        },
+        "prompts": {"type": "array"},
+        "data": {"type": "object"},
+        "next_actions": {"type": "array"},
+        "questions": {"type": "array"},
+        "errors": {"type": "array"},
+        "telemetry": {"type": "object"},
+        "audit": {"type": "object"},
+    },
+    "additionalProperties": True,
+}
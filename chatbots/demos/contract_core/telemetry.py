@@ -0,0 +1,189 @@
+# contract_core/telemetry.py
+# Measured telemetry for skill responses, and the same measurements exported
+# as latency histograms.
+#
+#   telemetry = RequestTelemetry("order_tracking")
+#   with telemetry.call("OMS", "GET_ORDER_STATUS"):
+#       order = lookup_order(order_id)
+#   response["telemetry"] = telemetry.finish()
+#   # {"latency_ms": 0.183, "backend_calls": [{"system": "OMS", ..., "latency_ms": 0.051, "success": True}]}
+#
+# Timings use the monotonic perf_counter_ns clock. Every backend call and
+# every finished request is also observed into an ``TelemetryExporter``
+# (``EXPORTER`` by default), which keeps fixed-bucket histograms per skill and
+# per backend operation and renders them in the Prometheus text format.
+
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable
+
+__all__ = ["BUCKETS_MS", "Histogram", "TelemetryExporter", "EXPORTER", "RequestTelemetry"]
+
+# Upper bounds (inclusive) of the histogram buckets, in milliseconds.
+BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+
+class Histogram:
+    """Counts of observations per bucket, plus their sum. Not thread-safe on its own."""
+
+    __slots__ = ("bounds", "counts", "total", "count")
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS_MS):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # the last bucket is +Inf
+        self.total = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.total += value
+        self.count += 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the ``q`` quantile (inf if past the last bound)."""
+        if not self.count:
+            return 0.0
+        rank, seen = q * self.count, 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+
+    def snapshot(self) -> dict:
+        cumulative, buckets = 0, {}
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"buckets": buckets, "count": self.count, "sum": self.total}
+
+
+class TelemetryExporter:
+    """
+    Latency histograms for finished skill requests (by skill) and backend
+    calls (by system, operation and outcome). Thread-safe.
+    """
+
+    def __init__(self, bounds: tuple[float, ...] = BUCKETS_MS):
+        self.bounds = bounds
+        self._lock = threading.Lock()
+        self.requests: dict[str, Histogram] = {}
+        self.backend_calls: dict[tuple[str, str, bool], Histogram] = {}
+
+    def observe_request(self, skill: str, latency_ms: float) -> None:
+        with self._lock:
+            histogram = self.requests.get(skill)
+            if histogram is None:
+                histogram = self.requests[skill] = Histogram(self.bounds)
+            histogram.observe(latency_ms)
+
+    def observe_backend_call(self, system: str, operation: str, success: bool, latency_ms: float) -> None:
+        key = (system, operation, success)
+        with self._lock:
+            histogram = self.backend_calls.get(key)
+            if histogram is None:
+                histogram = self.backend_calls[key] = Histogram(self.bounds)
+            histogram.observe(latency_ms)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "requests": {skill: h.snapshot() for skill, h in self.requests.items()},
+                "backend_calls": {
+                    f"{system}.{operation}" + ("" if success else ".failed"): h.snapshot()
+                    for (system, operation, success), h in self.backend_calls.items()
+                },
+            }
+
+    def prometheus(self) -> str:
+        """The histograms in the Prometheus text exposition format."""
+        lines: list[str] = []
+        with self._lock:
+            _exposition(lines, "skill_request_latency_ms", "Skill handler latency.",
+                        [({"skill": skill}, h.snapshot()) for skill, h in sorted(self.requests.items())])
+            _exposition(lines, "skill_backend_call_latency_ms", "Backend call latency seen by skills.",
+                        [({"system": s, "operation": o, "success": str(ok).lower()}, h.snapshot())
+                         for (s, o, ok), h in sorted(self.backend_calls.items())])
+        return "\n".join(lines) + "\n"
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests.clear()
+            self.backend_calls.clear()
+
+
+def _exposition(lines: list[str], name: str, help_text: str, series: list[tuple[dict, dict]]) -> None:
+    lines += [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+    for labels, snapshot in series:
+        base = ",".join(f'{key}="{value}"' for key, value in labels.items())
+        for bound, cumulative in snapshot["buckets"].items():
+            le = "+Inf" if bound == float("inf") else f"{bound:g}"
+            lines.append(f'{name}_bucket{{{base},le="{le}"}} {cumulative}')
+        lines.append(f"{name}_sum{{{base}}} {snapshot['sum']:.6g}")
+        lines.append(f"{name}_count{{{base}}} {snapshot['count']}")
+
+
+EXPORTER = TelemetryExporter()
+
+
+# -------------------------------------------------------------------
+# Per-request collection
+# -------------------------------------------------------------------
+
+class _BackendCall:
+    __slots__ = ("telemetry", "system", "operation", "started")
+
+    def __init__(self, telemetry: "RequestTelemetry", system: str, operation: str):
+        self.telemetry = telemetry
+        self.system = system
+        self.operation = operation
+
+    def __enter__(self) -> None:
+        self.started = self.telemetry.clock()
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        telemetry = self.telemetry
+        latency_ms = (telemetry.clock() - self.started) / 1e6
+        success = exc_type is None
+        telemetry.backend_calls.append({
+            "system": self.system,
+            "operation": self.operation,
+            "latency_ms": round(latency_ms, 3),
+            "success": success,
+        })
+        if telemetry.exporter is not None:
+            telemetry.exporter.observe_backend_call(self.system, self.operation, success, latency_ms)
+        return False
+
+
+class RequestTelemetry:
+    """
+    Collects the telemetry block of one skill response. Created when the
+    handler starts; ``call`` times a backend call (a failing call is recorded
+    with ``success: False`` and the exception propagates); ``finish`` returns
+    the block. Latencies are milliseconds, rounded to microseconds.
+    """
+
+    __slots__ = ("skill", "exporter", "clock", "started", "backend_calls")
+
+    def __init__(
+        self,
+        skill: str,
+        exporter: TelemetryExporter | None = EXPORTER,
+        clock: Callable[[], int] = time.perf_counter_ns,
+    ):
+        self.skill = skill
+        self.exporter = exporter
+        self.clock = clock
+        self.started = clock()
+        self.backend_calls: list[dict] = []
+
+    def call(self, system: str, operation: str) -> _BackendCall:
+        return _BackendCall(self, system, operation)
+
+    def finish(self) -> dict:
+        latency_ms = (self.clock() - self.started) / 1e6
+        if self.exporter is not None:
+            self.exporter.observe_request(self.skill, latency_ms)
+        return {"latency_ms": round(latency_ms, 3), "backend_calls": self.backend_calls}
@@ -0,0 +1,116 @@
+import json
+import os
+import unittest
+import uuid
+from datetime import datetime, timezone
+
+from contract_core.consumer import RequestTemplate, build_order_tracking_request, order_tracking_template
+from contract_core.fastjson import EncodedTemplate, encode_value, slot
+from contract_core.validation import SKILL_REQUEST, ValidationError
+
+
+class RequestTemplateTests(unittest.TestCase):
+
+    def setUp(self):
+        self.template = order_tracking_template()
+
+    def expected(self, order_id="ORD-123456"):
+        request = build_order_tracking_request(order_id)
+        request.update(request_id="req-1", timestamp="2025-01-01T00:00:00+00:00")
+        return request
+
+    def test_build_matches_the_dict_builder(self):
+        built = self.template.build("ORD-123456", request_id="req-1", timestamp="2025-01-01T00:00:00+00:00")
+
+        self.assertEqual(self.expected(), built)
+
+    def test_encode_matches_the_dict_builder(self):
+        encoded = self.template.encode("ORD-123456", request_id="req-1", timestamp="2025-01-01T00:00:00+00:00")
+
+        self.assertEqual(self.expected(), json.loads(encoded))
+
+    def test_custom_entities_and_escaping(self):
+        entities = {"order_id": 'ORD-"7"', "postcode": "10115"}
+
+        encoded = self.template.encode('ORD-"7"', request_id="req-1", timestamp="t", entities=entities)
+
+        self.assertEqual(entities, json.loads(encoded)["dialog_context"]["entities"])
+        self.assertEqual('ORD-"7"', json.loads(encoded)["parameters"]["order_id"])
+
+    def test_generated_fields_are_valid(self):
+        request = self.template.build("ORD-1")
+
+        self.assertTrue(SKILL_REQUEST.is_valid(request))
+        self.assertEqual(4, uuid.UUID(request["request_id"]).version)
+        self.assertNotEqual(request["request_id"], self.template.build("ORD-1")["request_id"])
+        datetime.fromisoformat(request["timestamp"])
+
+    @unittest.skipUnless(hasattr(os, "fork"), "needs os.fork")
+    def test_forked_workers_generate_different_ids(self):
+        read_end, write_end = os.pipe()
+        pid = os.fork()
+        if pid == 0:  # child: report the next id and exit
+            os.write(write_end, self.template.build("ORD-1")["request_id"].encode())
+            os._exit(0)
+        os.close(write_end)
+        os.waitpid(pid, 0)
+        with os.fdopen(read_end, "rb") as pipe:
+            child_id = pipe.read().decode()
+
+        self.assertEqual(4, uuid.UUID(child_id).version)
+        self.assertNotEqual(self.template.build("ORD-1")["request_id"], child_id)
+
+    def test_built_requests_do_not_share_state(self):
+        first = self.template.build("ORD-1")
+        first["channel"]["type"] = "voice"
+        first["user_context"]["roles"].append("admin")
+
+        second = self.template.build("ORD-2")
+
+        self.assertEqual("web", second["channel"]["type"])
+        self.assertEqual(["customer"], second["user_context"]["roles"])
+
+    def test_only_variable_fields_are_checked_per_request(self):
+        with self.assertRaises(ValidationError) as raised:
+            self.template.encode(None)
+
+        self.assertEqual(["$.parameters.order_id"], [e.path for e in raised.exception.errors])
+
+    def test_invalid_template_is_rejected_once_at_construction(self):
+        document = build_order_tracking_request(slot("order_id"))
+        del document["channel"]
+
+        with self.assertRaises(ValidationError):
+            RequestTemplate(document)
+
+    def test_timestamps_match_isoformat(self):
+        for micros in (1_700_000_000_000_000, 1_700_000_000_123_456, 1_700_000_001_000_001):
+            template = order_tracking_template()
+            template.now.clock = lambda: micros
+            expected = datetime.fromtimestamp(micros // 1_000_000, timezone.utc).replace(
+                microsecond=micros % 1_000_000
+            ).isoformat()
+            with self.subTest(micros=micros):
+                self.assertEqual(expected, template.build("ORD-1")["timestamp"])
+
+
+class EncodedTemplateTests(unittest.TestCase):
+
+    def test_repeated_slots_and_non_string_values(self):
+        template = EncodedTemplate({"a": slot("x"), "b": [slot("y"), slot("x")], "c": "static"})
+
+        rendered = template.render({"x": encode_value("é"), "y": encode_value({"n": [1, None]})})
+
+        self.assertEqual((("x", False), ("y", False), ("x", False)), template.slots)
+        self.assertEqual({"a": "é", "b": [{"n": [1, None]}, "é"], "c": "static"}, json.loads(rendered))
+
+    def test_slots_inside_strings(self):
+        template = EncodedTemplate({"text": f"Order {slot('id')} is late", "url": f"https://t.example/{slot('id')}"})
+
+        rendered = template.render({"id": encode_value('ORD-"1"')})
+
+        self.assertEqual({"text": 'Order ORD-"1" is late', "url": 'https://t.example/ORD-"1"'}, json.loads(rendered))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.corpus import iter_chunks, verify_corpus
+from contract_core.provider import handle_order_tracking_request
+from contract_core.schemas import SKILL_RESPONSE_SCHEMA
+
+
+def recorded(count: int) -> list[bytes]:
+    """``count`` response lines; every 10th has an unknown status code."""
+    lines = []
+    for i in range(count):
+        response = handle_order_tracking_request(build_order_tracking_request(f"ORD-{i}"))
+        if i % 10 == 9:
+            response["status"]["code"] = "OK"
+        lines.append(json.dumps(response).encode() + b"\n")
+    return lines
+
+
+class IterChunksTests(unittest.TestCase):
+
+    def test_chunks_skip_blank_lines_and_keep_line_numbers(self):
+        lines = [b"a\n", b"\n", b"b\n", b"c\n", b"  \n", b"d\n"]
+
+        self.assertEqual(
+            [(1, [b"a\n", b"b\n"]), (4, [b"c\n", b"d\n"])],
+            list(iter_chunks(lines, chunk_size=2)),
+        )
+
+    def test_reads_paths_lazily(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "corpus.jsonl")
+            path.write_bytes(b"1\n2\n3\n")
+
+            self.assertEqual([(1, [b"1\n", b"2\n"]), (3, [b"3\n"])], list(iter_chunks(path, 2)))
+
+
+class VerifyCorpusTests(unittest.TestCase):
+
+    def setUp(self):
+        self.lines = recorded(50)
+
+    def check(self, report):
+        self.assertEqual((50, 45, 5, 0), (report.total, report.valid, report.invalid, report.undecodable))
+        self.assertEqual({"$.status.code": 5}, dict(report.by_path))
+        self.assertEqual({"OK": 5}, dict(report.by_status))
+        self.assertEqual([10, 20, 30], [line for line, _ in report.examples])
+        self.assertFalse(report.ok)
+        self.assertIn("NO-GO", report.summary())
+
+    def test_in_process(self):
+        self.check(verify_corpus(io.BytesIO(b"".join(self.lines)), SKILL_RESPONSE_SCHEMA,
+                                 workers=1, chunk_size=7, max_examples=3))
+
+    def test_process_pool_gives_the_same_report(self):
+        self.check(verify_corpus(iter(self.lines), SKILL_RESPONSE_SCHEMA, workers=2, chunk_size=7, max_examples=3))
+
+    def test_undecodable_lines(self):
+        report = verify_corpus([b'{"request_id": \n', self.lines[0]], SKILL_RESPONSE_SCHEMA, workers=1)
+
+        self.assertEqual((2, 1, 1), (report.total, report.valid, report.undecodable))
+        self.assertEqual(1, report.examples[0][0])
+        self.assertFalse(report.ok)
+
+    def test_clean_corpus_is_a_go(self):
+        report = verify_corpus(self.lines[:9], SKILL_RESPONSE_SCHEMA, workers=1)
+
+        self.assertTrue(report.ok)
+        self.assertGreater(report.rate, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,116 @@
+import random
+import threading
+import unittest
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.enforcement import ContractEnforcer, ContractGateway
+from contract_core.provider import handle_order_tracking_request
+from contract_core.validation import SKILL_RESPONSE, ValidationError
+
+
+def broken_handler(request: dict) -> dict:
+    response = handle_order_tracking_request(request)
+    response["status"]["code"] = "OK"
+    return response
+
+
+class BlockingContract:
+    """Wraps a contract; every check waits for ``release``."""
+
+    def __init__(self, contract):
+        self.contract = contract
+        self.name = contract.name
+        self.release = threading.Event()
+
+    def is_valid(self, document):
+        self.release.wait()
+        return self.contract.is_valid(document)
+
+    def errors(self, document):
+        return self.contract.errors(document)
+
+
+class ContractEnforcerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.request = build_order_tracking_request("ORD-123456")
+
+    def test_strict_mode_raises_and_counts(self):
+        enforcer = ContractEnforcer(SKILL_RESPONSE, "strict")
+        gateway = ContractGateway(broken_handler, responses=enforcer)
+
+        with self.assertLogs("contract_core.enforcement", "WARNING"):
+            with self.assertRaises(ValidationError):
+                gateway(self.request)
+
+        self.assertEqual({"$.status.code": 1}, dict(enforcer.stats.by_path))
+        self.assertEqual({"OK": 1}, dict(enforcer.stats.by_status))
+
+    def test_sampled_mode_checks_a_fraction_and_never_raises(self):
+        enforcer = ContractEnforcer(SKILL_RESPONSE, "sampled", sample_rate=0.2, rng=random.Random(3))
+        gateway = ContractGateway(broken_handler, responses=enforcer)
+
+        with self.assertLogs("contract_core.enforcement", "WARNING"):
+            for _ in range(1000):
+                gateway(self.request)
+
+        stats = enforcer.stats
+        self.assertEqual(1000, stats.seen)
+        self.assertEqual(1000, stats.checked + stats.skipped)
+        self.assertTrue(150 < stats.checked < 250, stats.checked)
+        self.assertEqual(stats.checked, stats.violations)
+
+    def test_async_mode_reports_off_the_request_path(self):
+        reported = []
+        enforcer = ContractEnforcer(
+            SKILL_RESPONSE, "async", on_violation=lambda document, errors: reported.append(errors[0].path)
+        )
+        self.addCleanup(enforcer.close)
+        gateway = ContractGateway(broken_handler, responses=enforcer)
+
+        with self.assertLogs("contract_core.enforcement", "WARNING"):
+            for _ in range(10):
+                gateway(self.request)
+            enforcer.drain()
+
+        self.assertEqual(["$.status.code"] * 10, reported)
+        self.assertEqual(10, enforcer.stats.checked)
+
+    def test_async_queue_is_bounded_and_counts_drops(self):
+        contract = BlockingContract(SKILL_RESPONSE)
+        enforcer = ContractEnforcer(contract, "async", queue_size=5)
+        response = handle_order_tracking_request(self.request)
+
+        for _ in range(20):
+            enforcer.check(response)
+        contract.release.set()
+        enforcer.close()
+
+        # One document may already be with the worker when the queue fills.
+        self.assertIn(enforcer.stats.dropped, (14, 15))
+        self.assertEqual(20, enforcer.stats.checked + enforcer.stats.dropped)
+        self.assertEqual(0, enforcer.stats.violations)
+
+    def test_async_check_after_close_is_dropped_not_stranded(self):
+        enforcer = ContractEnforcer(SKILL_RESPONSE, "async")
+        response = handle_order_tracking_request(self.request)
+        enforcer.check(response)
+        enforcer.close()
+
+        enforcer.check(response)
+        drained = threading.Thread(target=enforcer.drain, daemon=True)
+        drained.start()
+        drained.join(1)
+
+        self.assertFalse(drained.is_alive(), "drain() hung after close()")
+        self.assertEqual((2, 1, 1), (enforcer.stats.seen, enforcer.stats.checked, enforcer.stats.dropped))
+
+    def test_invalid_configuration(self):
+        with self.assertRaises(ValueError):
+            ContractEnforcer(SKILL_RESPONSE, "lenient")
+        with self.assertRaises(ValueError):
+            ContractEnforcer(SKILL_RESPONSE, "sampled", sample_rate=1.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import copy
+import json
+import unittest
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.provider import ResponseSkeletons, encode_order_tracking_response, handle_order_tracking_request
+from contract_core.validation import SKILL_RESPONSE
+
+
+def without_timings(response: dict) -> dict:
+    """The response with measured latencies zeroed (they differ on every call)."""
+    response = copy.deepcopy(response)
+    telemetry = response["telemetry"]
+    telemetry["latency_ms"] = 0
+    for call in telemetry["backend_calls"]:
+        call["latency_ms"] = 0
+    return response
+
+
+class ResponseSkeletonsTest(unittest.TestCase):
+    def setUp(self):
+        self.request = build_order_tracking_request("ORD-123456")
+
+    def assertSameResponse(self, request):
+        encoded = encode_order_tracking_response(request)
+        self.assertIsInstance(encoded, bytes)
+        self.assertEqual(without_timings(handle_order_tracking_request(request)), without_timings(json.loads(encoded)))
+        SKILL_RESPONSE.validate(json.loads(encoded))
+
+    def test_success_branch(self):
+        self.assertSameResponse(self.request)
+
+    def test_needs_more_info_branch(self):
+        for missing in (None, ""):
+            request = copy.deepcopy(self.request)
+            request["parameters"]["order_id"] = missing
+            self.assertSameResponse(request)
+        del request["parameters"]
+        self.assertSameResponse(request)
+
+    def test_dynamic_fields_are_escaped(self):
+        self.request["parameters"]["order_id"] = 'ORD-"1"\\é'
+        self.request["channel"]["type"] = "voice"
+        self.assertSameResponse(self.request)
+
+    def test_non_string_order_ids_match_the_handler(self):
+        for order_id in (42, 3.5, True, ["ORD-1"], {"id": "ORD-1"}, 0, None):
+            with self.subTest(order_id=order_id):
+                request = copy.deepcopy(self.request)
+                request["parameters"]["order_id"] = order_id
+                self.assertSameResponse(request)
+
+    def test_only_dynamic_fields_are_slots(self):
+        skeletons = ResponseSkeletons()
+
+        self.assertEqual(
+            {"request_id", "channel_hint", "order_id", "order_status", "carrier", "eta", "telemetry"},
+            skeletons.success.names,
+        )
+        self.assertEqual({"request_id", "channel_hint", "telemetry"}, skeletons.needs_order_id.names)
+
+    def test_missing_channel_fails_like_the_handler(self):
+        del self.request["channel"]
+
+        with self.assertRaises(KeyError):
+            encode_order_tracking_response(self.request)
+
+
+if __name__ == "__main__":
+    unittest.main()
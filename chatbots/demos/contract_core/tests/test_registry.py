@@ -0,0 +1,184 @@
+import contextlib
+import copy
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.gate import main as gate
+from contract_core.provider import handle_order_tracking_request
+from contract_core.registry import REGISTRY, ContractRegistry, SchemaChange, diff_schemas
+from contract_core.schemas import SKILL_RESPONSE_SCHEMA
+
+
+def changed(schema: dict, edit) -> dict:
+    schema = copy.deepcopy(schema)
+    edit(schema)
+    return schema
+
+
+def status(schema: dict) -> dict:
+    return schema["properties"]["status"]["properties"]
+
+
+class DiffTests(unittest.TestCase):
+
+    def test_identical_schemas_have_no_changes(self):
+        self.assertEqual([], diff_schemas(SKILL_RESPONSE_SCHEMA, copy.deepcopy(SKILL_RESPONSE_SCHEMA)))
+
+    def test_narrowed_enum(self):
+        new = changed(SKILL_RESPONSE_SCHEMA, lambda s: status(s)["code"]["enum"].remove("TECH_ERROR"))
+
+        self.assertEqual(
+            [SchemaChange("$.status.code", "narrowed", "value 'TECH_ERROR' no longer allowed")],
+            diff_schemas(SKILL_RESPONSE_SCHEMA, new),
+        )
+
+    def test_widened_enum(self):
+        new = changed(SKILL_RESPONSE_SCHEMA, lambda s: status(s)["code"]["enum"].append("PARTIAL"))
+
+        [change] = diff_schemas(SKILL_RESPONSE_SCHEMA, new)
+        self.assertEqual(("$.status.code", "widened"), (change.path, change.effect))
+
+    def test_removed_required_field(self):
+        new = changed(SKILL_RESPONSE_SCHEMA, lambda s: s["required"].remove("status"))
+
+        self.assertEqual(
+            [SchemaChange("$.status", "widened", "no longer required")],
+            diff_schemas(SKILL_RESPONSE_SCHEMA, new),
+        )
+
+    def test_added_required_field(self):
+        new = changed(SKILL_RESPONSE_SCHEMA, lambda s: s["required"].append("data"))
+
+        self.assertEqual(
+            [SchemaChange("$.data", "narrowed", "now required")],
+            diff_schemas(SKILL_RESPONSE_SCHEMA, new),
+        )
+
+    def test_type_changes(self):
+        def edit(s):
+            s["properties"]["request_id"]["type"] = "integer"
+            status(s)["message"]["type"] = "string"  # was ["string", "null"]
+            s["properties"]["data"]["type"] = ["object", "null"]
+
+        changes = {c.path: c.effect for c in diff_schemas(SKILL_RESPONSE_SCHEMA, changed(SKILL_RESPONSE_SCHEMA, edit))}
+
+        self.assertEqual(
+            {"$.request_id": "changed", "$.status.message": "narrowed", "$.data": "widened"},
+            changes,
+        )
+
+    def test_integer_is_a_number(self):
+        old = {"type": "object", "properties": {"n": {"type": "number"}}}
+        new = {"type": "object", "properties": {"n": {"type": "integer"}}}
+
+        self.assertEqual(["narrowed"], [c.effect for c in diff_schemas(old, new)])
+        self.assertEqual(["widened"], [c.effect for c in diff_schemas(new, old)])
+
+    def test_new_optional_property_is_added_unless_the_object_was_closed(self):
+        old = {"type": "object", "properties": {}}
+        new = {"type": "object", "properties": {"x": {"type": "string"}}}
+
+        self.assertEqual(["added"], [c.effect for c in diff_schemas(old, new)])
+        closed = dict(old, additionalProperties=False)
+        self.assertEqual(
+            {"$": "widened", "$.x": "widened"},
+            {c.path: c.effect for c in diff_schemas(closed, new)},
+        )
+
+    def test_bounds_items_and_patterns(self):
+        old = {"type": "array", "items": {"type": "string", "maxLength": 10}, "minItems": 1}
+        new = {"type": "array", "items": {"type": "string", "maxLength": 5, "pattern": "^O"}, "minItems": 0}
+
+        self.assertEqual(
+            [
+                SchemaChange("$", "widened", "minItems 1 -> 0"),
+                SchemaChange("$[*]", "narrowed", "maxLength 10 -> 5"),
+                SchemaChange("$[*]", "narrowed", "pattern None -> '^O'"),
+            ],
+            diff_schemas(old, new),
+        )
+
+
+class RegistryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.registry = ContractRegistry()
+        self.registry.register("skill_response", "v1", SKILL_RESPONSE_SCHEMA)
+        self.v2 = changed(SKILL_RESPONSE_SCHEMA, lambda s: status(s)["code"]["enum"].append("PARTIAL"))
+        self.registry.register("skill_response", "v2", self.v2)
+
+    def test_default_registry_has_the_v1_contracts(self):
+        self.assertEqual(["v1"], REGISTRY.versions("skill_request"))
+        self.assertIs(SKILL_RESPONSE_SCHEMA, REGISTRY.contract("skill_response", "v1").schema)
+
+    def test_versions_sort_numerically(self):
+        self.registry.register("skill_response", "v10", self.v2)
+
+        self.assertEqual(["v1", "v2", "v10"], self.registry.versions("skill_response"))
+        self.assertEqual("v10", self.registry.latest("skill_response"))
+
+    def test_reregistering_a_version_must_not_change_it(self):
+        self.registry.register("skill_response", "v2", copy.deepcopy(self.v2))
+
+        with self.assertRaises(ValueError):
+            self.registry.register("skill_response", "v2", SKILL_RESPONSE_SCHEMA)
+
+    def test_breaking_depends_on_the_mode(self):
+        self.assertFalse(self.registry.diff("skill_response", "v1", "v2").compatible)
+        self.assertTrue(self.registry.diff("skill_response", "v1", "v2", mode="backward").compatible)
+        self.assertFalse(self.registry.diff("skill_response", "v1", "v2", mode="forward").compatible)
+        with self.assertRaises(ValueError):
+            self.registry.diff("skill_response", "v1", "v2", mode="sideways")
+
+    def test_unknown_version(self):
+        with self.assertRaises(KeyError):
+            self.registry.schema("skill_response", "v9")
+
+
+class GateTests(unittest.TestCase):
+
+    def test_exit_status(self):
+        response = handle_order_tracking_request(build_order_tracking_request("ORD-1"))
+        with tempfile.TemporaryDirectory() as tmp:
+            same = Path(tmp, "same.json")
+            same.write_text(json.dumps(SKILL_RESPONSE_SCHEMA))
+            narrowed = Path(tmp, "narrowed.json")
+            narrowed.write_text(json.dumps(changed(SKILL_RESPONSE_SCHEMA, lambda s: s["required"].append("x"))))
+            corpus = Path(tmp, "corpus.jsonl")
+            corpus.write_text(json.dumps(response) + "\n")
+
+            args = ["--against", "v1", "--corpus", str(corpus), "--workers", "1"]
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertEqual(0, gate(["skill_response", str(same), "--version", "gate-a"] + args))
+                self.assertEqual(1, gate(["skill_response", str(narrowed), "--version", "gate-b"] + args))
+        self.assertNotIn("gate-a", REGISTRY.versions("skill_response"))
+
+    def test_candidate_labelled_as_the_next_version_is_diffed_against_the_latest(self):
+        def drop_tech_error(schema):
+            status(schema)["code"]["enum"].remove("TECH_ERROR")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            candidate = Path(tmp, "candidate.json")
+            candidate.write_text(json.dumps(changed(SKILL_RESPONSE_SCHEMA, drop_tech_error)))
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                self.assertEqual(1, gate(["skill_response", str(candidate), "--version", "v2"]))
+        self.assertIn("v1 -> v2", out.getvalue())
+        self.assertEqual(["v1"], REGISTRY.versions("skill_response"))
+
+    def test_registered_version_label_is_rejected(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            candidate = Path(tmp, "candidate.json")
+            candidate.write_text(json.dumps(SKILL_RESPONSE_SCHEMA))
+            with contextlib.redirect_stderr(io.StringIO()) as err, self.assertRaises(SystemExit) as exit:
+                gate(["skill_response", str(candidate), "--version", "v1"])
+        self.assertEqual(2, exit.exception.code)
+        self.assertIn("already registered", err.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
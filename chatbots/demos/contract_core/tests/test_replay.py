@@ -0,0 +1,91 @@
+import contextlib
+import io
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.corpus import map_chunks
+from contract_core.provider import handle_order_tracking_request
+from contract_core.replay import main, replay
+
+
+def broken_handler(request: dict) -> dict:
+    """The provider, except ORD-BAD* gets broken responses and ORD-CRASH raises."""
+    order_id = request["parameters"].get("order_id", "")
+    if order_id == "ORD-CRASH":
+        raise RuntimeError("backend down")
+    response = handle_order_tracking_request(request)
+    if order_id.startswith("ORD-BAD"):
+        response["status"]["code"] = "OK"
+        response["prompts"] = {}
+    return response
+
+
+def archive(*order_ids: str) -> list[bytes]:
+    lines = []
+    for order_id in order_ids:
+        request = build_order_tracking_request(order_id)
+        if not order_id:
+            del request["parameters"]["order_id"]
+        lines.append(json.dumps(request).encode() + b"\n")
+    return lines
+
+
+def _identity(chunk):
+    return chunk
+
+
+class ReplayTests(unittest.TestCase):
+
+    def test_clean_archive(self):
+        report = replay(archive("ORD-1", "", "ORD-2"), workers=1)
+
+        self.assertTrue(report.ok)
+        self.assertEqual((3, 3), (report.total, report.valid))
+        self.assertGreater(report.rate, 0)
+
+    def test_violations_by_path_and_status(self):
+        lines = archive("ORD-1", "ORD-BAD-1", "ORD-CRASH", "ORD-BAD-2") + [b"not json\n"]
+
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                report = replay(lines, handler=broken_handler, workers=workers, chunk_size=2)
+
+                self.assertEqual((5, 1, 2, 1, 1),
+                                 (report.total, report.valid, report.invalid, report.failed, report.undecodable))
+                self.assertEqual({"$.status.code": 2, "$.prompts": 2}, dict(report.by_path))
+                self.assertEqual({"OK": 2}, dict(report.by_status))
+                self.assertEqual([2, 3, 4, 5], [line for line, _ in report.examples])
+                self.assertIn("backend down", report.examples[1][1])
+                self.assertFalse(report.ok)
+
+    def test_pool_reads_ahead_a_bounded_number_of_chunks(self):
+        consumed = []
+
+        def chunks():
+            for i in range(1000):
+                consumed.append(i)
+                yield i, [b"{}"]
+
+        results = map_chunks(_identity, chunks(), workers=2)
+        self.assertEqual((0, [b"{}"]), next(results))
+        self.assertLessEqual(len(consumed), 2 * 2)
+        results.close()
+
+    def test_cli(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp, "requests.jsonl")
+            path.write_bytes(b"".join(archive("ORD-1", "ORD-2")))
+            out = io.StringIO()
+            with contextlib.redirect_stdout(out):
+                status = main([str(path), "--workers", "1"])
+
+        self.assertEqual(0, status)
+        self.assertTrue(out.getvalue().startswith("GO: 2 requests"))
+        self.assertIn("requests/s", out.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
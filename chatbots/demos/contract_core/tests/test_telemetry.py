@@ -0,0 +1,121 @@
+import itertools
+import json
+import unittest
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.provider import ResponseSkeletons, handle_order_tracking_request
+from contract_core.telemetry import Histogram, RequestTelemetry, TelemetryExporter
+
+
+def ticking(step_ns: int):
+    """A clock that advances ``step_ns`` nanoseconds per reading."""
+    return itertools.count(0, step_ns).__next__
+
+
+class RequestTelemetryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = TelemetryExporter()
+
+    def test_measures_handler_and_backend_calls(self):
+        telemetry = RequestTelemetry("order_tracking", self.exporter, clock=ticking(250_000))
+        with telemetry.call("OMS", "GET_ORDER_STATUS"):
+            pass
+
+        self.assertEqual(
+            {
+                "latency_ms": 0.75,
+                "backend_calls": [
+                    {"system": "OMS", "operation": "GET_ORDER_STATUS", "latency_ms": 0.25, "success": True},
+                ],
+            },
+            telemetry.finish(),
+        )
+        snapshot = self.exporter.snapshot()
+        self.assertEqual(1, snapshot["requests"]["order_tracking"]["count"])
+        self.assertEqual(0.25, snapshot["backend_calls"]["OMS.GET_ORDER_STATUS"]["sum"])
+
+    def test_failed_call_is_recorded_and_raised(self):
+        telemetry = RequestTelemetry("order_tracking", self.exporter)
+
+        with self.assertRaises(TimeoutError):
+            with telemetry.call("OMS", "GET_ORDER_STATUS"):
+                raise TimeoutError
+
+        self.assertFalse(telemetry.backend_calls[0]["success"])
+        self.assertIn("OMS.GET_ORDER_STATUS.failed", self.exporter.snapshot()["backend_calls"])
+        self.assertEqual({}, self.exporter.snapshot()["requests"])
+
+    def test_without_exporter(self):
+        telemetry = RequestTelemetry("order_tracking", exporter=None)
+
+        self.assertEqual([], telemetry.finish()["backend_calls"])
+
+
+class HistogramTests(unittest.TestCase):
+
+    def test_buckets_are_cumulative_and_inclusive(self):
+        histogram = Histogram((1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+
+        self.assertEqual({"buckets": {1: 2, 10: 3, float("inf"): 4}, "count": 4, "sum": 56.5}, histogram.snapshot())
+        self.assertEqual(1, histogram.quantile(0.5))
+        self.assertEqual(float("inf"), histogram.quantile(0.99))
+
+    def test_prometheus_exposition(self):
+        exporter = TelemetryExporter(bounds=(1, 10))
+        exporter.observe_request("order_tracking", 2)
+        exporter.observe_backend_call("OMS", "GET_ORDER_STATUS", False, 0.5)
+
+        text = exporter.prometheus()
+
+        self.assertIn("# TYPE skill_request_latency_ms histogram", text)
+        self.assertIn('skill_request_latency_ms_bucket{skill="order_tracking",le="1"} 0', text)
+        self.assertIn('skill_request_latency_ms_bucket{skill="order_tracking",le="+Inf"} 1', text)
+        self.assertIn(
+            'skill_backend_call_latency_ms_count{system="OMS",operation="GET_ORDER_STATUS",success="false"} 1', text
+        )
+
+
+class ProviderTelemetryTests(unittest.TestCase):
+
+    def setUp(self):
+        self.exporter = TelemetryExporter()
+        self.request = build_order_tracking_request("ORD-123456")
+        self.looked_up = []
+
+    def lookup(self, order_id):
+        self.looked_up.append(order_id)
+        return {"status": "DELIVERED", "carrier": "UPS", "eta": "2025-11-30"}
+
+    def test_handler_times_the_order_lookup(self):
+        response = handle_order_tracking_request(self.request, lookup=self.lookup, exporter=self.exporter)
+
+        self.assertEqual(["ORD-123456"], self.looked_up)
+        self.assertEqual("DELIVERED", response["data"]["status"])
+        [call] = response["telemetry"]["backend_calls"]
+        self.assertEqual(("OMS", "GET_ORDER_STATUS", True), (call["system"], call["operation"], call["success"]))
+        self.assertGreaterEqual(response["telemetry"]["latency_ms"], call["latency_ms"])
+        self.assertEqual(1, self.exporter.snapshot()["requests"]["order_tracking"]["count"])
+
+    def test_no_backend_call_without_an_order_id(self):
+        del self.request["parameters"]["order_id"]
+
+        response = handle_order_tracking_request(self.request, lookup=self.lookup, exporter=self.exporter)
+
+        self.assertEqual([], self.looked_up)
+        self.assertEqual([], response["telemetry"]["backend_calls"])
+
+    def test_skeletons_measure_too(self):
+        skeletons = ResponseSkeletons(lookup=self.lookup, exporter=self.exporter)
+        response = json.loads(skeletons.encode(self.request))
+
+        self.assertEqual(["ORD-123456"], self.looked_up)
+        self.assertEqual(("DELIVERED", "UPS"), (response["data"]["status"], response["data"]["carrier"]))
+        self.assertEqual(1, len(response["telemetry"]["backend_calls"]))
+        self.assertEqual(1, self.exporter.snapshot()["requests"]["order_tracking"]["count"])
+
+
+if __name__ == "__main__":
+    unittest.main()
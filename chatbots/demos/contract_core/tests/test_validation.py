@@ -0,0 +1,139 @@
+import copy
+import unittest
+
+from contract_core.consumer import build_order_tracking_request
+from contract_core.provider import handle_order_tracking_request
+from contract_core.schemas import SKILL_REQUEST_SCHEMA, SKILL_RESPONSE_SCHEMA
+from contract_core.validation import (
+    SKILL_REQUEST,
+    SKILL_RESPONSE,
+    CompiledContract,
+    ValidationError,
+    compile_contract,
+    validate,
+)
+
+try:
+    import jsonschema
+except ImportError:
+    jsonschema = None
+
+
+def _mutations(document: dict):
+    """The document itself, then one copy per field: removed, or set to a wrong-typed value."""
+    yield "unchanged", document
+
+    def walk(node, path):
+        if isinstance(node, dict):
+            for key in node:
+                yield path + (key,)
+                yield from walk(node[key], path + (key,))
+
+    for path in walk(document, ()):
+        for label, value in (("removed", None), ("number", 7), ("null", None), ("list", []), ("text", "x")):
+            mutated = copy.deepcopy(document)
+            parent = mutated
+            for key in path[:-1]:
+                parent = parent[key]
+            if label == "removed":
+                del parent[path[-1]]
+            else:
+                parent[path[-1]] = value
+            yield f"{'.'.join(path)} {label}", mutated
+
+
+def _path(error) -> str:
+    """A jsonschema error's path in ContractError form (missing properties are named)."""
+    parts = list(error.absolute_path)
+    if error.validator == "required":
+        parts.append(error.message.split("'")[1])
+    return "$" + "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in parts)
+
+
+class CompiledContractTests(unittest.TestCase):
+
+    def setUp(self):
+        self.request = build_order_tracking_request("ORD-123456")
+        self.response = handle_order_tracking_request(self.request)
+
+    def test_valid_documents(self):
+        self.assertTrue(SKILL_REQUEST.is_valid(self.request))
+        self.assertTrue(SKILL_RESPONSE.is_valid(self.response))
+        self.assertEqual([], SKILL_RESPONSE.errors(self.response))
+
+    def test_errors_report_every_problem_with_its_path(self):
+        self.response["status"]["code"] = "OK"
+        self.response["status"]["subcode"] = 3
+        del self.response["skill"]["name"]
+
+        errors = SKILL_RESPONSE.errors(self.response)
+
+        self.assertFalse(SKILL_RESPONSE.is_valid(self.response))
+        self.assertEqual(
+            [("$.skill.name", "required"), ("$.status.code", "enum"), ("$.status.subcode", "type")],
+            [(e.path, e.keyword) for e in errors],
+        )
+
+    def test_validate_raises_with_all_errors(self):
+        del self.request["parameters"]["order_id"]
+
+        with self.assertRaises(ValidationError) as raised:
+            validate(self.request, SKILL_REQUEST_SCHEMA)
+
+        self.assertEqual(["$.parameters.order_id"], [e.path for e in raised.exception.errors])
+
+    def test_schemas_are_compiled_once(self):
+        self.assertIs(SKILL_RESPONSE, compile_contract(SKILL_RESPONSE_SCHEMA))
+
+    def test_array_items_and_closed_objects(self):
+        contract = CompiledContract({
+            "type": "object",
+            "properties": {"codes": {"type": "array", "items": {"enum": ["A", 1]}, "maxItems": 3}},
+            "additionalProperties": False,
+        })
+
+        errors = contract.errors({"codes": ["A", True, 1, "B"], "extra": {}})
+
+        self.assertEqual(
+            ["$.codes", "$.codes[1]", "$.codes[3]", "$.extra"],
+            sorted(e.path for e in errors),
+        )
+
+    def test_unconstrained_additional_properties_allow_anything(self):
+        for extra in ({}, {"description": "free-form metadata"}):
+            with self.subTest(additionalProperties=extra):
+                contract = CompiledContract({"type": "object", "additionalProperties": extra})
+
+                self.assertTrue(contract.is_valid({"a": 1, "b": [None]}))
+                self.assertEqual([], contract.errors({"a": 1}))
+                self.assertEqual(["$"], [e.path for e in contract.errors([])])
+
+    def test_unsupported_keywords_fail_at_compile_time(self):
+        with self.assertRaises(ValueError):
+            CompiledContract({"type": "object", "properties": {"a": {"anyOf": [{"type": "string"}]}}})
+
+    @unittest.skipIf(jsonschema is None, "jsonschema not installed")
+    def test_schemas_match_the_workshop_demo(self):
+        import test_contract_testing as demo
+
+        self.assertEqual(demo.SKILL_REQUEST_SCHEMA, SKILL_REQUEST_SCHEMA)
+        self.assertEqual(demo.SKILL_RESPONSE_SCHEMA, SKILL_RESPONSE_SCHEMA)
+        request = demo.build_order_tracking_request("ORD-123456")
+        self.assertTrue(SKILL_RESPONSE.is_valid(demo.handle_order_tracking_request(request)))
+
+    @unittest.skipIf(jsonschema is None, "jsonschema not installed")
+    def test_agrees_with_jsonschema_on_mutated_documents(self):
+        for contract, schema, document in (
+            (SKILL_REQUEST, SKILL_REQUEST_SCHEMA, self.request),
+            (SKILL_RESPONSE, SKILL_RESPONSE_SCHEMA, self.response),
+        ):
+            reference = jsonschema.validators.validator_for(schema)(schema)
+            for label, mutated in _mutations(document):
+                with self.subTest(schema=contract.name, mutation=label):
+                    expected = {_path(error) for error in reference.iter_errors(mutated)}
+                    self.assertEqual(reference.is_valid(mutated), contract.is_valid(mutated))
+                    self.assertEqual(expected, {e.path for e in contract.errors(mutated)})
+
+
+if __name__ == "__main__":
+    unittest.main()
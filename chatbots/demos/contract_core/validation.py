@@ -0,0 +1,353 @@
+# contract_core/validation.py
+# Contract schemas compiled once into generated Python functions.
+#
+# jsonschema.validate checks the schema against its meta-schema and builds a
+# validator on every call. Here each schema is turned into Python source
+# specialized to it (one nested block per property, constants hoisted),
+# compiled once, and reused:
+#
+#   SKILL_RESPONSE.is_valid(response)   # fast fail, stops at the first problem
+#   SKILL_RESPONSE.errors(response)     # every problem, with JSON paths
+#   SKILL_RESPONSE.validate(response)   # raises ValidationError
+#
+# The generator covers the JSON-schema subset the contracts use; any other
+# keyword is rejected at compile time rather than silently ignored.
+#
+# casanova_core/validation.py checks tool arguments against the same keyword
+# subset with plain closures. It is a separate compiler on purpose:
+# contract_core does not depend on casanova_core, and the two serve different
+# readers. Here errors are ``ContractError`` with JSON paths and the failing
+# keyword, counted by path in corpus reports and raised as ValidationError by
+# the enforcer, and the fast-fail ``is_valid`` is generated code because it
+# runs on every response and across whole archives. The casanova one reports
+# problems to the model as tool results. Keep the two keyword sets in step.
+
+import re
+from dataclasses import dataclass
+from typing import Any, Callable
+
+__all__ = [
+    "ContractError",
+    "ValidationError",
+    "CompiledContract",
+    "compile_contract",
+    "validate",
+    "SKILL_REQUEST",
+    "SKILL_RESPONSE",
+]
+
+ANNOTATIONS = {"$id", "$schema", "$comment", "title", "description", "default", "examples"}
+KEYWORDS = {
+    "type", "enum", "const",
+    "properties", "required", "additionalProperties",
+    "items", "minItems", "maxItems",
+    "minLength", "maxLength", "pattern",
+    "minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum",
+}
+
+# Python expression testing value ``{v}`` against each JSON type.
+TYPE_TESTS = {
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "string": "isinstance({v}, str)",
+    "integer": "(isinstance({v}, int) and not isinstance({v}, bool)"
+               " or isinstance({v}, float) and {v}.is_integer())",
+    "number": "(isinstance({v}, (int, float)) and not isinstance({v}, bool))",
+    "boolean": "isinstance({v}, bool)",
+    "null": "{v} is None",
+}
+
+BOUNDS = {"minimum": "<", "maximum": ">", "exclusiveMinimum": "<=", "exclusiveMaximum": ">="}
+
+
+@dataclass(frozen=True)
+class ContractError:
+    path: str  # "$.status.code", "$.prompts[0]"
+    message: str
+    keyword: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+class ValidationError(ValueError):
+    """Raised by ``CompiledContract.validate``; ``errors`` lists every problem."""
+
+    def __init__(self, errors: list[ContractError]):
+        super().__init__("; ".join(map(str, errors)))
+        self.errors = errors
+
+
+class _Missing:
+    def __repr__(self):
+        return "<missing>"
+
+
+_MISSING = _Missing()
+
+
+def _json_type(value: Any) -> str:
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "boolean"
+    for name, cls in (("object", dict), ("array", list), ("string", str), ("integer", int), ("number", float)):
+        if isinstance(value, cls):
+            return name
+    return type(value).__name__
+
+
+def _same(a: Any, b: Any) -> bool:
+    """JSON equality: ``True`` is not ``1``."""
+    if isinstance(a, bool) or isinstance(b, bool):
+        return type(a) is type(b) and a == b
+    if isinstance(a, dict) and isinstance(b, dict):
+        return a.keys() == b.keys() and all(_same(a[k], b[k]) for k in a)
+    if isinstance(a, list) and isinstance(b, list):
+        return len(a) == len(b) and all(_same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def _in_enum(value: Any, allowed: tuple) -> bool:
+    return any(_same(value, candidate) for candidate in allowed)
+
+
+# -------------------------------------------------------------------
+# Code generation
+# -------------------------------------------------------------------
+
+class _Expr(str):
+    """A path only known at run time, as a Python expression (static paths are plain str)."""
+
+
+def _path_code(path: str) -> str:
+    return str(path) if isinstance(path, _Expr) else repr(path)
+
+
+def _join(path: str, name: str) -> str:
+    if isinstance(path, _Expr):
+        return _Expr(f"{path} + {'.' + name!r}")
+    return f"{path}.{name}"
+
+
+def _dynamic(path: str, suffix: str) -> str:
+    return _Expr(f"{_path_code(path)} + {suffix}")
+
+
+def _constraints(schema: dict) -> bool:
+    return bool(set(schema) - ANNOTATIONS)
+
+
+class _Generator:
+    """
+    Emits the body of one function. In ``collect`` mode every problem is
+    appended to ``errors`` (and the checks below a failed type check are
+    skipped); otherwise the function returns False at the first problem.
+    """
+
+    def __init__(self, collect: bool):
+        self.collect = collect
+        self.lines: list[str] = []
+        self.constants: dict[str, Any] = {"_MISSING": _MISSING, "_in_enum": _in_enum, "_json_type": _json_type}
+        self._names = 0
+
+    def name(self, prefix: str) -> str:
+        self._names += 1
+        return f"{prefix}{self._names}"
+
+    def constant(self, value: Any) -> str:
+        name = self.name("_k")
+        self.constants[name] = value
+        return name
+
+    def emit(self, depth: int, line: str) -> None:
+        self.lines.append("    " * depth + line)
+
+    def fail(self, depth: int, path: str, message: str, keyword: str) -> None:
+        """``message`` is a Python expression (usually an f-string)."""
+        if self.collect:
+            self.emit(depth, f"errors.append(_Error({_path_code(path)}, {message}, {keyword!r}))")
+        else:
+            self.emit(depth, "return False")
+
+    def schema(self, schema: dict, v: str, path: str, depth: int) -> None:
+        unknown = set(schema) - ANNOTATIONS - KEYWORDS
+        if unknown:
+            raise ValueError(f"unsupported schema keywords at {path}: {sorted(unknown)}")
+        if "type" not in schema:
+            self.body(schema, v, path, depth, None)
+            return
+
+        names = schema["type"] if isinstance(schema["type"], list) else [schema["type"]]
+        test = " or ".join(TYPE_TESTS[n].format(v=v) for n in names)
+        expected = " or ".join(names)
+        self.emit(depth, f"if not ({test}):")
+        self.fail(depth + 1, path, f'f"expected {expected}, got {{_json_type({v})}}"', "type")
+        if self.collect and set(schema) - ANNOTATIONS - {"type"}:
+            self.emit(depth, "else:")
+            self.body(schema, v, path, depth + 1, names)
+        else:
+            self.body(schema, v, path, depth, names)
+
+    def body(self, schema: dict, v: str, path: str, depth: int, types: list[str] | None) -> None:
+        def guarded(type_name: str) -> int:
+            """Keywords for one type only apply to values of that type."""
+            if types == [type_name]:
+                return depth
+            self.emit(depth, f"if {TYPE_TESTS[type_name].format(v=v)}:")
+            return depth + 1
+
+        if "enum" in schema:
+            allowed = tuple(schema["enum"])
+            if all(isinstance(a, str) for a in allowed):
+                test = f"isinstance({v}, str) and {v} in {self.constant(frozenset(allowed))}"
+            else:
+                test = f"_in_enum({v}, {self.constant(allowed)})"
+            self.emit(depth, f"if not ({test}):")
+            listed = self.constant(list(allowed))
+            self.fail(depth + 1, path, f'f"{{{v}!r}} is not one of {{{listed}}}"', "enum")
+
+        if "const" in schema:
+            const = self.constant((schema["const"],))
+            self.emit(depth, f"if not _in_enum({v}, {const}):")
+            self.fail(depth + 1, path, f'f"expected {{{const}[0]!r}}, got {{{v}!r}}"', "const")
+
+        if {"minLength", "maxLength", "pattern"} & set(schema):
+            inner = guarded("string")
+            if "minLength" in schema:
+                self.emit(inner, f"if len({v}) < {int(schema['minLength'])}:")
+                self.fail(inner + 1, path, f'"shorter than {schema["minLength"]} characters"', "minLength")
+            if "maxLength" in schema:
+                self.emit(inner, f"if len({v}) > {int(schema['maxLength'])}:")
+                self.fail(inner + 1, path, f'"longer than {schema["maxLength"]} characters"', "maxLength")
+            if "pattern" in schema:
+                pattern = self.constant(re.compile(schema["pattern"]))
+                self.emit(inner, f"if not {pattern}.search({v}):")
+                self.fail(inner + 1, path, f'f"does not match {{{pattern}.pattern!r}}"', "pattern")
+
+        bounds = [key for key in BOUNDS if key in schema]
+        if bounds:
+            inner = guarded("number")
+            for key in bounds:
+                self.emit(inner, f"if {v} {BOUNDS[key]} {schema[key]!r}:")
+                self.fail(inner + 1, path, f'f"{{{v}!r}} violates {key} {schema[key]!r}"', key)
+
+        if {"properties", "required", "additionalProperties"} & set(schema):
+            self.object(schema, v, path, guarded("object"))
+
+        if {"items", "minItems", "maxItems"} & set(schema):
+            self.array(schema, v, path, guarded("array"))
+
+    def object(self, schema: dict, v: str, path: str, depth: int) -> None:
+        properties: dict = schema.get("properties", {})
+        required = schema.get("required", [])
+        emitted = len(self.lines)
+        for name in required:
+            if name not in properties or not _constraints(properties[name]):
+                self.emit(depth, f"if {name!r} not in {v}:")
+                self.fail(depth + 1, _join(path, name), '"is required"', "required")
+        for name, sub in properties.items():
+            if not _constraints(sub):
+                continue
+            x, sub_path = self.name("v"), _join(path, name)
+            self.emit(depth, f"{x} = {v}.get({name!r}, _MISSING)")
+            if name in required:
+                self.emit(depth, f"if {x} is _MISSING:")
+                self.fail(depth + 1, sub_path, '"is required"', "required")
+                if self.collect:
+                    self.emit(depth, "else:")
+                    self.schema(sub, x, sub_path, depth + 1)
+                else:
+                    self.schema(sub, x, sub_path, depth)
+            else:
+                self.emit(depth, f"if {x} is not _MISSING:")
+                self.schema(sub, x, sub_path, depth + 1)
+
+        extra = schema.get("additionalProperties", True)
+        # An empty (or annotation-only) schema allows anything, like True.
+        if extra is False or extra is not True and _constraints(extra):
+            key, x = self.name("key"), self.name("v")
+            self.emit(depth, f"for {key}, {x} in {v}.items():")
+            self.emit(depth + 1, f"if {key} not in {self.constant(frozenset(properties))}:")
+            extra_path = _dynamic(path, f"'.' + {key}")
+            if extra is False:
+                self.fail(depth + 2, extra_path, '"is not an allowed property"', "additionalProperties")
+            else:
+                self.schema(extra, x, extra_path, depth + 2)
+        if len(self.lines) == emitted:
+            self.emit(depth, "pass")
+
+    def array(self, schema: dict, v: str, path: str, depth: int) -> None:
+        emitted = len(self.lines)
+        if "minItems" in schema:
+            self.emit(depth, f"if len({v}) < {int(schema['minItems'])}:")
+            self.fail(depth + 1, path, f'"fewer than {schema["minItems"]} items"', "minItems")
+        if "maxItems" in schema:
+            self.emit(depth, f"if len({v}) > {int(schema['maxItems'])}:")
+            self.fail(depth + 1, path, f'"more than {schema["maxItems"]} items"', "maxItems")
+        if "items" in schema and _constraints(schema["items"]):
+            i, x = self.name("i"), self.name("v")
+            self.emit(depth, f"for {i}, {x} in enumerate({v}):")
+            self.schema(schema["items"], x, _dynamic(path, f"'[' + str({i}) + ']'"), depth + 1)
+        if len(self.lines) == emitted:
+            self.emit(depth, "pass")
+
+
+def _build(schema: dict, collect: bool, name: str) -> tuple[Callable, str]:
+    gen = _Generator(collect)
+    gen.schema(schema, "instance", "$", 1)
+    if collect:
+        header = [f"def {name}(instance):", "    errors = []"]
+        footer = ["    return errors"]
+    else:
+        header = [f"def {name}(instance):"]
+        footer = ["    return True"]
+    source = "\n".join(header + gen.lines + footer) + "\n"
+    namespace = dict(gen.constants, _Error=ContractError)
+    exec(compile(source, f"<contract {name}>", "exec"), namespace)
+    return namespace[name], source
+
+
+# -------------------------------------------------------------------
+# Public API
+# -------------------------------------------------------------------
+
+class CompiledContract:
+    """One schema, compiled into ``is_valid`` (fast fail) and ``errors`` (all problems)."""
+
+    def __init__(self, schema: dict, name: str | None = None):
+        self.schema = schema
+        self.name = name or schema.get("$id", "contract")
+        self.is_valid, is_valid_source = _build(schema, collect=False, name="is_valid")
+        self.errors, errors_source = _build(schema, collect=True, name="errors")
+        self.source = is_valid_source + "\n\n" + errors_source
+
+    def validate(self, instance: Any) -> None:
+        if not self.is_valid(instance):
+            raise ValidationError(self.errors(instance))
+
+    def __repr__(self) -> str:
+        return f"CompiledContract({self.name!r})"
+
+
+# id(schema) -> compiled contract; the schema is kept alive with it so the id stays unique.
+_compiled: dict[int, CompiledContract] = {}
+
+
+def compile_contract(schema: dict) -> CompiledContract:
+    """Compiles ``schema``, or returns the contract compiled for this schema object before."""
+    contract = _compiled.get(id(schema))
+    if contract is None or contract.schema is not schema:
+        contract = _compiled[id(schema)] = CompiledContract(schema)
+    return contract
+
+
+def validate(instance: Any, schema: dict) -> None:
+    """Drop-in for ``jsonschema.validate`` on contract schemas (compiled on first use)."""
+    compile_contract(schema).validate(instance)
+
+
+from .schemas import SKILL_REQUEST_SCHEMA, SKILL_RESPONSE_SCHEMA  # noqa: E402
+
+SKILL_REQUEST = compile_contract(SKILL_REQUEST_SCHEMA)
+SKILL_RESPONSE = compile_contract(SKILL_RESPONSE_SCHEMA)
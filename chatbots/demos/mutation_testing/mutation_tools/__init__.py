@@ -0,0 +1,5 @@
+from .scheduler import *
+from .worker import *
+from .cache import *
+from .differential import *
+from .pruning import *
@@ -0,0 +1,5 @@
+import sys
+
+from .scheduler import main
+
+sys.exit(main())
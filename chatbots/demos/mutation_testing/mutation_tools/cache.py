@@ -0,0 +1,166 @@
+"""
+Incremental mutation testing: an on-disk cache of mutant outcomes.
+
+Each outcome (killed, survived, timeout) is stored under a fingerprint of
+everything that can change it:
+
+  - the source of the function being mutated (its ``*__mutmut_orig`` copy)
+  - the mutant itself, i.e. the mutated source; mutmut does not label its
+    operators, and the mutated source pins down operator and location
+  - the source of every covering test from ``mutmut-stats.json``, plus the
+    non-test code of its module (imports, helpers, ``setUp``)
+
+Sources are compared as normalized ASTs, so comment and formatting edits do
+not invalidate anything. After a small edit to ``rules.py`` only mutants of
+the edited function (or of functions whose tests changed) are run again.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import hashlib
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from .scheduler import (
+    KILLED,
+    MUTANT_SEPARATOR,
+    SURVIVED,
+    TIMEOUT,
+    MutantResult,
+    MutationStats,
+    function_name_of,
+    function_nodes,
+)
+
+__all__ = ["ResultCache", "fingerprint_mutants"]
+
+CACHE_FILE = "result-cache.json"
+CACHEABLE = (KILLED, SURVIVED, TIMEOUT)
+
+
+def _digest(*parts: str) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\0")
+    return h.hexdigest()
+
+
+def _normalized(node: ast.AST) -> str:
+    # The mangled name differs between the original and each mutant; only the
+    # body and signature matter.
+    node = copy.copy(node)
+    node.name = "_"
+    return ast.unparse(node)
+
+
+def _function_hashes(mutants_dir: Path) -> Dict[str, str]:
+    """
+    ``<module>.<mangled name>__mutmut_<orig|n>`` -> hash of its normalized source.
+    """
+    return {key: _digest(_normalized(node)) for key, node in function_nodes(mutants_dir).items()}
+
+
+class _TestHasher:
+    """
+    Hashes ``path::Class::test_method`` ids, parsing each test file once.
+    """
+
+    def __init__(self, mutants_dir: Path):
+        self.mutants_dir = Path(mutants_dir)
+        self._files: Dict[str, tuple] = {}
+
+    def _parse(self, path: str) -> tuple:
+        if path not in self._files:
+            tree = ast.parse((self.mutants_dir / path).read_text(encoding="utf-8"))
+            tests = {}
+            fixtures = copy.deepcopy(tree)
+            for cls in (n for n in fixtures.body if isinstance(n, ast.ClassDef)):
+                kept = []
+                for node in cls.body:
+                    if isinstance(node, ast.FunctionDef) and node.name.startswith("test"):
+                        tests[f"{cls.name}::{node.name}"] = ast.unparse(node)
+                    else:
+                        kept.append(node)
+                cls.body = kept or [ast.Pass()]
+            self._files[path] = (ast.unparse(fixtures), tests)
+        return self._files[path]
+
+    def __call__(self, test_id: str) -> str:
+        path, _, name = test_id.partition("::")
+        try:
+            fixtures, tests = self._parse(path)
+        except FileNotFoundError:
+            return _digest(test_id, "<missing>")
+        return _digest(fixtures, tests.get(name, "<missing>"))
+
+
+def fingerprint_mutants(
+    mutants_dir: Path,
+    mutants: Iterable[str],
+    stats: MutationStats,
+) -> Dict[str, str]:
+    """
+    Computes the cache key of every mutant in ``mutants``.
+    """
+    functions = _function_hashes(mutants_dir)
+    test_hash = _TestHasher(mutants_dir)
+    keys = {}
+    for mutant in mutants:
+        function = function_name_of(mutant)
+        tests = sorted(test_hash(t) for t in stats.tests_for(mutant))
+        keys[mutant] = _digest(
+            functions.get(f"{function}{MUTANT_SEPARATOR}orig", ""),
+            functions.get(mutant, mutant),
+            *tests,
+        )
+    return keys
+
+
+class ResultCache:
+    """
+    Fingerprint -> outcome of a previous run, persisted as JSON.
+    """
+
+    def __init__(self, path: Path, entries: Optional[Dict[str, dict]] = None):
+        self.path = Path(path)
+        self.entries: Dict[str, dict] = entries or {}
+
+    @classmethod
+    def load(cls, path: Path) -> "ResultCache":
+        path = Path(path)
+        if not path.exists():
+            return cls(path)
+        return cls(path, json.loads(path.read_text(encoding="utf-8")))
+
+    def save(self) -> None:
+        self.path.write_text(json.dumps(self.entries, indent=4, sort_keys=True), encoding="utf-8")
+
+    def get(self, mutant: str, key: str) -> Optional[MutantResult]:
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        return MutantResult(
+            mutant=mutant,
+            status=entry["status"],
+            tests_run=list(entry.get("tests_run", [])),
+            killing_test=entry.get("killing_test"),
+            duration=entry.get("duration", 0.0),
+            cached=True,
+        )
+
+    def put(self, key: str, result: MutantResult) -> None:
+        if result.status not in CACHEABLE or result.inferred_from:
+            return
+        entry = asdict(result)
+        del entry["mutant"], entry["cached"], entry["inferred_from"]
+        self.entries[key] = entry
+
+    def prune(self, live_keys: Iterable[str]) -> None:
+        """Drops entries no current mutant maps to, so the file does not grow forever."""
+        live = set(live_keys)
+        self.entries = {k: v for k, v in self.entries.items() if k in live}
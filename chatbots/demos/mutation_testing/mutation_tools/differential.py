@@ -0,0 +1,477 @@
+"""
+Differential evaluation of mutants over generated inputs.
+
+The original code and each mutant are run side by side, in one process, on
+inputs generated from the source of the module's public functions, and for
+every mutant we record the inputs on which it behaves differently. A mutant
+that never differs is one the tests are unlikely to kill through those
+functions.
+
+Results are observed the way the tests observe them. When a function
+returns value objects built from literals (``Decision("DENIED", "...")``),
+the observation of a result is whether it ``==`` each of those literals,
+constructed and compared with the mutant active, exactly like
+``assertEqual(Decision(...), decision)`` does. Otherwise the result's type
+and attributes are compared.
+
+With the whole boundary grid (``prescreen``) this doubles as a pre-screen
+that needs no test run at all: a mutant that never differs is a probable
+survivor, and for every other mutant the first differing input is a
+concrete test case that would kill it.
+"""
+
+from __future__ import annotations
+
+import ast
+import inspect
+import itertools
+import random
+import textwrap
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+from . import worker
+
+__all__ = [
+    "InputSpace",
+    "Probe",
+    "DifferentialResult",
+    "derive_input_space",
+    "evaluate_mutants",
+    "prescreen",
+    "format_prescreen",
+]
+
+BASE_DATE = date(2025, 1, 1)
+DATE_OFFSETS = (0, 1, 29, 30, 31, 60)
+NUMBER_DEFAULTS = (0, 1, 30)
+OTHER_STRING = "OTHER"
+
+
+# ============================================================
+# Input generation
+# ============================================================
+
+@dataclass
+class InputSpace:
+    """
+    Candidate values per input variable of one function. Variables are
+    parameters (``request_date``) or attributes read off a parameter
+    (``order.amount``); the latter are passed in as a ``SimpleNamespace``.
+    """
+    params: List[str]
+    domains: Dict[str, List[Any]]
+
+    def size(self) -> int:
+        size = 1
+        for values in self.domains.values():
+            size *= len(values)
+        return size
+
+    def grid(self) -> Iterator[Dict[str, Any]]:
+        names = sorted(self.domains)
+        for values in itertools.product(*(self.domains[n] for n in names)):
+            yield dict(zip(names, values))
+
+    def sample(self, n: int, seed: int = 0) -> List[Dict[str, Any]]:
+        if self.size() <= n:
+            return list(self.grid())
+        rng = random.Random(seed)
+        names = sorted(self.domains)
+        seen = set()
+        while len(seen) < n:
+            seen.add(tuple(rng.randrange(len(self.domains[name])) for name in names))
+        return [
+            {name: self.domains[name][i] for name, i in zip(names, picks)}
+            for picks in sorted(seen)
+        ]
+
+    def arguments(self, assignment: Dict[str, Any]) -> List[Any]:
+        args = []
+        for param in self.params:
+            if param in assignment:
+                args.append(assignment[param])
+            else:
+                prefix = param + "."
+                args.append(SimpleNamespace(**{
+                    name[len(prefix):]: value
+                    for name, value in assignment.items()
+                    if name.startswith(prefix)
+                }))
+        return args
+
+
+def _dedupe(values: List[Any]) -> List[Any]:
+    out = []
+    for value in values:
+        if not any(value == v and type(value) is type(v) for v in out):
+            out.append(value)
+    return out
+
+
+def _domain(kind: Optional[str], constants: List[Any]) -> List[Any]:
+    if constants:
+        values: List[Any] = []
+        for c in constants:
+            if isinstance(c, bool) or c is None:
+                values += [c, not c]
+            elif isinstance(c, (int, float)):
+                values += [c - 1, c, c + 1]
+            else:
+                values.append(c)
+        if any(isinstance(c, str) for c in constants):
+            values.append(OTHER_STRING)
+        return _dedupe(values)
+    if kind == "bool":
+        return [False, True]
+    if kind == "date":
+        return [BASE_DATE + timedelta(days=k) for k in DATE_OFFSETS]
+    if kind == "number":
+        return list(NUMBER_DEFAULTS)
+    return [None]
+
+
+def derive_input_space(fn: ast.FunctionDef) -> InputSpace:
+    """
+    Derives candidate values from how ``fn`` uses its inputs:
+
+      - compared with a literal: the literal and its neighbours
+        (``amount > 500`` -> 499, 500, 501; ``region == "US"`` -> "US", "OTHER")
+      - used as a condition: ``False`` / ``True``
+      - annotated as ``date``, or subtracted from a date: dates around ``BASE_DATE``
+      - compared with a computed value: a few small numbers
+      - a day count ``(a - b).days`` compared with a bound: ``b`` is pinned to
+        ``BASE_DATE`` and ``a`` placed one day before, on and after each
+        candidate bound (``> policy.max_refund_days`` -> 29, 30, 31 days)
+    """
+    params = [a.arg for a in fn.args.args if a.arg not in ("self", "cls")]
+
+    def var(node: ast.AST) -> Optional[str]:
+        if isinstance(node, ast.Name) and node.id in params:
+            return node.id
+        if (isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name)
+                and node.value.id in params):
+            return f"{node.value.id}.{node.attr}"
+        return None
+
+    kinds: Dict[str, str] = {}
+    constants: Dict[str, List[Any]] = defaultdict(list)
+    used: List[str] = []
+    # (later date, earlier date, bound) for every ``(later - earlier).days <op> bound``
+    day_bounds: List[Tuple[str, str, ast.AST]] = []
+
+    def day_count(node: ast.AST) -> Optional[Tuple[str, str]]:
+        if (isinstance(node, ast.Attribute) and node.attr == "days"
+                and isinstance(node.value, ast.BinOp) and isinstance(node.value.op, ast.Sub)
+                and var(node.value.left) and var(node.value.right)):
+            return var(node.value.left), var(node.value.right)
+        return None
+
+    for arg in fn.args.args:
+        if isinstance(arg.annotation, ast.Name) and arg.annotation.id == "date":
+            kinds[arg.arg] = "date"
+
+    def mark(node: ast.AST, kind: str) -> None:
+        name = var(node)
+        if name is not None:
+            kinds.setdefault(name, kind)
+
+    for node in ast.walk(fn):
+        name = var(node)
+        if name is not None and "." in name and name not in used:
+            used.append(name)
+        if isinstance(node, ast.Compare):
+            operands = [node.left] + node.comparators
+            for a, b in zip(operands, operands[1:]):
+                for x, y in ((a, b), (b, a)):
+                    if day_count(x) and (isinstance(y, ast.Constant) or var(y)):
+                        day_bounds.append(day_count(x) + (y,))
+                    if var(x) is None:
+                        continue
+                    if isinstance(y, ast.Constant):
+                        constants[var(x)].append(y.value)
+                    elif var(y) is None:
+                        mark(x, "number")
+        elif isinstance(node, (ast.If, ast.While, ast.IfExp)):
+            mark(node.test, "bool")
+        elif isinstance(node, ast.BoolOp):
+            for value in node.values:
+                mark(value, "bool")
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            mark(node.operand, "bool")
+        elif isinstance(node, ast.BinOp) and isinstance(node.op, ast.Sub):
+            if kinds.get(var(node.left)) == "date":
+                mark(node.right, "date")
+            if kinds.get(var(node.right)) == "date":
+                mark(node.left, "date")
+
+    # Parameters read only through attributes are built from those attributes.
+    objects = {name.partition(".")[0] for name in used}
+    names = [p for p in params if p not in objects] + used
+    domains = {name: _domain(kinds.get(name), constants.get(name, [])) for name in names}
+
+    for later, earlier, bound in day_bounds:
+        if kinds.get(later) != "date" or kinds.get(earlier) != "date":
+            continue
+        bounds = [bound.value] if isinstance(bound, ast.Constant) else domains.get(var(bound), [])
+        days = {0}
+        for b in bounds:
+            if isinstance(b, int) and not isinstance(b, bool):
+                days.update((b - 1, b, b + 1))
+        domains[earlier] = [BASE_DATE]
+        domains[later] = [BASE_DATE + timedelta(days=d) for d in sorted(days)]
+
+    return InputSpace(params=params, domains=domains)
+
+
+# ============================================================
+# Observation and evaluation (inside a worker process)
+# ============================================================
+
+def _format_value(value: Any) -> str:
+    return value.isoformat() if isinstance(value, date) else repr(value)
+
+
+@dataclass
+class Probe:
+    """One call of a public function on one generated input."""
+    entry: str
+    assignment: Dict[str, Any]
+
+    def __str__(self) -> str:
+        args = ", ".join(f"{k}={_format_value(v)}" for k, v in sorted(self.assignment.items()))
+        return f"{self.entry.rpartition('.')[2]}({args})"
+
+
+@dataclass
+class DifferentialResult:
+    probes: List[Probe]
+    # mutant -> indexes of the probes it changes; None when it was never
+    # reached from a public function or did not finish in time.
+    signatures: Dict[str, Optional[FrozenSet[int]]] = field(default_factory=dict)
+    # mutant -> (original result, mutant result) on its killing probe
+    outcomes: Dict[str, Tuple[str, str]] = field(default_factory=dict)
+    elapsed: float = 0.0
+
+    def killing_probe(self, mutant: str) -> Optional[Probe]:
+        signature = self.signatures.get(mutant)
+        return self.probes[min(signature)] if signature else None
+
+    def survivors(self) -> List[str]:
+        """Mutants that reached a public function but never changed its result."""
+        return [m for m, signature in self.signatures.items() if signature == frozenset()]
+
+    def unreached(self) -> List[str]:
+        return [m for m, signature in self.signatures.items() if signature is None]
+
+
+def _function_ast(fn: Callable) -> ast.FunctionDef:
+    return ast.parse(textwrap.dedent(inspect.getsource(fn))).body[0]
+
+
+def _value_literals(module: ModuleType, fn: ast.FunctionDef) -> List[Tuple[str, tuple]]:
+    literals = []
+    for node in ast.walk(fn):
+        if (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+                and isinstance(getattr(module, node.func.id, None), type)
+                and not node.keywords
+                and all(isinstance(a, ast.Constant) for a in node.args)):
+            literal = (node.func.id, tuple(a.value for a in node.args))
+            if literal not in literals:
+                literals.append(literal)
+    return literals
+
+
+def _describe(value: Any) -> str:
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        fields = ", ".join(f"{k}={v!r}" for k, v in vars(value).items())
+        return f"{type(value).__name__}({fields})"
+    return repr(value)
+
+
+def _structural(value: Any) -> Any:
+    if hasattr(value, "__dict__") and not isinstance(value, type):
+        return (type(value).__name__, tuple(sorted((k, repr(v)) for k, v in vars(value).items())))
+    return repr(value)
+
+
+@dataclass
+class _Entry:
+    label: str
+    module: ModuleType
+    fn: Callable
+    space: InputSpace
+    literals: List[Tuple[str, tuple]]
+
+    def observe(self, assignment: Dict[str, Any]) -> Any:
+        try:
+            result = self.fn(*self.space.arguments(assignment))
+        except Exception as ex:
+            return ("raised", type(ex).__name__)
+        if not self.literals:
+            return _structural(result)
+        seen = []
+        for cls_name, args in self.literals:
+            try:
+                seen.append(bool(getattr(self.module, cls_name)(*args) == result))
+            except Exception as ex:
+                seen.append(("raised", type(ex).__name__))
+        return tuple(seen)
+
+    def describe(self, assignment: Dict[str, Any]) -> str:
+        try:
+            return _describe(self.fn(*self.space.arguments(assignment)))
+        except Exception as ex:
+            return f"raises {type(ex).__name__}"
+
+
+def _entries(modules: List[ModuleType]) -> List[_Entry]:
+    entries = []
+    for module in modules:
+        names = getattr(module, "__all__", [n for n in vars(module) if not n.startswith("_")])
+        for name in names:
+            orig = getattr(module, f"x_{name}__mutmut_orig", None)
+            if not callable(orig):
+                continue
+            node = _function_ast(orig)
+            entries.append(_Entry(
+                label=f"{module.__name__}.{name}",
+                module=module,
+                fn=getattr(module, name),
+                space=derive_input_space(node),
+                literals=_value_literals(module, node),
+            ))
+    return entries
+
+
+class _Recorder:
+    """Trampoline that runs the original and remembers which functions were reached."""
+
+    def __init__(self):
+        self.reached = set()
+
+    def __call__(self, orig, mutants, call_args, call_kwargs, self_arg=None):
+        self.reached.add(id(mutants))
+        return orig(*call_args, **call_kwargs)
+
+
+def _evaluate_in_worker(
+    mutants: List[str],
+    inputs_per_entry: Optional[int],
+    seed: int,
+    timeout: Optional[float],
+) -> DifferentialResult:
+    switch = worker._switch
+    calls: List[Tuple[_Entry, Dict[str, Any]]] = []
+    for entry in _entries(worker._modules):
+        if inputs_per_entry is None:
+            assignments = list(entry.space.grid())
+        else:
+            assignments = entry.space.sample(inputs_per_entry, seed)
+        calls.extend((entry, a) for a in assignments)
+
+    recorder = _Recorder()
+    for module in worker._modules:
+        setattr(module, worker.TRAMPOLINE, recorder)
+    try:
+        baseline = [entry.observe(a) for entry, a in calls]
+    finally:
+        for module in worker._modules:
+            setattr(module, worker.TRAMPOLINE, switch)
+
+    result = DifferentialResult(probes=[Probe(entry.label, a) for entry, a in calls])
+    for mutant in mutants:
+        table = switch.table.get(mutant)
+        if table is None or id(table[0]) not in recorder.reached:
+            result.signatures[mutant] = None
+            continue
+        signature, mutated = None, None
+        switch.activate(mutant)
+        try:
+            with worker._time_limit(timeout):
+                signature = frozenset(
+                    i for i, (entry, a) in enumerate(calls) if entry.observe(a) != baseline[i]
+                )
+                if signature:
+                    entry, a = calls[min(signature)]
+                    mutated = entry.describe(a)
+        finally:
+            switch.activate(None)
+        if worker._timed_out:
+            signature = None
+        result.signatures[mutant] = signature
+        if signature:
+            entry, a = calls[min(signature)]
+            result.outcomes[mutant] = (entry.describe(a), mutated)
+    return result
+
+
+def evaluate_mutants(
+    mutants_dir: Path,
+    mutants: List[str],
+    inputs_per_entry: Optional[int] = 200,
+    seed: int = 0,
+    timeout: Optional[float] = 5.0,
+) -> DifferentialResult:
+    """
+    Evaluates ``mutants`` against the original on generated inputs for every
+    public function of the mutated modules: a random sample of
+    ``inputs_per_entry`` inputs each, or the whole grid when it is ``None``.
+    Runs in a separate process so the mutated modules never get imported
+    into the caller.
+    """
+    start = time.monotonic()
+    with ProcessPoolExecutor(
+        max_workers=1,
+        initializer=worker._init_worker,
+        initargs=(str(Path(mutants_dir).resolve()),),
+    ) as pool:
+        result = pool.submit(_evaluate_in_worker, list(mutants), inputs_per_entry, seed, timeout).result()
+    result.elapsed = time.monotonic() - start
+    return result
+
+
+# ============================================================
+# Pre-screen: the whole boundary grid, no tests
+# ============================================================
+
+def prescreen(
+    mutants_dir: Path,
+    mutants: Optional[List[str]] = None,
+    max_inputs_per_entry: int = 20000,
+) -> DifferentialResult:
+    """
+    Evaluates every mutant (or just ``mutants``) on the whole boundary grid
+    of each public function, falling back to a sample of
+    ``max_inputs_per_entry`` inputs when a grid is larger than that.
+    """
+    from .scheduler import discover_mutants
+
+    if mutants is None:
+        mutants = discover_mutants(mutants_dir)
+    return evaluate_mutants(mutants_dir, mutants, inputs_per_entry=max_inputs_per_entry)
+
+
+def format_prescreen(result: DifferentialResult) -> str:
+    survivors, unreached = result.survivors(), result.unreached()
+    lines = [
+        f"pre-screen: {len(result.signatures)} mutants, {len(result.probes)} inputs, "
+        f"{result.elapsed:.2f}s",
+        f"probable survivors (no difference on any input): {len(survivors)}",
+    ]
+    lines += [f"  {m}" for m in survivors]
+    lines.append(f"not reached from a public function or timed out: {len(unreached)}")
+    lines += [f"  {m}" for m in unreached]
+    lines.append(f"killing inputs: {len(result.outcomes)}")
+    for mutant, (original, mutated) in result.outcomes.items():
+        lines.append(f"  {mutant}")
+        lines.append(f"    {result.killing_probe(mutant)}")
+        lines.append(f"    original: {original}")
+        lines.append(f"    mutant:   {mutated}")
+    return "\n".join(lines)
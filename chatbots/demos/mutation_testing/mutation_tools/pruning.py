@@ -0,0 +1,171 @@
+"""
+Pre-pass that prunes likely-equivalent and redundant mutants before they run.
+
+mutmut turns the 37-line ``refunds/rules.py`` into 65 mutants, and many of
+them tell us nothing new: every case change of the same reason string fails
+exactly the same way, and several operator swaps in ``Decision.__eq__`` are
+killed by whatever kills a smaller set of other mutants. The pre-pass runs
+two cheap checks:
+
+  1. AST normalization. A mutant whose normalized source equals the
+     original (``500 < x`` vs ``x > 500``, ``not a == b`` vs ``a != b``) is
+     equivalent; one equal to another mutant is a duplicate.
+  2. Differential evaluation (``mutation_tools.differential``) on a sample of
+     generated inputs. A mutant that never behaves differently is probably
+     equivalent. A mutant whose set of differing inputs is the same as, or
+     a strict superset of, that of another mutant of the same function is
+     subsumed by it: any test that kills the other one is expected to kill
+     it too.
+
+Equivalent mutants are not run. Probably-equivalent ones still are, last:
+the generated inputs only observe results through the mutant's own
+constructor and ``__eq__``, so ``self.status = None`` in ``Decision`` looks
+equivalent there but is killed by any test asserting ``decision.status``,
+and skipping it would hide exactly that test gap. Subsumed mutants are also
+run last, and only if none of the mutants subsuming them was killed;
+otherwise they are reported as killed, inferred from that mutant.
+"""
+
+from __future__ import annotations
+
+import ast
+import copy
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, FrozenSet, List, Optional
+
+from .differential import evaluate_mutants
+from .scheduler import MUTANT_SEPARATOR, function_name_of, function_nodes
+
+__all__ = ["PrunePlan", "canonical_source", "plan_pruning"]
+
+_FLIPPED = {ast.Lt: ast.Gt, ast.Gt: ast.Lt, ast.LtE: ast.GtE, ast.GtE: ast.LtE, ast.Eq: ast.Eq, ast.NotEq: ast.NotEq}
+_NEGATED = {ast.Eq: ast.NotEq, ast.NotEq: ast.Eq, ast.In: ast.NotIn, ast.NotIn: ast.In, ast.Is: ast.IsNot, ast.IsNot: ast.Is}
+
+
+class _Canonicalizer(ast.NodeTransformer):
+    def visit_Compare(self, node: ast.Compare) -> ast.AST:
+        self.generic_visit(node)
+        if (len(node.ops) == 1 and type(node.ops[0]) in _FLIPPED
+                and isinstance(node.left, ast.Constant)
+                and not isinstance(node.comparators[0], ast.Constant)):
+            return ast.Compare(
+                left=node.comparators[0],
+                ops=[_FLIPPED[type(node.ops[0])]()],
+                comparators=[node.left],
+            )
+        return node
+
+    def visit_UnaryOp(self, node: ast.UnaryOp) -> ast.AST:
+        self.generic_visit(node)
+        operand = node.operand
+        if (isinstance(node.op, ast.Not) and isinstance(operand, ast.Compare)
+                and len(operand.ops) == 1 and type(operand.ops[0]) in _NEGATED):
+            return ast.Compare(
+                left=operand.left,
+                ops=[_NEGATED[type(operand.ops[0])]()],
+                comparators=operand.comparators,
+            )
+        return node
+
+
+def canonical_source(node: ast.FunctionDef) -> str:
+    """
+    Source of ``node`` with its name dropped and comparisons in one canonical form.
+    """
+    node = copy.deepcopy(node)
+    node.name = "_"
+    return ast.unparse(_Canonicalizer().visit(node))
+
+
+@dataclass
+class PrunePlan:
+    # mutant -> why it is considered equivalent
+    equivalent: Dict[str, str] = field(default_factory=dict)
+    # mutant -> why it is probably equivalent (still run, last)
+    probably_equivalent: Dict[str, str] = field(default_factory=dict)
+    # mutant -> the mutants that subsume it (killing any of them kills it)
+    subsumed_by: Dict[str, List[str]] = field(default_factory=dict)
+    inputs: int = 0
+    elapsed: float = 0.0
+
+    def first(self, mutants: List[str]) -> List[str]:
+        """Mutants to run up front: neither (probably) equivalent nor subsumed."""
+        return [
+            m for m in mutants
+            if m not in self.equivalent and m not in self.probably_equivalent and m not in self.subsumed_by
+        ]
+
+
+def plan_pruning(
+    mutants_dir: Path,
+    mutants: List[str],
+    inputs_per_entry: int = 200,
+    seed: int = 0,
+) -> PrunePlan:
+    start = time.monotonic()
+    plan = PrunePlan()
+    nodes = function_nodes(mutants_dir)
+
+    # 1. Static: normalized source identical to the original or to another mutant.
+    first_with_source: Dict[str, str] = {}
+    remaining = []
+    for mutant in mutants:
+        node = nodes.get(mutant)
+        orig = nodes.get(f"{function_name_of(mutant)}{MUTANT_SEPARATOR}orig")
+        if node is None or orig is None:
+            remaining.append(mutant)
+            continue
+        source = canonical_source(node)
+        if source == canonical_source(orig):
+            plan.equivalent[mutant] = "same as the original after AST normalization"
+        elif source in first_with_source:
+            plan.subsumed_by[mutant] = [first_with_source[source]]
+        else:
+            first_with_source[source] = mutant
+            remaining.append(mutant)
+
+    # 2. Differential: which generated inputs each mutant changes the result for.
+    result = evaluate_mutants(mutants_dir, remaining, inputs_per_entry=inputs_per_entry, seed=seed)
+    plan.inputs = len(result.probes)
+    signatures: Dict[str, FrozenSet[int]] = {}
+    for mutant in remaining:
+        signature: Optional[FrozenSet[int]] = result.signatures.get(mutant)
+        if signature is None:
+            continue  # not reached or timed out: no evidence either way
+        if not signature:
+            plan.probably_equivalent[mutant] = f"no difference on {plan.inputs} generated inputs"
+        else:
+            signatures[mutant] = signature
+
+    # Subsumption is only trusted between mutants of the same function: the
+    # generated inputs observe more than any single test assertion does, and
+    # across functions that gap is too wide to infer one kill from another.
+    representatives: Dict[tuple, str] = {}
+    for mutant, signature in signatures.items():
+        key = (function_name_of(mutant), signature)
+        if key in representatives:
+            plan.subsumed_by[mutant] = [representatives[key]]
+        else:
+            representatives[key] = mutant
+
+    for (function, signature), mutant in representatives.items():
+        dominators = [
+            d for (f, s), d in representatives.items() if f == function and s < signature
+        ]
+        if dominators:
+            plan.subsumed_by[mutant] = dominators
+
+    # A duplicate shares the fate of the mutant it duplicates.
+    for mutant, by in list(plan.subsumed_by.items()):
+        if len(by) != 1:
+            continue
+        if by[0] in plan.equivalent:
+            del plan.subsumed_by[mutant]
+            plan.equivalent[mutant] = plan.equivalent[by[0]]
+        elif by[0] in plan.subsumed_by:
+            plan.subsumed_by[mutant] = by + plan.subsumed_by[by[0]]
+
+    plan.elapsed = time.monotonic() - start
+    return plan
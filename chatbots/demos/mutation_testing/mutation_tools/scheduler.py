@@ -0,0 +1,490 @@
+"""
+Test-impact-based scheduling of mutmut mutants.
+
+mutmut's own runner re-runs the whole ``unittest discover`` suite for every
+mutant. This scheduler uses what ``mutants/mutmut-stats.json`` already
+records instead:
+
+  - ``tests_by_mangled_function_name``: which tests cover each function
+  - ``duration_by_test``: how long each of those tests takes
+
+For every mutant only the covering tests are run, cheapest-to-kill first,
+and the run stops at the first failing test. Mutants are spread over a pool
+of workers, one interpreter per mutant.
+
+Run from inside ``mutation_testing/`` after ``mutmut run`` has generated
+``mutants/``:
+
+    python -m mutation_tools
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+__all__ = [
+    "MutationStats",
+    "KillHistory",
+    "MutantResult",
+    "discover_mutants",
+    "function_name_of",
+    "unittest_name",
+    "order_tests",
+    "run_mutant",
+    "schedule",
+    "summarize",
+    "function_nodes",
+    "load_estimated_durations",
+]
+
+MUTANT_SEPARATOR = "__mutmut_"
+STATS_FILE = "mutmut-stats.json"
+HISTORY_FILE = "kill-history.json"
+
+KILLED = "killed"
+SURVIVED = "survived"
+TIMEOUT = "timeout"
+NO_TESTS = "no_tests"
+EQUIVALENT = "equivalent"
+
+_FAILED_TEST_RE = re.compile(r"^(?:FAIL|ERROR): (\w+) \(([\w.]+)\)", re.MULTILINE)
+
+
+# ============================================================
+# Inputs: mutmut stats, kill history, mutant discovery
+# ============================================================
+
+@dataclass
+class MutationStats:
+    """
+    The parts of ``mutmut-stats.json`` the scheduler needs.
+    """
+    tests_by_function: Dict[str, List[str]]
+    duration_by_test: Dict[str, float]
+
+    @classmethod
+    def load(cls, mutants_dir: Path) -> "MutationStats":
+        raw = json.loads((Path(mutants_dir) / STATS_FILE).read_text(encoding="utf-8"))
+        return cls(
+            tests_by_function=raw.get("tests_by_mangled_function_name", {}),
+            duration_by_test=raw.get("duration_by_test", {}),
+        )
+
+    def tests_for(self, mutant: str) -> List[str]:
+        return list(self.tests_by_function.get(function_name_of(mutant), []))
+
+    def duration_of(self, test_id: str) -> float:
+        return self.duration_by_test.get(test_id, 0.0)
+
+
+@dataclass
+class KillHistory:
+    """
+    How often each test was run against a mutant, and how often it killed it.
+    Persisted between scheduler runs so that good killers get tried first.
+    """
+    runs_by_test: Dict[str, int] = field(default_factory=dict)
+    kills_by_test: Dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, path: Path) -> "KillHistory":
+        path = Path(path)
+        if not path.exists():
+            return cls()
+        raw = json.loads(path.read_text(encoding="utf-8"))
+        return cls(
+            runs_by_test=raw.get("runs_by_test", {}),
+            kills_by_test=raw.get("kills_by_test", {}),
+        )
+
+    def save(self, path: Path) -> None:
+        payload = {"runs_by_test": self.runs_by_test, "kills_by_test": self.kills_by_test}
+        Path(path).write_text(json.dumps(payload, indent=4, sort_keys=True), encoding="utf-8")
+
+    def kill_rate(self, test_id: str) -> float:
+        # Laplace smoothing: a test we know nothing about starts at 0.5.
+        runs = self.runs_by_test.get(test_id, 0)
+        kills = self.kills_by_test.get(test_id, 0)
+        return (kills + 1) / (runs + 2)
+
+    def record(self, result: "MutantResult") -> None:
+        # Outcomes that were inferred or skipped ran no tests, so they say
+        # nothing about how well any test kills.
+        if result.inferred_from is not None or result.status == EQUIVALENT:
+            return
+        for test_id in result.tests_run:
+            self.runs_by_test[test_id] = self.runs_by_test.get(test_id, 0) + 1
+        if result.killing_test is not None:
+            self.kills_by_test[result.killing_test] = (
+                self.kills_by_test.get(result.killing_test, 0) + 1
+            )
+
+
+def function_name_of(mutant: str) -> str:
+    """
+    ``refunds.rules.x_is_refund_eligible__mutmut_3`` -> ``refunds.rules.x_is_refund_eligible``
+    """
+    return mutant.rpartition(MUTANT_SEPARATOR)[0]
+
+
+def _module_name(src_dir: Path, path: Path) -> str:
+    parts = list(path.relative_to(src_dir).with_suffix("").parts)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _mutant_keys(tree: ast.Module) -> Iterable[str]:
+    bodies = [tree.body] + [node.body for node in tree.body if isinstance(node, ast.ClassDef)]
+    for body in bodies:
+        for node in body:
+            if isinstance(node, ast.AnnAssign):
+                targets, value = [node.target], node.value
+            elif isinstance(node, ast.Assign):
+                targets, value = node.targets, node.value
+            else:
+                continue
+            if not isinstance(value, ast.Dict):
+                continue
+            if not any(isinstance(t, ast.Name) and t.id.endswith("__mutmut_mutants") for t in targets):
+                continue
+            for key in value.keys:
+                if isinstance(key, ast.Constant) and isinstance(key.value, str):
+                    yield key.value
+
+
+def function_nodes(mutants_dir: Path) -> Dict[str, ast.FunctionDef]:
+    """
+    ``<module>.<mangled name>__mutmut_<orig|n>`` -> its AST, for every original
+    and mutated function under ``mutants/src``.
+    """
+    src_dir = Path(mutants_dir) / "src"
+    nodes = {}
+    for path in sorted(src_dir.rglob("*.py")):
+        module = _module_name(src_dir, path)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        bodies = [tree.body] + [n.body for n in tree.body if isinstance(n, ast.ClassDef)]
+        for body in bodies:
+            for node in body:
+                if isinstance(node, ast.FunctionDef) and MUTANT_SEPARATOR in node.name:
+                    nodes[f"{module}.{node.name}"] = node
+    return nodes
+
+
+def load_estimated_durations(mutants_dir: Path) -> Dict[str, float]:
+    """
+    Wall time mutmut measured per mutant (``durations_by_key`` in the
+    ``*.meta`` files), used to estimate what skipping a mutant saves.
+    """
+    durations = {}
+    for path in Path(mutants_dir).rglob("*.meta"):
+        durations.update(json.loads(path.read_text(encoding="utf-8")).get("durations_by_key", {}))
+    return durations
+
+
+def discover_mutants(mutants_dir: Path) -> List[str]:
+    """
+    Lists every mutant key (``<module>.<mangled name>__mutmut_<n>``) found in
+    the ``*__mutmut_mutants`` tables mutmut generates under ``mutants/src``.
+    """
+    src_dir = Path(mutants_dir) / "src"
+    mutants = []
+    for path in sorted(src_dir.rglob("*.py")):
+        module = _module_name(src_dir, path)
+        tree = ast.parse(path.read_text(encoding="utf-8"))
+        mutants.extend(f"{module}.{key}" for key in _mutant_keys(tree))
+    return mutants
+
+
+# ============================================================
+# Planning and running a single mutant
+# ============================================================
+
+def unittest_name(test_id: str) -> str:
+    """
+    ``tests/test_rules.py::RefundRulesTests::test_x`` -> ``tests.test_rules.RefundRulesTests.test_x``
+    """
+    path, _, rest = test_id.partition("::")
+    module = path[:-3] if path.endswith(".py") else path
+    return ".".join([module.replace("/", ".")] + rest.split("::"))
+
+
+def order_tests(tests: Iterable[str], stats: MutationStats, history: KillHistory) -> List[str]:
+    """
+    Orders tests by expected cost per kill: duration divided by past kill rate.
+    Fast tests and proven killers go first; ties fall back to the test id.
+    """
+    return sorted(
+        tests,
+        key=lambda t: (stats.duration_of(t) / history.kill_rate(t), t),
+    )
+
+
+@dataclass
+class MutantResult:
+    mutant: str
+    status: str
+    tests_run: List[str] = field(default_factory=list)
+    killing_test: Optional[str] = None
+    duration: float = 0.0
+    cached: bool = False
+    # set when the outcome was inferred from a subsuming mutant instead of run
+    inferred_from: Optional[str] = None
+
+
+def _killing_test(output: str, tests: List[str]) -> Optional[str]:
+    match = _FAILED_TEST_RE.search(output)
+    if match is None:
+        return None
+    method, qualifier = match.groups()
+    for test_id in tests:
+        name = unittest_name(test_id)
+        # Python >= 3.11 prints the full test name, older versions only the class.
+        if name == qualifier or name == f"{qualifier}.{method}":
+            return test_id
+    return None
+
+
+def run_mutant(
+    mutant: str,
+    tests: List[str],
+    mutants_dir: Path,
+    timeout: Optional[float] = None,
+) -> MutantResult:
+    """
+    Runs ``tests`` (already ordered) against one mutant in a fresh interpreter.
+    ``unittest -f`` stops at the first failure, i.e. at the first kill.
+    """
+    if not tests:
+        return MutantResult(mutant=mutant, status=NO_TESTS)
+
+    env = dict(os.environ, MUTANT_UNDER_TEST=mutant)
+    cmd = [sys.executable, "-m", "unittest", "-f"] + [unittest_name(t) for t in tests]
+    start = time.monotonic()
+    try:
+        proc = subprocess.run(
+            cmd,
+            cwd=mutants_dir,
+            env=env,
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return MutantResult(mutant=mutant, status=TIMEOUT, duration=time.monotonic() - start)
+    duration = time.monotonic() - start
+
+    if proc.returncode == 0:
+        return MutantResult(mutant=mutant, status=SURVIVED, tests_run=list(tests), duration=duration)
+
+    killer = _killing_test(proc.stderr, tests)
+    tests_run = tests[: tests.index(killer) + 1] if killer else list(tests)
+    return MutantResult(
+        mutant=mutant,
+        status=KILLED,
+        tests_run=tests_run,
+        killing_test=killer,
+        duration=duration,
+    )
+
+
+# ============================================================
+# Scheduling a whole run
+# ============================================================
+
+def schedule(
+    mutants_dir: Path,
+    mutants: Optional[Iterable[str]] = None,
+    max_workers: Optional[int] = None,
+    history_path: Optional[Path] = None,
+    timeout_multiplier: float = 10.0,
+    timeout_base: float = 5.0,
+    in_process: bool = False,
+    use_cache: bool = True,
+    cache_path: Optional[Path] = None,
+    prune: bool = False,
+) -> List[MutantResult]:
+    """
+    Runs every mutant (or just ``mutants``) against its covering tests and
+    returns the results in the same order. The kill history is updated and
+    saved so the next run orders tests better.
+
+    With ``in_process=True`` mutants run on persistent worker processes
+    (see ``mutation_tools.worker``) instead of one interpreter per mutant.
+
+    With ``use_cache`` (the default) outcomes are reused from the result
+    cache (see ``mutation_tools.cache``) and only mutants whose function or
+    covering tests changed are run.
+
+    With ``prune=True`` a pre-pass (see ``mutation_tools.pruning``) skips
+    equivalent mutants, runs probably-equivalent ones last, and runs
+    subsumed ones last only when no mutant subsuming them was killed.
+    """
+    mutants_dir = Path(mutants_dir).resolve()
+    history_path = Path(history_path) if history_path else mutants_dir / HISTORY_FILE
+    stats = MutationStats.load(mutants_dir)
+    history = KillHistory.load(history_path)
+    full_run = mutants is None
+    mutants = list(mutants) if mutants is not None else discover_mutants(mutants_dir)
+
+    cache, keys, cached = None, {}, {}
+    if use_cache:
+        from .cache import CACHE_FILE, ResultCache, fingerprint_mutants
+
+        cache = ResultCache.load(cache_path or mutants_dir / CACHE_FILE)
+        keys = fingerprint_mutants(mutants_dir, mutants, stats)
+        for mutant in mutants:
+            hit = cache.get(mutant, keys[mutant])
+            if hit is not None:
+                cached[mutant] = hit
+
+    def _execute(to_run: List[str]) -> List[MutantResult]:
+        plans = []
+        for mutant in to_run:
+            tests = order_tests(stats.tests_for(mutant), stats, history)
+            timeout = timeout_base + timeout_multiplier * sum(stats.duration_of(t) for t in tests)
+            plans.append((mutant, tests, timeout))
+
+        if in_process:
+            from .worker import run_in_process
+
+            return run_in_process(mutants_dir, plans, max_workers=max_workers)
+        # Each mutant runs in its own interpreter process, so a thread pool that
+        # only waits on those processes is enough to keep every core busy.
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return list(pool.map(lambda plan: run_mutant(plan[0], plan[1], mutants_dir, plan[2]), plans))
+
+    to_run = [m for m in mutants if m not in cached]
+    if not prune:
+        results = _execute(to_run)
+    else:
+        from .pruning import plan_pruning
+
+        pruning = plan_pruning(mutants_dir, to_run)
+        results = [MutantResult(m, EQUIVALENT) for m in to_run if m in pruning.equivalent]
+        results += _execute(pruning.first(to_run))
+        killed = {r.mutant: r for r in results if r.status == KILLED}
+        deferred = [m for m in to_run if m in pruning.probably_equivalent]
+        for mutant in (m for m in to_run if m in pruning.subsumed_by):
+            killer = next((d for d in pruning.subsumed_by[mutant] if d in killed), None)
+            if killer is None:
+                deferred.append(mutant)
+            else:
+                results.append(MutantResult(
+                    mutant, KILLED, killing_test=killed[killer].killing_test, inferred_from=killer,
+                ))
+        results += _execute(deferred)
+
+    for result in results:
+        history.record(result)
+    history.save(history_path)
+
+    if cache is not None:
+        for result in results:
+            cache.put(keys[result.mutant], result)
+        if full_run:
+            cache.prune(keys.values())
+        cache.save()
+
+    fresh = {r.mutant: r for r in results}
+    return [cached.get(m) or fresh[m] for m in mutants]
+
+
+def summarize(
+    results: List[MutantResult],
+    stats: MutationStats,
+    estimated_durations: Optional[Dict[str, float]] = None,
+) -> str:
+    counts = Counter(r.status for r in results)
+    full_suite = len(stats.duration_by_test) * len(results)
+    executed = sum(len(r.tests_run) for r in results if not r.cached)
+    from_cache = sum(1 for r in results if r.cached)
+    lines = [
+        f"{status}: {counts.get(status, 0)}"
+        for status in (KILLED, SURVIVED, TIMEOUT, NO_TESTS, EQUIVALENT)
+    ]
+    lines.append(f"evaluated: {len(results) - from_cache}, from cache: {from_cache}")
+    skipped = [r for r in results if r.status == EQUIVALENT or r.inferred_from]
+    if skipped:
+        def estimate(r: MutantResult) -> float:
+            if estimated_durations and r.mutant in estimated_durations:
+                return estimated_durations[r.mutant]
+            return sum(stats.duration_of(t) for t in stats.tests_for(r.mutant))
+
+        inferred = sum(1 for r in skipped if r.inferred_from)
+        lines.append(
+            f"pruned: {len(skipped) - inferred} equivalent, {inferred} inferred from subsuming "
+            f"mutants; estimated execution time saved: {sum(estimate(r) for r in skipped):.2f}s"
+        )
+    lines.append(f"test executions: {executed} (full suite per mutant would be {full_suite})")
+    for r in results:
+        if r.status in (SURVIVED, TIMEOUT, EQUIVALENT):
+            lines.append(f"  {r.status}: {r.mutant}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mutants-dir", default="mutants", type=Path)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--history", type=Path, default=None)
+    parser.add_argument(
+        "--in-process",
+        action="store_true",
+        help="run mutants back to back on persistent workers instead of one interpreter each",
+    )
+    parser.add_argument("--cache", type=Path, default=None, help="result cache file")
+    parser.add_argument("--no-cache", action="store_true", help="re-run every mutant")
+    parser.add_argument(
+        "--prune",
+        action="store_true",
+        help="skip equivalent mutants and infer outcomes of subsumed ones",
+    )
+    parser.add_argument(
+        "--prescreen",
+        action="store_true",
+        help="only compare mutants with the original on generated boundary inputs; runs no tests",
+    )
+    parser.add_argument("mutant", nargs="*", help="only run these mutant keys")
+    args = parser.parse_args(argv)
+
+    if args.prescreen:
+        from .differential import format_prescreen, prescreen
+
+        print(format_prescreen(prescreen(args.mutants_dir, mutants=args.mutant or None)))
+        return 0
+
+    start = time.monotonic()
+    results = schedule(
+        args.mutants_dir,
+        mutants=args.mutant or None,
+        max_workers=args.workers,
+        history_path=args.history,
+        in_process=args.in_process,
+        use_cache=not args.no_cache,
+        cache_path=args.cache,
+        prune=args.prune,
+    )
+    print(summarize(
+        results,
+        MutationStats.load(args.mutants_dir),
+        load_estimated_durations(args.mutants_dir),
+    ))
+    print(f"wall time: {time.monotonic() - start:.2f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,87 @@
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+from mutation_tools.cache import ResultCache, fingerprint_mutants
+from mutation_tools.scheduler import KILLED, NO_TESTS, MutantResult, MutationStats, discover_mutants, schedule
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+
+INIT_ORIG = '''    def xǁDecisionǁ__init____mutmut_orig(self, status: str, reason: str):
+        self.status = status
+'''
+
+
+class IncrementalRunTests(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.mutants_dir = Path(tmp.name) / "mutants"
+        shutil.copytree(MUTANTS_DIR, self.mutants_dir)
+        self.rules = self.mutants_dir / "src" / "refunds" / "rules.py"
+
+    def _run(self):
+        return schedule(self.mutants_dir, in_process=True, max_workers=1)
+
+    def _edit(self, path, old, new):
+        source = path.read_text(encoding="utf-8")
+        self.assertIn(old, source)
+        path.write_text(source.replace(old, new), encoding="utf-8")
+
+    def test_second_run_is_served_from_cache(self):
+        first = self._run()
+        second = self._run()
+
+        self.assertFalse(any(r.cached for r in first))
+        self.assertTrue(all(r.cached for r in second))
+        self.assertEqual([r.status for r in second], [r.status for r in first])
+
+    def test_editing_one_function_only_reruns_its_mutants(self):
+        self._run()
+        self._edit(self.rules, INIT_ORIG, INIT_ORIG.replace("self.status = status", "self.status = str(status)"))
+
+        rerun = {r.mutant for r in self._run() if not r.cached}
+        self.assertEqual(
+            rerun,
+            {"refunds.rules.xǁDecisionǁ__init____mutmut_1", "refunds.rules.xǁDecisionǁ__init____mutmut_2"},
+        )
+
+    def test_comment_only_edit_keeps_cache(self):
+        self._run()
+        self._edit(self.rules, "# R1: Time-based rule", "# R1: time window")
+
+        self.assertTrue(all(r.cached for r in self._run()))
+
+    def test_editing_a_covering_test_invalidates_its_mutants(self):
+        self._run()
+        self._edit(
+            self.mutants_dir / "tests" / "test_rules.py",
+            "date(2025, 1, 15)",
+            "date(2025, 1, 16)",
+        )
+
+        self.assertFalse(any(r.cached for r in self._run()))
+
+
+class ResultCacheTests(unittest.TestCase):
+
+    def test_only_final_outcomes_are_cached(self):
+        cache = ResultCache(Path("unused.json"))
+        cache.put("a", MutantResult("m", KILLED, tests_run=["t"], killing_test="t"))
+        cache.put("b", MutantResult("m", NO_TESTS))
+
+        hit = cache.get("other-name", "a")
+        self.assertEqual((hit.mutant, hit.status, hit.killing_test, hit.cached), ("other-name", KILLED, "t", True))
+        self.assertIsNone(cache.get("m", "b"))
+
+    def test_every_mutant_gets_a_distinct_fingerprint(self):
+        mutants = discover_mutants(MUTANTS_DIR)
+        keys = fingerprint_mutants(MUTANTS_DIR, mutants, MutationStats.load(MUTANTS_DIR))
+
+        self.assertEqual(len(set(keys.values())), len(mutants))
+
+
+if __name__ == "__main__":
+    unittest.main()
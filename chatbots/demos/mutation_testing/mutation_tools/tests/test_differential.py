@@ -0,0 +1,70 @@
+import ast
+import unittest
+from datetime import date
+from pathlib import Path
+
+from mutation_tools.differential import BASE_DATE, derive_input_space, prescreen
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+RULES = Path(__file__).resolve().parents[2] / "src" / "refunds" / "rules.py"
+
+WINDOW_MUTANT = "refunds.rules.x_is_refund_eligible__mutmut_2"  # days >= max_refund_days
+
+
+def _function(name):
+    tree = ast.parse(RULES.read_text(encoding="utf-8"))
+    return next(n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == name)
+
+
+class DeriveInputSpaceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.space = derive_input_space(_function("is_refund_eligible"))
+
+    def test_literal_comparisons_give_neighbours_and_other_values(self):
+        self.assertEqual([499, 500, 501], self.space.domains["order.amount"])
+        self.assertEqual(["US", "OTHER"], self.space.domains["customer.region"])
+        self.assertEqual(["Digital", "OTHER"], self.space.domains["order.product_type"])
+        self.assertEqual([False, True], self.space.domains["customer.is_fraud_flagged"])
+
+    def test_day_count_is_placed_around_the_refund_window(self):
+        self.assertEqual([BASE_DATE], self.space.domains["order.purchase_date"])
+        days = {(d - BASE_DATE).days for d in self.space.domains["request_date"]}
+        self.assertTrue({29, 30, 31} <= days)
+        self.assertIn(30, self.space.domains["policy.max_refund_days"])
+
+    def test_arguments_are_built_from_attribute_variables(self):
+        assignment = next(self.space.grid())
+        order, customer, policy, request_date = self.space.arguments(assignment)
+
+        self.assertEqual(assignment["order.amount"], order.amount)
+        self.assertIsInstance(request_date, date)
+
+
+class PrescreenTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.result = prescreen(MUTANTS_DIR)
+
+    def test_covers_the_whole_boundary_grid(self):
+        space = derive_input_space(_function("is_refund_eligible"))
+        self.assertEqual(space.size(), len(self.result.probes))
+
+    def test_mutant_invisible_to_the_result_is_a_probable_survivor(self):
+        self.assertEqual(["refunds.rules.xǁDecisionǁ__init____mutmut_1"], self.result.survivors())
+
+    def test_boundary_mutant_gets_a_killing_input(self):
+        probe = self.result.killing_probe(WINDOW_MUTANT)
+        days = (probe.assignment["request_date"] - probe.assignment["order.purchase_date"]).days
+
+        self.assertEqual(probe.assignment["policy.max_refund_days"], days)
+        original, mutated = self.result.outcomes[WINDOW_MUTANT]
+        self.assertNotIn("Outside refund window", original)
+        self.assertIn("Outside refund window", mutated)
+        self.assertIn("request_date=", str(probe))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,101 @@
+import ast
+import tempfile
+import unittest
+from pathlib import Path
+
+from mutation_tools.pruning import canonical_source, plan_pruning
+from mutation_tools.scheduler import (
+    EQUIVALENT,
+    KILLED,
+    SURVIVED,
+    MutationStats,
+    discover_mutants,
+    schedule,
+    summarize,
+)
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+
+
+def _function(source):
+    return ast.parse(source).body[0]
+
+
+class CanonicalSourceTests(unittest.TestCase):
+
+    def test_flipped_comparison_is_the_same_function(self):
+        self.assertEqual(
+            canonical_source(_function("def a(x):\n    return 500 < x")),
+            canonical_source(_function("def b(x):\n    return x > 500")),
+        )
+
+    def test_negated_equality_is_the_same_function(self):
+        self.assertEqual(
+            canonical_source(_function("def a(x):\n    return not x == 'US'")),
+            canonical_source(_function("def a(x):\n    return x != 'US'")),
+        )
+
+    def test_real_mutation_is_not_normalized_away(self):
+        self.assertNotEqual(
+            canonical_source(_function("def a(x):\n    return x > 500")),
+            canonical_source(_function("def a(x):\n    return x >= 500")),
+        )
+
+
+class PlanPruningTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mutants = discover_mutants(MUTANTS_DIR)
+        cls.plan = plan_pruning(MUTANTS_DIR, cls.mutants)
+
+    def test_mutant_invisible_to_decision_eq_is_probably_equivalent_and_still_run(self):
+        # status=None on both sides of Decision.__eq__ still compares equal,
+        # but a test asserting decision.status would kill it.
+        mutant = "refunds.rules.xǁDecisionǁ__init____mutmut_1"
+        self.assertIn(mutant, self.plan.probably_equivalent)
+        self.assertNotIn(mutant, self.plan.equivalent)
+        self.assertNotIn(mutant, self.plan.first([mutant]))
+
+    def test_reason_string_variants_collapse_onto_one_mutant(self):
+        # "XXOutside refund windowXX", "outside refund window", "OUTSIDE REFUND WINDOW"
+        variants = [f"refunds.rules.x_is_refund_eligible__mutmut_{n}" for n in (8, 9, 10)]
+        first = self.plan.first(variants)
+
+        self.assertLessEqual(len(first), 1)
+        for mutant in variants:
+            if mutant not in first:
+                self.assertIn(mutant, self.plan.subsumed_by)
+
+    def test_subsumption_stays_within_one_function(self):
+        for mutant, dominators in self.plan.subsumed_by.items():
+            prefix = mutant.rpartition("__mutmut_")[0]
+            for dominator in dominators:
+                self.assertTrue(dominator.startswith(prefix + "__mutmut_"))
+
+
+class PrunedScheduleTests(unittest.TestCase):
+
+    def test_pruned_run_agrees_with_full_run_and_reports_savings(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            full = schedule(MUTANTS_DIR, history_path=Path(tmp) / "a.json", in_process=True, use_cache=False)
+            pruned = schedule(
+                MUTANTS_DIR, history_path=Path(tmp) / "b.json", in_process=True, use_cache=False, prune=True
+            )
+
+        statuses = {r.mutant: r.status for r in full}
+        for result in pruned:
+            if result.status == EQUIVALENT:
+                self.assertNotEqual(statuses[result.mutant], KILLED)
+            else:
+                self.assertEqual(result.status, statuses[result.mutant], result.mutant)
+        survived = {r.mutant for r in pruned if r.status == SURVIVED}
+        self.assertIn("refunds.rules.xǁDecisionǁ__init____mutmut_1", survived)
+
+        self.assertTrue(any(r.inferred_from for r in pruned))
+        report = summarize(pruned, MutationStats.load(MUTANTS_DIR))
+        self.assertIn("estimated execution time saved", report)
+
+
+if __name__ == "__main__":
+    unittest.main()
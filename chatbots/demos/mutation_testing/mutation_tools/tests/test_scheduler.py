@@ -0,0 +1,124 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+from mutation_tools.scheduler import (
+    EQUIVALENT,
+    KILLED,
+    NO_TESTS,
+    SURVIVED,
+    KillHistory,
+    MutantResult,
+    MutationStats,
+    discover_mutants,
+    function_name_of,
+    order_tests,
+    schedule,
+    unittest_name,
+)
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+
+BASIC = "tests/test_rules.py::RefundRulesTests::test_approved_basic_case"
+BOUNDARY_1 = "tests/test_rules.py::RefundRulesTests::test_approved_outside_refund_window_boundary_1"
+BOUNDARY_2 = "tests/test_rules.py::RefundRulesTests::test_denied_outside_refund_window_boundary_2"
+
+
+class MutantDiscoveryTests(unittest.TestCase):
+
+    def test_discovers_module_and_method_mutants(self):
+        mutants = discover_mutants(MUTANTS_DIR)
+
+        self.assertIn("refunds.rules.x_is_refund_eligible__mutmut_1", mutants)
+        self.assertIn("refunds.rules.xǁDecisionǁ__eq____mutmut_4", mutants)
+        self.assertEqual(len(mutants), len(set(mutants)))
+
+    def test_mutant_maps_to_covered_function(self):
+        stats = MutationStats.load(MUTANTS_DIR)
+
+        self.assertEqual(
+            function_name_of("refunds.rules.xǁDecisionǁ__eq____mutmut_3"),
+            "refunds.rules.xǁDecisionǁ__eq__",
+        )
+        self.assertCountEqual(
+            stats.tests_for("refunds.rules.x_is_refund_eligible__mutmut_36"),
+            [BASIC, BOUNDARY_1, BOUNDARY_2],
+        )
+
+    def test_unittest_name(self):
+        self.assertEqual(unittest_name(BASIC), "tests.test_rules.RefundRulesTests.test_approved_basic_case")
+
+
+class TestOrderingTests(unittest.TestCase):
+
+    def setUp(self):
+        self.stats = MutationStats(
+            tests_by_function={},
+            duration_by_test={BASIC: 0.3, BOUNDARY_1: 0.2, BOUNDARY_2: 0.1},
+        )
+
+    def test_without_history_fastest_test_goes_first(self):
+        ordered = order_tests([BASIC, BOUNDARY_1, BOUNDARY_2], self.stats, KillHistory())
+        self.assertEqual(ordered, [BOUNDARY_2, BOUNDARY_1, BASIC])
+
+    def test_proven_killer_is_promoted(self):
+        history = KillHistory()
+        for _ in range(10):
+            history.record(MutantResult("m", KILLED, tests_run=[BASIC], killing_test=BASIC))
+            history.record(MutantResult("m", SURVIVED, tests_run=[BOUNDARY_2]))
+
+        ordered = order_tests([BASIC, BOUNDARY_1, BOUNDARY_2], self.stats, history)
+        self.assertEqual(ordered[0], BASIC)
+
+    def test_inferred_and_equivalent_outcomes_are_not_recorded(self):
+        history = KillHistory()
+        history.record(MutantResult("m", KILLED, tests_run=[BASIC], killing_test=BASIC))
+        history.record(MutantResult("m2", KILLED, killing_test=BASIC, inferred_from="m"))
+        history.record(MutantResult("m3", EQUIVALENT))
+
+        self.assertEqual(history.runs_by_test, {BASIC: 1})
+        self.assertEqual(history.kills_by_test, {BASIC: 1})
+
+    def test_history_round_trips_through_disk(self):
+        history = KillHistory()
+        history.record(MutantResult("m", KILLED, tests_run=[BASIC], killing_test=BASIC))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "history.json"
+            history.save(path)
+            self.assertEqual(KillHistory.load(path), history)
+
+
+class ScheduleTests(unittest.TestCase):
+
+    def test_runs_only_covering_tests_and_stops_at_first_kill(self):
+        killed = "refunds.rules.x_is_refund_eligible__mutmut_36"
+        survived = "refunds.rules.xǁDecisionǁ__init____mutmut_1"
+
+        with tempfile.TemporaryDirectory() as tmp:
+            history_path = Path(tmp) / "history.json"
+            results = schedule(
+                MUTANTS_DIR, mutants=[killed, survived], max_workers=2, history_path=history_path, use_cache=False
+            )
+            history = KillHistory.load(history_path)
+
+        by_mutant = {r.mutant: r for r in results}
+        self.assertEqual(by_mutant[killed].status, KILLED)
+        self.assertEqual(by_mutant[killed].tests_run[-1], by_mutant[killed].killing_test)
+        self.assertEqual(by_mutant[survived].status, SURVIVED)
+        self.assertEqual(len(by_mutant[survived].tests_run), 3)
+        self.assertEqual(sum(history.kills_by_test.values()), 1)
+
+    def test_mutant_without_covering_tests_is_not_run(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            results = schedule(
+                MUTANTS_DIR,
+                mutants=["refunds.rules.x_unknown__mutmut_1"],
+                history_path=Path(tmp) / "history.json",
+                use_cache=False,
+            )
+        self.assertEqual(results[0].status, NO_TESTS)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,120 @@
+import tempfile
+import textwrap
+import types
+import unittest
+from pathlib import Path
+
+from mutation_tools.scheduler import KILLED, SURVIVED, TIMEOUT, schedule
+from mutation_tools.worker import MutantSwitch, _run_in_worker, run_in_process
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+
+# Same shape as what mutmut generates for a module function and a method.
+GENERATED_SOURCE = textwrap.dedent('''
+    def _mutmut_trampoline(orig, mutants, call_args, call_kwargs, self_arg=None):
+        raise AssertionError("generated trampoline must be replaced")
+
+    def x_add__mutmut_orig(a, b):
+        return a + b
+    def x_add__mutmut_1(a, b):
+        return a - b
+    x_add__mutmut_mutants = {'x_add__mutmut_1': x_add__mutmut_1}
+
+    def add(*args, **kwargs):
+        return _mutmut_trampoline(x_add__mutmut_orig, x_add__mutmut_mutants, args, kwargs)
+
+    class Box:
+        def xǁBoxǁget__mutmut_orig(self):
+            return 1
+        def xǁBoxǁget__mutmut_1(self):
+            return 2
+        xǁBoxǁget__mutmut_mutants = {'xǁBoxǁget__mutmut_1': xǁBoxǁget__mutmut_1}
+
+        def get(self, *args, **kwargs):
+            return _mutmut_trampoline(
+                object.__getattribute__(self, "xǁBoxǁget__mutmut_orig"),
+                object.__getattribute__(self, "xǁBoxǁget__mutmut_mutants"),
+                args, kwargs, self)
+''')
+
+
+class MutantSwitchTests(unittest.TestCase):
+
+    def setUp(self):
+        self.module = types.ModuleType("calc")
+        exec(GENERATED_SOURCE, self.module.__dict__)
+        self.module.Box.__module__ = "calc"
+        self.switch = MutantSwitch()
+        self.switch.install(self.module)
+
+    def test_dispatch_table_covers_functions_and_methods(self):
+        self.assertCountEqual(self.switch.table, ["calc.x_add__mutmut_1", "calc.xǁBoxǁget__mutmut_1"])
+
+    def test_original_runs_when_no_mutant_is_active(self):
+        self.assertEqual(self.module.add(2, 1), 3)
+        self.assertEqual(self.module.Box().get(), 1)
+
+    def test_switching_mutants_in_memory(self):
+        self.switch.activate("calc.x_add__mutmut_1")
+        self.assertEqual(self.module.add(2, 1), 1)
+        self.assertEqual(self.module.Box().get(), 1)
+
+        self.switch.activate("calc.xǁBoxǁget__mutmut_1")
+        self.assertEqual(self.module.add(2, 1), 3)
+        self.assertEqual(self.module.Box().get(), 2)
+
+        self.switch.activate(None)
+        self.assertEqual(self.module.Box().get(), 1)
+
+
+class RunInProcessTests(unittest.TestCase):
+
+    def test_matches_one_interpreter_per_mutant_runner(self):
+        mutants = [
+            "refunds.rules.x_is_refund_eligible__mutmut_36",
+            "refunds.rules.x_is_refund_eligible__mutmut_12",
+            "refunds.rules.xǁDecisionǁ__eq____mutmut_3",
+            "refunds.rules.xǁDecisionǁ__init____mutmut_1",
+        ]
+        with tempfile.TemporaryDirectory() as tmp:
+            isolated = schedule(MUTANTS_DIR, mutants, history_path=Path(tmp) / "a.json", use_cache=False)
+            in_process = schedule(
+                MUTANTS_DIR, mutants, history_path=Path(tmp) / "b.json", in_process=True, use_cache=False
+            )
+
+        self.assertEqual([r.status for r in in_process], [r.status for r in isolated])
+        self.assertEqual([r.status for r in in_process], [KILLED, SURVIVED, KILLED, SURVIVED])
+
+    def test_empty_plan(self):
+        self.assertEqual(run_in_process(MUTANTS_DIR, []), [])
+
+
+class TimeoutTests(unittest.TestCase):
+
+    def test_slow_mutant_is_reported_as_timeout(self):
+        import mutation_tools.worker as worker
+
+        module = types.ModuleType("slow")
+        exec(GENERATED_SOURCE.replace("return a - b", "while True: pass"), module.__dict__)
+        switch = MutantSwitch()
+        switch.install(module)
+
+        class SlowTest(unittest.TestCase):
+            def test_add(self):
+                self.assertEqual(module.add(1, 1), 2)
+
+        previous_switch, previous_cases = worker._switch, dict(worker._cases)
+        worker._switch = switch
+        worker._cases["slow::test_add"] = SlowTest("test_add")
+        try:
+            result = _run_in_worker("slow.x_add__mutmut_1", ["slow::test_add"], timeout=0.2)
+        finally:
+            worker._switch = previous_switch
+            worker._cases.clear()
+            worker._cases.update(previous_cases)
+
+        self.assertEqual(result.status, TIMEOUT)
+
+
+if __name__ == "__main__":
+    unittest.main()
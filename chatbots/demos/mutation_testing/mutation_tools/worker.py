@@ -0,0 +1,210 @@
+"""
+Persistent in-process mutant workers.
+
+The ``_mutmut_trampoline`` that mutmut generates reads
+``os.environ['MUTANT_UNDER_TEST']`` (after an ``import os``) and does string
+prefix checks on every call to a mutated function, and mutmut starts a new
+interpreter for every mutant. For a suite whose tests take well under a
+millisecond that overhead dominates the run.
+
+Here each worker process imports the mutated modules and the tests once,
+replaces the module-level ``_mutmut_trampoline`` with a ``MutantSwitch``, and
+then runs many mutants back to back. Switching mutants only swaps the active
+entry of a dispatch table precomputed from the generated
+``*__mutmut_mutants`` tables; a trampolined call costs one identity check.
+
+Trade-off: mutants share one interpreter, so a mutant that corrupts global
+state can affect the next one. Use the default (one interpreter per mutant)
+runner when in doubt.
+"""
+
+from __future__ import annotations
+
+import importlib
+import os
+import signal
+import sys
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from .scheduler import (
+    KILLED,
+    NO_TESTS,
+    SURVIVED,
+    TIMEOUT,
+    MutantResult,
+    _module_name,
+    unittest_name,
+)
+
+__all__ = ["MutantSwitch", "run_in_process"]
+
+TRAMPOLINE = "_mutmut_trampoline"
+MUTANTS_TABLE_SUFFIX = "__mutmut_mutants"
+
+
+class MutantSwitch:
+    """
+    Drop-in replacement for the generated ``_mutmut_trampoline``.
+
+    ``table`` maps every mutant key to the ``*__mutmut_mutants`` dict it lives
+    in and the mutated function. The generated wrappers always pass that same
+    dict object, so "is this call for the active mutant?" is an ``is`` check.
+    """
+
+    def __init__(self):
+        self.table: Dict[str, Tuple[dict, Callable]] = {}
+        self._active_mutants: Optional[dict] = None
+        self._active_fn: Optional[Callable] = None
+
+    def install(self, module: ModuleType) -> None:
+        tables = [(name, value) for name, value in vars(module).items()]
+        for cls in vars(module).values():
+            if isinstance(cls, type) and cls.__module__ == module.__name__:
+                tables.extend(vars(cls).items())
+
+        for name, mutants in tables:
+            if name.endswith(MUTANTS_TABLE_SUFFIX) and isinstance(mutants, dict):
+                for key, fn in mutants.items():
+                    self.table[f"{module.__name__}.{key}"] = (mutants, fn)
+
+        setattr(module, TRAMPOLINE, self)
+
+    def activate(self, mutant: Optional[str]) -> None:
+        if mutant is None:
+            self._active_mutants, self._active_fn = None, None
+        else:
+            self._active_mutants, self._active_fn = self.table[mutant]
+
+    def __call__(self, orig, mutants, call_args, call_kwargs, self_arg=None):
+        if mutants is not self._active_mutants:
+            return orig(*call_args, **call_kwargs)
+        if self_arg is not None:
+            # call to a class method where self is not bound
+            return self._active_fn(self_arg, *call_args, **call_kwargs)
+        return self._active_fn(*call_args, **call_kwargs)
+
+
+# ============================================================
+# Worker process state
+# ============================================================
+
+class _MutantTimeout(BaseException):
+    pass
+
+
+_switch: Optional[MutantSwitch] = None
+_modules: List[ModuleType] = []
+_cases: Dict[str, unittest.TestCase] = {}
+_timed_out = False
+
+
+def _init_worker(mutants_dir: str) -> None:
+    global _switch
+    mutants_dir = Path(mutants_dir)
+    src_dir = mutants_dir / "src"
+    # mutants/src must win over any installed copy of the package under test.
+    sys.path[:0] = [str(src_dir), str(mutants_dir)]
+
+    _switch = MutantSwitch()
+    for path in sorted(src_dir.rglob("*.py")):
+        module = importlib.import_module(_module_name(src_dir, path))
+        if hasattr(module, TRAMPOLINE):
+            _switch.install(module)
+            _modules.append(module)
+
+
+def _case_for(test_id: str) -> unittest.TestCase:
+    case = _cases.get(test_id)
+    if case is None:
+        suite = unittest.defaultTestLoader.loadTestsFromName(unittest_name(test_id))
+        case = _cases[test_id] = next(iter(suite)) if isinstance(suite, unittest.TestSuite) else suite
+    return case
+
+
+def _on_alarm(signum, frame):
+    # unittest records any exception raised inside a test as an error, so the
+    # flag is what tells a timeout apart from a kill.
+    global _timed_out
+    _timed_out = True
+    raise _MutantTimeout()
+
+
+@contextmanager
+def _time_limit(timeout: Optional[float]) -> Iterator[None]:
+    """
+    Interrupts the block after ``timeout`` seconds; check ``_timed_out`` after.
+    Needs SIGALRM, so without it (e.g. on Windows) there is no limit.
+    """
+    global _timed_out
+    _timed_out = False
+    if timeout is None or not hasattr(signal, "setitimer"):
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        yield
+    except _MutantTimeout:
+        pass
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _run_in_worker(mutant: str, tests: List[str], timeout: Optional[float]) -> MutantResult:
+    if not tests:
+        return MutantResult(mutant=mutant, status=NO_TESTS)
+
+    start = time.monotonic()
+    tests_run: List[str] = []
+    killer = None
+    _switch.activate(mutant)
+    try:
+        with _time_limit(timeout):
+            for test_id in tests:
+                result = unittest.TestResult()
+                tests_run.append(test_id)
+                _case_for(test_id).run(result)
+                if _timed_out:
+                    break
+                if not result.wasSuccessful():
+                    killer = test_id
+                    break
+    finally:
+        _switch.activate(None)
+    duration = time.monotonic() - start
+
+    if _timed_out:
+        return MutantResult(mutant=mutant, status=TIMEOUT, duration=duration)
+    if killer is not None:
+        return MutantResult(mutant, KILLED, tests_run=tests_run, killing_test=killer, duration=duration)
+    return MutantResult(mutant, SURVIVED, tests_run=tests_run, duration=duration)
+
+
+def run_in_process(
+    mutants_dir: Path,
+    plans: List[Tuple[str, List[str], Optional[float]]],
+    max_workers: Optional[int] = None,
+) -> List[MutantResult]:
+    """
+    Runs ``(mutant, ordered tests, timeout)`` plans on a pool of persistent
+    worker processes and returns the results in plan order.
+    """
+    if not plans:
+        return []
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(str(Path(mutants_dir).resolve()),),
+    ) as pool:
+        # Hand each worker a few large batches instead of one mutant at a time.
+        chunksize = max(1, len(plans) // (workers * 4))
+        mutants, tests, timeouts = zip(*plans)
+        return list(pool.map(_run_in_worker, mutants, tests, timeouts, chunksize=chunksize))
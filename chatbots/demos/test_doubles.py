@@ -1,5 +1,10 @@
 import datetime
+import logging
+import queue
+import threading
+import time
 import unittest
+from collections import OrderedDict
 from unittest.mock import Mock
 
 
@@ -26,6 +31,20 @@ class OrderService:
     def get_order(self, order_id: str) -> Order:
         raise NotImplementedError
 
+    def get_orders(self, order_ids: list[str]) -> dict[str, Order]:
+        """
+        Batch lookup: one round-trip for many orders.
+        Unknown ids are simply missing from the result.
+        Backends without a batch endpoint fall back to one get_order per id.
+        """
+        orders = {}
+        for order_id in order_ids:
+            try:
+                orders[order_id] = self.get_order(order_id)
+            except OrderNotFound:
+                pass
+        return orders
+
 
 class EscalationClient:
     """
@@ -35,6 +54,14 @@ class EscalationClient:
     def escalate(self, order_id: str, reason: str) -> None:
         raise NotImplementedError
 
+    def escalate_many(self, escalations: list[tuple[str, str]]) -> None:
+        """
+        Bulk push of (order_id, reason) pairs in one call.
+        Queues without a bulk endpoint fall back to one escalate per pair.
+        """
+        for order_id, reason in escalations:
+            self.escalate(order_id, reason=reason)
+
 
 class OrderStatusHandler:
     """
@@ -54,28 +81,349 @@ class OrderStatusHandler:
         try:
             order = self.order_service.get_order(order_id)
         except OrderNotFound:
+            order = None
+        reply, reason = self._decide(order_id, order, today)
+        if reason is not None:
+            self.escalation_client.escalate(order_id, reason=reason)
+        return reply
+
+    def handle_many(self, requests: list[tuple[str, datetime.date]]) -> list[str]:
+        """
+        Batch version of handle_where_is_my_order, for peaks (e.g. a carrier delay):
+          - all orders are fetched with ONE get_orders call
+          - all escalations go out in ONE escalate_many call
+            (an order asked about twice in the batch is escalated once)
+        Returns one reply per (order_id, today) request, in order.
+        """
+        orders = self.order_service.get_orders(list(dict.fromkeys(order_id for order_id, _ in requests)))
+        replies = []
+        escalations = {}
+        for order_id, today in requests:
+            reply, reason = self._decide(order_id, orders.get(order_id), today)
+            replies.append(reply)
+            if reason is not None:
+                escalations.setdefault((order_id, reason), None)
+        if escalations:
+            self.escalation_client.escalate_many(list(escalations))
+        return replies
+
+    def _decide(self, order_id: str, order: Order | None, today: datetime.date) -> tuple[str, str | None]:
+        """The reply for one order, and the escalation reason (None = no escalation)."""
+        if order is None:
             # Business rule: unknown order → escalate.
-            self.escalation_client.escalate(order_id, reason="ORDER_NOT_FOUND")
             return (
                 "I couldn't immediately find your order. "
                 "I've escalated this to a human agent who will investigate."
-            )
+            ), "ORDER_NOT_FOUND"
 
         # Known order:
         if order.status == "SHIPPED":
-            return f"Your order {order.order_id} has been shipped and is on its way."
+            return f"Your order {order.order_id} has been shipped and is on its way.", None
 
         # Check for delay
         if order.expected_delivery < today - datetime.timedelta(days=self.DELAY_THRESHOLD_DAYS):
             # delayed beyond threshold → escalate
-            self.escalation_client.escalate(order.order_id, reason="DELIVERY_DELAY")
             return (
                 f"Your order {order.order_id} seems delayed. "
                 "I've escalated this to a human agent to check with the carrier."
-            )
+            ), "DELIVERY_DELAY"
 
         # Not shipped, but not delayed beyond threshold
-        return f"Your order {order.order_id} is being prepared and should arrive soon."
+        return f"Your order {order.order_id} is being prepared and should arrive soon.", None
+
+
+class BufferedEscalationClient(EscalationClient):
+    """
+    Wraps another EscalationClient so escalate() returns immediately:
+      - escalations go onto a bounded in-memory queue
+      - a background worker sends them in batches (escalate_many on the wrapped client)
+      - the same (order_id, reason) is sent once per dedup_window seconds
+      - close() sends everything still queued, then stops the worker
+    If the queue is full, escalate() falls back to calling the wrapped client
+    inline: slower, but an escalation is never dropped.
+    """
+
+    def __init__(
+        self,
+        target: EscalationClient,
+        max_queue: int = 1000,
+        batch_size: int = 50,
+        flush_interval: float = 0.05,
+        dedup_window: float = 300.0,
+        clock=time.monotonic,
+    ):
+        self.target = target
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dedup_window = dedup_window
+        self.clock = clock
+        self.stats = {"queued": 0, "deduplicated": 0, "inline": 0, "sent": 0, "failed": 0, "batches": 0}
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._recent = OrderedDict()  # (order_id, reason) -> last accepted, oldest first
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker = threading.Thread(target=self._run, name="escalation-flusher", daemon=True)
+        self._worker.start()
+
+    def escalate(self, order_id: str, reason: str) -> None:
+        key = (order_id, reason)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("escalation client is closed")
+            now = self.clock()
+            while self._recent and now - next(iter(self._recent.values())) >= self.dedup_window:
+                self._recent.popitem(last=False)
+            if key in self._recent:
+                self.stats["deduplicated"] += 1
+                return
+            self._recent[key] = now
+            # Enqueued under the lock: close() cannot slip its stop marker in
+            # between the closed check and this put.
+            try:
+                self._queue.put_nowait(key)
+            except queue.Full:
+                self.stats["inline"] += 1
+                inline = True
+            else:
+                self.stats["queued"] += 1
+                inline = False
+        if inline:
+            self._send([key])
+
+    def escalate_many(self, escalations: list[tuple[str, str]]) -> None:
+        for order_id, reason in escalations:
+            self.escalate(order_id, reason)
+
+    def drain(self) -> None:
+        """Blocks until everything queued so far has been sent."""
+        self._queue.join()
+
+    def close(self, timeout: float | None = None) -> None:
+        """Sends what is still queued, then stops the worker. escalate() raises afterwards."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        # Every accepted escalation is already queued (see escalate), so the
+        # stop marker lands behind all of them. Put outside the lock: the
+        # worker needs it to record what it sends.
+        self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            batch, stop = ([] if first is _STOP else [first]), first is _STOP
+            # Collect more for up to flush_interval, or until the batch is full.
+            deadline = time.monotonic() + self.flush_interval
+            while not stop and len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stop = True
+                else:
+                    batch.append(item)
+            if batch:
+                self._send(batch)
+            for _ in range(len(batch) + stop):
+                self._queue.task_done()
+            if stop:
+                return
+
+    def _send(self, batch: list[tuple[str, str]]) -> None:
+        try:
+            self.target.escalate_many(batch)
+        except Exception:
+            logging.getLogger(__name__).exception("failed to send %d escalations", len(batch))
+            with self._lock:
+                self.stats["failed"] += len(batch)
+                # Forget them, so the next escalate() for these orders is not deduplicated away.
+                for key in batch:
+                    self._recent.pop(key, None)
+        else:
+            with self._lock:
+                self.stats["sent"] += len(batch)
+                self.stats["batches"] += 1
+
+
+_STOP = object()
+
+
+class CachingOrderService(OrderService):
+    """
+    Read-through cache in front of any OrderService:
+      - orders are cached with a TTL that depends on their status
+        (PROCESSING changes soon → short, SHIPPED hardly changes → long)
+      - OrderNotFound is cached too, briefly (negative caching)
+      - at most max_entries ids are kept, least recently used evicted first
+      - concurrent misses for the same id make ONE backend call, whether they
+        come from get_order or get_orders; the other callers wait for its
+        result (no stampede on a popular order)
+    Backend errors other than OrderNotFound are never cached, and a fetch
+    that was in flight when invalidate() ran does not write its result back.
+    """
+
+    TTL_BY_STATUS = {"PROCESSING": 30.0, "SHIPPED": 3600.0}
+    DEFAULT_TTL = 60.0
+    NOT_FOUND_TTL = 10.0
+
+    def __init__(
+        self,
+        backend: OrderService,
+        max_entries: int = 10_000,
+        ttl_by_status: dict[str, float] | None = None,
+        default_ttl: float | None = None,
+        not_found_ttl: float | None = None,
+        clock=time.monotonic,
+    ):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.ttl_by_status = self.TTL_BY_STATUS if ttl_by_status is None else ttl_by_status
+        self.default_ttl = self.DEFAULT_TTL if default_ttl is None else default_ttl
+        self.not_found_ttl = self.NOT_FOUND_TTL if not_found_ttl is None else not_found_ttl
+        self.clock = clock
+        self.stats = {"hits": 0, "negative_hits": 0, "misses": 0, "expired": 0, "evictions": 0, "coalesced": 0}
+        self._entries = OrderedDict()  # order_id -> (expires_at, Order or None for "not found")
+        self._in_flight = {}  # order_id -> _Flight
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_order(self, order_id: str) -> Order:
+        with self._lock:
+            found, order = self._lookup(order_id)
+            if found:
+                if order is None:
+                    raise OrderNotFound(order_id)
+                return order
+            flight, leader = self._join(order_id)
+
+        if leader:
+            try:
+                order = self.backend.get_order(order_id)
+            except OrderNotFound:
+                self._finish(order_id, flight, None)
+            except Exception as exc:
+                self._fail({order_id: flight}, exc)
+            else:
+                self._finish(order_id, flight, order)
+        return self._result(order_id, flight)
+
+    def get_orders(self, order_ids: list[str]) -> dict[str, Order]:
+        """
+        Cached ids are answered locally; ids another caller is already
+        fetching are waited for; the rest go to the backend in ONE get_orders call.
+        """
+        orders, waiting, fetching = {}, {}, {}
+        with self._lock:
+            for order_id in dict.fromkeys(order_ids):
+                found, order = self._lookup(order_id)
+                if found:
+                    if order is not None:
+                        orders[order_id] = order
+                    continue
+                flight, leader = self._join(order_id)
+                (fetching if leader else waiting)[order_id] = flight
+
+        if fetching:
+            try:
+                fetched = self.backend.get_orders(list(fetching))
+            except Exception as exc:
+                self._fail(fetching, exc)
+            else:
+                for order_id, flight in fetching.items():
+                    self._finish(order_id, flight, fetched.get(order_id))
+        for order_id, flight in {**fetching, **waiting}.items():
+            try:
+                orders[order_id] = self._result(order_id, flight)
+            except OrderNotFound:
+                pass
+        return orders
+
+    def invalidate(self, order_id: str) -> None:
+        """
+        Drops the cached entry. A fetch already in flight for this id is
+        detached: its callers still get its result, but it is not cached,
+        and later callers start a fresh fetch.
+        """
+        with self._lock:
+            self._entries.pop(order_id, None)
+            self._in_flight.pop(order_id, None)
+
+    def _lookup(self, order_id: str) -> tuple[bool, Order | None]:
+        """(True, order or None) on a fresh hit, (False, None) otherwise. Call with the lock held."""
+        entry = self._entries.get(order_id)
+        if entry is not None:
+            expires_at, order = entry
+            if self.clock() < expires_at:
+                self._entries.move_to_end(order_id)
+                self.stats["hits" if order is not None else "negative_hits"] += 1
+                return True, order
+            del self._entries[order_id]
+            self.stats["expired"] += 1
+        self.stats["misses"] += 1
+        return False, None
+
+    def _join(self, order_id: str) -> tuple["_Flight", bool]:
+        """The fetch in flight for order_id, or a new one (leader=True). Call with the lock held."""
+        flight = self._in_flight.get(order_id)
+        if flight is not None:
+            self.stats["coalesced"] += 1
+            return flight, False
+        flight = self._in_flight[order_id] = _Flight()
+        return flight, True
+
+    def _finish(self, order_id: str, flight: "_Flight", order: Order | None) -> None:
+        """Publishes a fetched order (None = not found) and caches it, unless invalidated meanwhile."""
+        flight.order = order
+        with self._lock:
+            # Still registered means invalidate() has not run since the fetch started.
+            if self._in_flight.get(order_id) is flight:
+                del self._in_flight[order_id]
+                self._store(order_id, order)
+        flight.done.set()
+
+    def _fail(self, flights: dict[str, "_Flight"], exc: Exception) -> None:
+        """Backend errors go to every waiter but are not cached."""
+        with self._lock:
+            for order_id, flight in flights.items():
+                flight.error = exc
+                if self._in_flight.get(order_id) is flight:
+                    del self._in_flight[order_id]
+        for flight in flights.values():
+            flight.done.set()
+
+    def _result(self, order_id: str, flight: "_Flight") -> Order:
+        flight.done.wait()
+        if flight.error is not None:
+            raise flight.error
+        if flight.order is None:
+            raise OrderNotFound(order_id)
+        return flight.order
+
+    def _store(self, order_id: str, order: Order | None) -> None:
+        """Call with the lock held."""
+        if order is None:
+            ttl = self.not_found_ttl
+        else:
+            ttl = self.ttl_by_status.get(order.status, self.default_ttl)
+        self._entries[order_id] = (self.clock() + ttl, order)
+        self._entries.move_to_end(order_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+
+class _Flight:
+    """One backend fetch in progress, shared by every caller waiting for the same order."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.order = None
+        self.error = None
 
 
 # ==========================
@@ -99,6 +447,36 @@ class StubOrderService(OrderService):
         except KeyError:
             raise OrderNotFound(order_id)
 
+    def get_orders(self, order_ids: list[str]) -> dict[str, Order]:
+        return {order_id: self._orders_by_id[order_id] for order_id in order_ids if order_id in self._orders_by_id}
+
+
+class FakeAgentQueue(EscalationClient):
+    """
+    Local fake of the human agent queue:
+      - records every bulk push as one batch
+      - can be paused (gate) to simulate a slow queue, or made to fail
+    """
+
+    def __init__(self):
+        self.batches = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.fail = False
+
+    def escalate(self, order_id: str, reason: str) -> None:
+        self.escalate_many([(order_id, reason)])
+
+    def escalate_many(self, escalations):
+        self.gate.wait()
+        if self.fail:
+            raise ConnectionError("agent queue unavailable")
+        self.batches.append(list(escalations))
+
+    @property
+    def escalations(self):
+        return [item for batch in self.batches for item in batch]
+
 
 # ==========================
 # Tests (exercise)
@@ -206,5 +584,397 @@ class TestOrderStatusHandler(unittest.TestCase):
         escalation_mock.escalate.assert_called_once_with("ORDER-4014", reason="ORDER_NOT_FOUND")
 
 
+class TestBatchOrderStatusHandler(unittest.TestCase):
+
+    def setUp(self):
+        self.today = datetime.date(2025, 5, 1)
+        late = self.today - datetime.timedelta(days=10)
+        self.order_service_stub = StubOrderService({
+            "ORDER-1": Order("ORDER-1", "SHIPPED", self.today),
+            "ORDER-2": Order("ORDER-2", "PROCESSING", late),
+            "ORDER-3": Order("ORDER-3", "PROCESSING", self.today),
+        })
+
+    def test_one_lookup_and_one_bulk_escalation_per_batch(self):
+        # wraps= keeps the stub's answers while recording how it was called
+        order_service_spy = Mock(wraps=self.order_service_stub)
+        escalation_mock = Mock(spec=EscalationClient)
+        handler = OrderStatusHandler(order_service_spy, escalation_mock)
+
+        replies = handler.handle_many([
+            ("ORDER-1", self.today),
+            ("ORDER-2", self.today),
+            ("ORDER-404", self.today),
+            ("ORDER-3", self.today),
+            ("ORDER-2", self.today),
+        ])
+
+        self.assertIn("has been shipped", replies[0])
+        self.assertIn("seems delayed", replies[1])
+        self.assertIn("couldn't immediately find your order", replies[2])
+        self.assertIn("should arrive soon", replies[3])
+        self.assertEqual(replies[1], replies[4])
+
+        order_service_spy.get_orders.assert_called_once_with(["ORDER-1", "ORDER-2", "ORDER-404", "ORDER-3"])
+        order_service_spy.get_order.assert_not_called()
+        escalation_mock.escalate_many.assert_called_once_with([
+            ("ORDER-2", "DELIVERY_DELAY"),
+            ("ORDER-404", "ORDER_NOT_FOUND"),
+        ])
+        escalation_mock.escalate.assert_not_called()
+
+    def test_batch_replies_match_single_requests(self):
+        requests = [(order_id, self.today) for order_id in ("ORDER-1", "ORDER-2", "ORDER-3", "ORDER-404")]
+        single = OrderStatusHandler(self.order_service_stub, Mock(spec=EscalationClient))
+        batch = OrderStatusHandler(self.order_service_stub, Mock(spec=EscalationClient))
+
+        self.assertEqual(
+            [single.handle_where_is_my_order(order_id, today) for order_id, today in requests],
+            batch.handle_many(requests),
+        )
+
+    def test_no_escalation_call_when_nothing_to_escalate(self):
+        escalation_mock = Mock(spec=EscalationClient)
+        handler = OrderStatusHandler(self.order_service_stub, escalation_mock)
+
+        handler.handle_many([("ORDER-1", self.today)])
+
+        escalation_mock.escalate_many.assert_not_called()
+
+    def test_default_batch_methods_fall_back_to_single_calls(self):
+        class SingleOnlyService(OrderService):
+            def get_order(self, order_id):
+                if order_id != "ORDER-1":
+                    raise OrderNotFound(order_id)
+                return Order("ORDER-1", "SHIPPED", datetime.date(2025, 5, 1))
+
+        class RecordingClient(EscalationClient):
+            def __init__(self):
+                self.calls = []
+
+            def escalate(self, order_id, reason):
+                self.calls.append((order_id, reason))
+
+        client = RecordingClient()
+        self.assertEqual(["ORDER-1"], list(SingleOnlyService().get_orders(["ORDER-1", "ORDER-404"])))
+        client.escalate_many([("ORDER-404", "ORDER_NOT_FOUND")])
+        self.assertEqual([("ORDER-404", "ORDER_NOT_FOUND")], client.calls)
+
+
+class TestBufferedEscalationClient(unittest.TestCase):
+
+    def setUp(self):
+        self.agent_queue = FakeAgentQueue()
+        self.now = 0.0
+
+    def buffered(self, target=None, **options):
+        client = BufferedEscalationClient(target or self.agent_queue, clock=lambda: self.now, **options)
+        self.addCleanup(client.close, 1)
+        return client
+
+    def test_escalate_does_not_wait_for_a_slow_agent_queue(self):
+        self.agent_queue.gate.clear()  # the agent queue hangs
+        client = self.buffered()
+        handler = OrderStatusHandler(StubOrderService({}), client)
+
+        response = handler.handle_where_is_my_order("ORDER-404", today=datetime.date(2025, 5, 1))
+
+        self.assertIn("escalated", response)
+        self.assertEqual([], self.agent_queue.batches)
+        self.agent_queue.gate.set()
+        client.drain()
+        self.assertEqual([[("ORDER-404", "ORDER_NOT_FOUND")]], self.agent_queue.batches)
+
+    def test_flushes_in_batches_preserving_order(self):
+        self.agent_queue.gate.clear()
+        client = self.buffered(batch_size=2)
+        for i in range(7):
+            client.escalate(f"ORDER-{i}", reason="DELIVERY_DELAY")
+
+        self.agent_queue.gate.set()
+        client.drain()
+
+        self.assertEqual([(f"ORDER-{i}", "DELIVERY_DELAY") for i in range(7)], self.agent_queue.escalations)
+        self.assertTrue(all(len(batch) <= 2 for batch in self.agent_queue.batches))
+        self.assertLess(len(self.agent_queue.batches), 7)
+
+    def test_deduplicates_within_the_window(self):
+        client = self.buffered(dedup_window=60)
+
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")
+        self.now = 30
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")
+        client.escalate("ORDER-1", reason="ORDER_NOT_FOUND")  # different reason
+        self.now = 61
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")  # window over
+        client.drain()
+
+        self.assertEqual(
+            [("ORDER-1", "DELIVERY_DELAY"), ("ORDER-1", "ORDER_NOT_FOUND"), ("ORDER-1", "DELIVERY_DELAY")],
+            self.agent_queue.escalations,
+        )
+        self.assertEqual(1, client.stats["deduplicated"])
+
+    def test_full_queue_falls_back_to_inline_sending(self):
+        sending, release = threading.Event(), threading.Event()
+
+        def slow_first_batch(batch):
+            if batch[0][0] == "ORDER-0":
+                sending.set()
+                release.wait(1)
+
+        target = Mock(spec=EscalationClient)
+        target.escalate_many.side_effect = slow_first_batch
+        client = self.buffered(target, max_queue=1, flush_interval=0)
+
+        client.escalate("ORDER-0", reason="DELIVERY_DELAY")  # the worker is stuck sending this one
+        self.assertTrue(sending.wait(1))
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")  # fills the queue
+        client.escalate("ORDER-2", reason="DELIVERY_DELAY")  # queue full → sent inline
+        release.set()
+        client.close()
+
+        self.assertEqual(1, client.stats["inline"])
+        sent = [item for call in target.escalate_many.call_args_list for item in call.args[0]]
+        self.assertCountEqual(
+            [("ORDER-0", "DELIVERY_DELAY"), ("ORDER-1", "DELIVERY_DELAY"), ("ORDER-2", "DELIVERY_DELAY")], sent
+        )
+
+    def test_close_drains_then_rejects_new_escalations(self):
+        target = Mock(spec=EscalationClient)
+        client = self.buffered(target, flush_interval=10)  # would otherwise wait for more
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")
+        client.escalate("ORDER-2", reason="ORDER_NOT_FOUND")
+
+        client.close()
+
+        target.escalate_many.assert_called_once_with([("ORDER-1", "DELIVERY_DELAY"), ("ORDER-2", "ORDER_NOT_FOUND")])
+        target.escalate.assert_not_called()
+        with self.assertRaises(RuntimeError):
+            client.escalate("ORDER-3", reason="DELIVERY_DELAY")
+
+    def test_close_racing_escalate_never_loses_an_accepted_escalation(self):
+        for _ in range(20):
+            target = FakeAgentQueue()
+            client = BufferedEscalationClient(target, flush_interval=0)
+            accepted, start = [], threading.Barrier(5)
+
+            def escalate_many(worker):
+                start.wait()
+                for i in range(50):
+                    try:
+                        client.escalate(f"ORDER-{worker}-{i}", reason="DELIVERY_DELAY")
+                    except RuntimeError:
+                        return
+                    accepted.append((f"ORDER-{worker}-{i}", "DELIVERY_DELAY"))
+
+            threads = [threading.Thread(target=escalate_many, args=(w,)) for w in range(4)]
+            for thread in threads:
+                thread.start()
+            start.wait()
+            deadline = time.monotonic() + 1
+            while len(accepted) < 20 and time.monotonic() < deadline:
+                time.sleep(0.0001)
+            client.close(1)  # while the others are still escalating
+            for thread in threads:
+                thread.join(1)
+
+            self.assertFalse(client._worker.is_alive())
+            self.assertCountEqual(accepted, target.escalations)
+            drained = threading.Thread(target=client.drain, daemon=True)
+            drained.start()
+            drained.join(1)
+            self.assertFalse(drained.is_alive(), "drain() hung after close()")
+
+    def test_failed_batch_is_not_deduplicated_later(self):
+        self.agent_queue.fail = True
+        client = self.buffered()
+        with self.assertLogs(__name__, level="ERROR"):
+            client.escalate("ORDER-1", reason="DELIVERY_DELAY")
+            client.drain()
+        self.assertEqual(1, client.stats["failed"])
+
+        self.agent_queue.fail = False
+        client.escalate("ORDER-1", reason="DELIVERY_DELAY")
+        client.drain()
+        self.assertEqual([("ORDER-1", "DELIVERY_DELAY")], self.agent_queue.escalations)
+
+
+class TestCachingOrderService(unittest.TestCase):
+
+    def setUp(self):
+        self.today = datetime.date(2025, 5, 1)
+        self.now = 0.0
+        # wraps= keeps the stub's answers while counting backend calls
+        self.backend = Mock(wraps=StubOrderService({
+            "ORDER-P": Order("ORDER-P", "PROCESSING", self.today),
+            "ORDER-S": Order("ORDER-S", "SHIPPED", self.today),
+        }))
+
+    def cache(self, **options):
+        return CachingOrderService(self.backend, clock=lambda: self.now, **options)
+
+    def test_ttl_depends_on_status(self):
+        cache = self.cache()
+        cache.get_order("ORDER-P")
+        cache.get_order("ORDER-S")
+
+        self.now = 29
+        cache.get_order("ORDER-P")
+        cache.get_order("ORDER-S")
+        self.assertEqual(2, self.backend.get_order.call_count)
+
+        self.now = 31  # PROCESSING expired, SHIPPED still fresh
+        cache.get_order("ORDER-P")
+        cache.get_order("ORDER-S")
+        self.assertEqual(3, self.backend.get_order.call_count)
+        self.assertEqual(1, cache.stats["expired"])
+
+    def test_not_found_is_cached_briefly(self):
+        cache = self.cache(not_found_ttl=5)
+
+        for _ in range(3):
+            with self.assertRaises(OrderNotFound):
+                cache.get_order("ORDER-404")
+        self.assertEqual(1, self.backend.get_order.call_count)
+        self.assertEqual(2, cache.stats["negative_hits"])
+
+        self.now = 6
+        with self.assertRaises(OrderNotFound):
+            cache.get_order("ORDER-404")
+        self.assertEqual(2, self.backend.get_order.call_count)
+
+    def test_least_recently_used_is_evicted(self):
+        cache = self.cache(max_entries=2)
+        cache.get_order("ORDER-P")
+        cache.get_order("ORDER-S")
+        cache.get_order("ORDER-P")  # ORDER-S is now the least recently used
+        with self.assertRaises(OrderNotFound):
+            cache.get_order("ORDER-404")
+
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, cache.stats["evictions"])
+        cache.get_order("ORDER-P")
+        cache.get_order("ORDER-S")
+        self.assertEqual(["ORDER-P", "ORDER-S", "ORDER-404", "ORDER-S"],
+                         [call.args[0] for call in self.backend.get_order.call_args_list])
+
+    def test_concurrent_misses_make_one_backend_call(self):
+        release = threading.Event()
+        stub = StubOrderService({"ORDER-P": Order("ORDER-P", "PROCESSING", self.today)})
+
+        def slow_get_order(order_id):
+            release.wait(1)
+            return stub.get_order(order_id)
+
+        backend = Mock(spec=OrderService)
+        backend.get_order.side_effect = slow_get_order
+        cache = CachingOrderService(backend)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(cache.get_order("ORDER-P"))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 1
+        while cache.stats["coalesced"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join(1)
+
+        backend.get_order.assert_called_once_with("ORDER-P")
+        self.assertEqual(8, len(results))
+        self.assertTrue(all(order is results[0] for order in results))
+
+    def slow_backend(self):
+        """A spec'd backend whose calls block until the returned event is set."""
+        release = threading.Event()
+        stub = StubOrderService({
+            "ORDER-P": Order("ORDER-P", "PROCESSING", self.today),
+            "ORDER-S": Order("ORDER-S", "SHIPPED", self.today),
+        })
+        backend = Mock(spec=OrderService)
+        backend.get_order.side_effect = lambda order_id: release.wait(1) and stub.get_order(order_id)
+        backend.get_orders.side_effect = lambda order_ids: release.wait(1) and stub.get_orders(order_ids)
+        return backend, release
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 1
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def test_concurrent_batches_fetch_each_id_once(self):
+        backend, release = self.slow_backend()
+        cache = CachingOrderService(backend)
+        results = {}
+        first = threading.Thread(target=lambda: results.update(a=cache.get_orders(["ORDER-P", "ORDER-404"])))
+        first.start()
+        self.wait_for(lambda: backend.get_orders.called)
+        second = threading.Thread(target=lambda: results.update(b=cache.get_orders(["ORDER-P", "ORDER-S", "ORDER-404"])))
+        single = threading.Thread(target=lambda: results.update(c=cache.get_order("ORDER-S")))
+        second.start()
+        self.wait_for(lambda: backend.get_orders.call_count == 2)
+        single.start()
+        self.wait_for(lambda: cache.stats["coalesced"] == 3)
+        release.set()
+        for thread in (first, second, single):
+            thread.join(1)
+
+        self.assertEqual(
+            [["ORDER-P", "ORDER-404"], ["ORDER-S"]],
+            [call.args[0] for call in backend.get_orders.call_args_list],
+        )
+        backend.get_order.assert_not_called()
+        self.assertEqual(["ORDER-P"], sorted(results["a"]))
+        self.assertEqual(["ORDER-P", "ORDER-S"], sorted(results["b"]))
+        self.assertEqual("ORDER-S", results["c"].order_id)
+
+    def test_fetch_in_flight_during_invalidate_is_not_cached(self):
+        backend, release = self.slow_backend()
+        cache = CachingOrderService(backend)
+        results = []
+        fetch = threading.Thread(target=lambda: results.append(cache.get_order("ORDER-P")))
+        fetch.start()
+        self.wait_for(lambda: backend.get_order.called)
+
+        cache.invalidate("ORDER-P")  # e.g. the order just changed status
+        release.set()
+        fetch.join(1)
+
+        self.assertEqual("ORDER-P", results[0].order_id)  # the caller still gets its answer
+        self.assertEqual(0, len(cache))
+        cache.get_order("ORDER-P")
+        self.assertEqual(2, backend.get_order.call_count)
+
+    def test_backend_errors_are_not_cached(self):
+        backend = Mock(spec=OrderService)
+        backend.get_order.side_effect = [TimeoutError("backend down"), Order("ORDER-P", "PROCESSING", self.today)]
+        cache = CachingOrderService(backend)
+
+        with self.assertRaises(TimeoutError):
+            cache.get_order("ORDER-P")
+        self.assertEqual("ORDER-P", cache.get_order("ORDER-P").order_id)
+
+    def test_batch_lookups_only_fetch_what_is_not_cached(self):
+        cache = self.cache()
+        cache.get_order("ORDER-P")
+
+        orders = cache.get_orders(["ORDER-P", "ORDER-S", "ORDER-404"])
+
+        self.assertEqual(["ORDER-P", "ORDER-S"], sorted(orders))
+        self.backend.get_orders.assert_called_once_with(["ORDER-S", "ORDER-404"])
+        self.assertEqual(["ORDER-P", "ORDER-S"], sorted(cache.get_orders(["ORDER-P", "ORDER-S", "ORDER-404"])))
+        self.backend.get_orders.assert_called_once()
+
+    def test_in_front_of_the_handler(self):
+        cache = self.cache()
+        handler = OrderStatusHandler(cache, Mock(spec=EscalationClient))
+
+        first = handler.handle_where_is_my_order("ORDER-S", today=self.today)
+        again = handler.handle_where_is_my_order("ORDER-S", today=self.today)
+
+        self.assertEqual(first, again)
+        self.backend.get_order.assert_called_once_with("ORDER-S")
+
+
 if __name__ == "__main__":
     unittest.main()